@@ -4,46 +4,55 @@ Example demonstrating text-based input for PitchLense MCP Package.
 
 This example shows how to use the MCP tools with a single text string containing
 all startup information instead of structured data.
+
+Install the package first (from the repository root: `pip install -e .`).
 """
 
 import os
 import json
-from datetime import datetime
-from pitchlense_mcp import (
-    CustomerRiskMCPTool,
-    FinancialRiskMCPTool,
-    MarketRiskMCPTool,
-    TeamRiskMCPTool,
-    OperationalRiskMCPTool,
-    CompetitiveRiskMCPTool,
-    ExitRiskMCPTool,
-    LegalRiskMCPTool,
-    ProductRiskMCPTool,
-    PeerBenchmarkMCPTool,
-    GeminiLLM,
-    SerpNewsMCPTool
-)
-from pitchlense_mcp.core.mock_client import MockLLM
+import re
+import importlib
+import asyncio
+from datetime import datetime, timezone
+try:
+    from pitchlense_mcp import (
+        BatchedRiskAnalyzer,
+        CachedLLM,
+        ResponseCache,
+        SerpNewsMCPTool
+    )
+except ImportError as e:  # pragma: no cover
+    raise SystemExit(f"pitchlense_mcp is not installed ({e}). Run `pip install -e .` from the repository root.")
 from pitchlense_mcp.utils.json_extractor import extract_json_from_response
+from pitchlense_mcp.utils.async_utils import run_in_thread
 
-def main():
-    """Main example function."""
-    print("🚀 PitchLense MCP - Text Input Example")
-    print("=" * 50)
-    
-    # Check for API key and use appropriate client
-    use_mock = not os.getenv("GEMINI_API_KEY")
-    if use_mock:
-        print("⚠️  Warning: GEMINI_API_KEY environment variable not set")
-        print("   Using mock LLM client for demonstration purposes")
-        print("   Set it with: export GEMINI_API_KEY='your_api_key_here' for real analysis")
-        print()
-    else:
-        print("✅ GEMINI_API_KEY found, using real Gemini LLM client")
-        print()
-    
-    # Example startup information as a single text string
-    startup_info = """
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+# (display name, module, class) for each MCP tool; classes are imported on use
+TOOL_SPECS = [
+    ("Customer Risk Analysis", "pitchlense_mcp.analyzers.customer_risk", "CustomerRiskMCPTool"),
+    ("Financial Risk Analysis", "pitchlense_mcp.analyzers.financial_risk", "FinancialRiskMCPTool"),
+    ("Market Risk Analysis", "pitchlense_mcp.analyzers.market_risk", "MarketRiskMCPTool"),
+    ("Team Risk Analysis", "pitchlense_mcp.analyzers.team_risk", "TeamRiskMCPTool"),
+    ("Operational Risk Analysis", "pitchlense_mcp.analyzers.operational_risk", "OperationalRiskMCPTool"),
+    ("Competitive Risk Analysis", "pitchlense_mcp.analyzers.competitive_risk", "CompetitiveRiskMCPTool"),
+    ("Exit Risk Analysis", "pitchlense_mcp.analyzers.exit_risk", "ExitRiskMCPTool"),
+    ("Legal Risk Analysis", "pitchlense_mcp.analyzers.legal_risk", "LegalRiskMCPTool"),
+    ("Product Risk Analysis", "pitchlense_mcp.analyzers.product_risk", "ProductRiskMCPTool"),
+    ("Peer Benchmarking", "pitchlense_mcp.analyzers.peer_benchmark", "PeerBenchmarkMCPTool"),
+]
+
+# Tools with their own prompt/output format that are not batched
+UNBATCHED_TOOLS = {"Peer Benchmarking"}
+
+# "Company: ..." / "Industry: ..." lines used by the metadata fallback
+_META_RE = re.compile(r"^\s*(Company|Industry)\s*:\s*(.+?)\s*$", re.IGNORECASE | re.MULTILINE)
+
+# Example startup information as a single text string, built once at import
+STARTUP_INFO = """
     Company: TechFlow Solutions
     Industry: SaaS/Productivity Software
     Founded: 2022
@@ -108,26 +117,157 @@ def main():
     - International expansion to European markets
     - Additional funding round planned for Q3 2024
     """
+
+def fetch_news(startup_info, llm_client):
+    """Extract company metadata and fetch related Google News.
+    
+    Only depends on the startup text, so it can run alongside the risk analyses.
+    
+    Returns:
+        Tuple of (extracted_metadata, news_query, news_fetch)
+    """
+    # Prepare Google News query: cheap regex pass over "Company:"/"Industry:" lines first
+    print("📰 Preparing news query...")
+    matches = {}
+    for key, value in _META_RE.findall(startup_info):
+        matches.setdefault(key.lower(), value)
+    company_name = matches.get("company", "")
+    domain = matches.get("industry", "")
+    extracted_metadata = {
+        "company_name": company_name,
+        "domain": domain,
+        "area": domain,
+    }
+
+    # Only ask the LLM (company_name, domain, area) when the text isn't labelled
+    if not company_name or not domain:
+        try:
+            system_msg = "You extract concise company metadata. Respond with JSON only."
+            user_msg = (
+                "From the following startup description, extract the following fields strictly as JSON: "
+                "{\"company_name\": string, \"domain\": short industry/domain, \"area\": product area/category}.\n"
+                "Keep values short (1-6 words). If unknown, use an empty string.\n"
+                "Text:\n" + startup_info
+            )
+            llm_resp = llm_client.predict(system_message=system_msg, user_message=user_msg)
+            llm_metadata = extract_json_from_response(llm_resp.get("response", ""))
+            if llm_metadata and isinstance(llm_metadata, dict):
+                extracted_metadata = llm_metadata
+        except Exception:
+            pass
+
+    # Build news query and fetch via SerpAPI tool
+    news_query_terms = [extracted_metadata.get("company_name", "").strip(), extracted_metadata.get("domain", "").strip(), extracted_metadata.get("area", "").strip()]
+    news_query = " ".join([t for t in news_query_terms if t]) or "startup funding tech news"
+    # The tool is only constructed (on this worker thread) when the cache misses
+    news_cache = ResponseCache("serp_news")
+    news_fetch = news_cache.get_or_call(
+        ResponseCache.make_key(news_query, 10),
+        lambda: SerpNewsMCPTool().fetch_google_news(news_query, num_results=10),
+        should_cache=lambda result: not result.get("error"),
+    )
+    return extracted_metadata, news_query, news_fetch
+
+def save_results(results, path):
+    """Write results as indented UTF-8 JSON, using orjson when installed."""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        # json.dump streams encoder chunks to the file rather than building one string
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+
+async def run_analyses(mcp_tools, llm_client, startup_info):
+    """Run all analyses and the news fetch concurrently, printing results as they finish.
+    
+    Peer benchmarking uses its own prompt/output format; every other category
+    is fused into a single batched LLM call.
+    
+    Returns:
+        Tuple of (analysis results by name, fetch_news() result)
+    """
+    batched_names = [name for name in mcp_tools if name not in UNBATCHED_TOOLS]
+    batched_analyzer = BatchedRiskAnalyzer(
+        llm_client, {name: mcp_tools[name].analyzer for name in batched_names}
+    )
+    
+    async def analyze_one(name):
+        return {name: await mcp_tools[name].analyzer.aanalyze(startup_info)}
+    
+    async def guarded(names, coro):
+        # Report a failed task against every analysis it covered
+        try:
+            return await coro
+        except Exception as e:
+            return {name: {"error": str(e)} for name in names}
+    
+    # fetch_news is synchronous (SerpAPI client), so it runs in a worker thread
+    news_task = asyncio.ensure_future(run_in_thread(fetch_news, startup_info, llm_client))
+    analysis_tasks = [guarded(batched_names, batched_analyzer.aanalyze(startup_info))]
+    analysis_tasks += [
+        guarded([name], analyze_one(name)) for name in mcp_tools if name in UNBATCHED_TOOLS
+    ]
+    
+    all_analysis_results = {}
+    for next_done in asyncio.as_completed(analysis_tasks):
+        results = await next_done
+        
+        # Build the summary for the whole task and write it in one call
+        lines = []
+        for analysis_name, result in results.items():
+            result = result or {"error": "No result returned"}
+            lines.append(f"🔍 {analysis_name}:")
+            
+            # Store the result
+            all_analysis_results[analysis_name] = result
+            
+            # Display summary
+            if "error" in result and "summary" not in result:
+                lines.append(f"   ❌ Error in {analysis_name}: {result['error']}")
+            else:
+                lines.append(f"   Overall Risk Level: {result.get('overall_risk_level', 'Unknown')}")
+                lines.append(f"   Category Score: {result.get('category_score', 'N/A')}/10")
+                lines.append(f"   Summary: {result.get('summary', 'No summary available')[:100]}...")
+            
+            lines.append("")
+        print("\n".join(lines))
+    
+    return all_analysis_results, await news_task
+
+def main():
+    """Main example function."""
+    print("🚀 PitchLense MCP - Text Input Example")
+    print("=" * 50)
+    
+    # Check for API key and use appropriate client
+    use_mock = not os.getenv("GEMINI_API_KEY")
+    if use_mock:
+        print("⚠️  Warning: GEMINI_API_KEY environment variable not set")
+        print("   Using mock LLM client for demonstration purposes")
+        print("   Set it with: export GEMINI_API_KEY='your_api_key_here' for real analysis")
+        print()
+    else:
+        print("✅ GEMINI_API_KEY found, using real Gemini LLM client")
+        print()
+    
+    # Example startup information as a single text string
+    startup_info = STARTUP_INFO
     
     # Initialize all MCP tools
     mcp_tools = {
-        "Customer Risk Analysis": CustomerRiskMCPTool(),
-        "Financial Risk Analysis": FinancialRiskMCPTool(),
-        "Market Risk Analysis": MarketRiskMCPTool(),
-        "Team Risk Analysis": TeamRiskMCPTool(),
-        "Operational Risk Analysis": OperationalRiskMCPTool(),
-        "Competitive Risk Analysis": CompetitiveRiskMCPTool(),
-        "Exit Risk Analysis": ExitRiskMCPTool(),
-        "Legal Risk Analysis": LegalRiskMCPTool(),
-        "Product Risk Analysis": ProductRiskMCPTool(),
-        "Peer Benchmarking": PeerBenchmarkMCPTool()
+        name: getattr(importlib.import_module(module), class_name)()
+        for name, module, class_name in TOOL_SPECS
     }
     
-    # Set up LLM client (mock or real)
+    # Set up LLM client (mock or real); only the selected client's SDK is imported
     if use_mock:
+        from pitchlense_mcp.core.mock_client import MockLLM
         llm_client = MockLLM()
     else:
-        llm_client = GeminiLLM()
+        from pitchlense_mcp import GeminiLLM
+        # Cache responses on disk so reruns with the same input skip the API
+        llm_client = CachedLLM(GeminiLLM())
     
     # Set the client for all tools
     for tool_name, tool in mcp_tools.items():
@@ -136,93 +276,18 @@ def main():
     print("📊 Analyzing startup risks with text input...")
     print()
     
-    # Dictionary to store all analysis results
-    all_analysis_results = {}
+    # The batched analysis, peer benchmarking and the news fetch are independent,
+    # network-bound calls, so they are awaited concurrently on one event loop.
+    all_analysis_results, (extracted_metadata, news_query, news_fetch) = asyncio.run(
+        run_analyses(mcp_tools, llm_client, startup_info)
+    )
     
-    # Analyze with all MCP tools
-    for analysis_name, tool in mcp_tools.items():
-        print(f"🔍 {analysis_name}:")
-        try:
-            # Get the appropriate analysis method based on tool type
-            if hasattr(tool, 'analyze_customer_risks'):
-                result = tool.analyze_customer_risks(startup_info)
-            elif hasattr(tool, 'analyze_financial_risks'):
-                result = tool.analyze_financial_risks(startup_info)
-            elif hasattr(tool, 'analyze_market_risks'):
-                result = tool.analyze_market_risks(startup_info)
-            elif hasattr(tool, 'analyze_team_risks'):
-                result = tool.analyze_team_risks(startup_info)
-            elif hasattr(tool, 'analyze_operational_risks'):
-                result = tool.analyze_operational_risks(startup_info)
-            elif hasattr(tool, 'analyze_competitive_risks'):
-                result = tool.analyze_competitive_risks(startup_info)
-            elif hasattr(tool, 'analyze_exit_risks'):
-                result = tool.analyze_exit_risks(startup_info)
-            elif hasattr(tool, 'analyze_legal_risks'):
-                result = tool.analyze_legal_risks(startup_info)
-            elif hasattr(tool, 'analyze_product_risks'):
-                result = tool.analyze_product_risks(startup_info)
-            else:
-                print(f"   ❌ No analysis method found for {analysis_name}")
-                continue
-            
-            # Store the result
-            all_analysis_results[analysis_name] = result
-            
-            # Display summary
-            print(f"   Overall Risk Level: {result.get('overall_risk_level', 'Unknown')}")
-            print(f"   Category Score: {result.get('category_score', 'N/A')}/10")
-            print(f"   Summary: {result.get('summary', 'No summary available')[:100]}...")
-            
-        except Exception as e:
-            print(f"   ❌ Error in {analysis_name}: {e}")
-            all_analysis_results[analysis_name] = {"error": str(e)}
-        
-        print()
+    # Keep the saved results in the same order as the tools, not completion order
+    all_analysis_results = {
+        name: all_analysis_results[name] for name in mcp_tools if name in all_analysis_results
+    }
     
-    # Prepare Google News query via LLM extraction (company_name, domain, area)
-    print("📰 Preparing news query via LLM...")
-    extracted_metadata = None
-    try:
-        system_msg = "You extract concise company metadata. Respond with JSON only."
-        user_msg = (
-            "From the following startup description, extract the following fields strictly as JSON: "
-            "{\"company_name\": string, \"domain\": short industry/domain, \"area\": product area/category}.\n"
-            "Keep values short (1-6 words). If unknown, use an empty string.\n"
-            "Text:\n" + startup_info
-        )
-        llm_resp = llm_client.predict(system_message=system_msg, user_message=user_msg)
-        extracted_metadata = extract_json_from_response(llm_resp.get("response", ""))
-    except Exception:
-        extracted_metadata = None
-
-    # Fallback extraction for mock/no-parse
-    if not extracted_metadata or not isinstance(extracted_metadata, dict):
-        # Simple heuristics from the text blob
-        company_name = ""
-        domain = ""
-        area = ""
-        try:
-            for line in startup_info.splitlines():
-                line = line.strip()
-                if line.lower().startswith("company:") and not company_name:
-                    company_name = line.split(":", 1)[1].strip()
-                if line.lower().startswith("industry:") and not domain:
-                    domain = line.split(":", 1)[1].strip()
-            area = domain
-        except Exception:
-            pass
-        extracted_metadata = {
-            "company_name": company_name or "",
-            "domain": domain or "",
-            "area": area or "",
-        }
-
-    # Build news query and fetch via SerpAPI tool
-    news_query_terms = [extracted_metadata.get("company_name", "").strip(), extracted_metadata.get("domain", "").strip(), extracted_metadata.get("area", "").strip()]
-    news_query = " ".join([t for t in news_query_terms if t]) or "startup funding tech news"
-    serp_news_tool = SerpNewsMCPTool()
-    news_fetch = serp_news_tool.fetch_google_news(news_query, num_results=10)
+    # Report the news fetched alongside the analyses
     if news_fetch.get("error"):
         print(f"   ❌ News fetch error: {news_fetch.get('error')}")
     else:
@@ -234,22 +299,29 @@ def main():
     print()
 
     # Compute radar/spider chart data (normalized 0-10) from category scores
-    radar_data = {}
+    radar_dimensions = []
+    radar_scores = []
     for name, result in all_analysis_results.items():
-        if isinstance(result, dict) and "category_score" in result:
-            radar_data[name] = result.get("category_score")
+        score = result.get("category_score") if isinstance(result, dict) else None
+        if score is not None and "error" not in result:
+            radar_dimensions.append(name)
+            radar_scores.append(score)
 
+    # One timestamp for both the payload and the output filename
+    run_timestamp = datetime.now(timezone.utc)
+    analysis_timestamp = run_timestamp.isoformat(timespec="seconds").replace("+00:00", "Z")
+    
     # Create comprehensive results dictionary
     comprehensive_results = {
         "startup_analysis": {
             "company_name": "TechFlow Solutions",
-            "analysis_timestamp": datetime.now().isoformat(),
+            "analysis_timestamp": analysis_timestamp,
             "llm_client_type": "mock" if use_mock else "gemini",
             "total_analyses": len(all_analysis_results),
             "analyses": all_analysis_results,
             "radar_chart": {
-                "dimensions": list(radar_data.keys()),
-                "scores": [radar_data[k] for k in radar_data.keys()],
+                "dimensions": radar_dimensions,
+                "scores": radar_scores,
                 "scale": 10
             }
         },
@@ -262,9 +334,8 @@ def main():
     }
     
     # Save results to JSON file
-    output_filename = f"startup_risk_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-    with open(output_filename, 'w', encoding='utf-8') as f:
-        json.dump(comprehensive_results, f, indent=2, ensure_ascii=False)
+    output_filename = f"startup_risk_analysis_{run_timestamp.strftime('%Y%m%d_%H%M%S')}.json"
+    save_results(comprehensive_results, output_filename)
     
     print("✅ Comprehensive analysis completed!")
     print(f"📁 Results saved to: {output_filename}")
@@ -10,11 +10,14 @@ Usage (Cloud Functions):
 POST JSON body shape:
 {
   "company_name": "Sia",
+  "domain": "Fintech",               # optional; with company_name and/or area, skips metadata extraction
+  "area": "Invoice automation",      # optional
   "uploads": [{'filetype': 'pitch deck', 'filename': 'Invoice-Aug.pdf', 'file_extension': 'pdf', 'filepath': 'gs://pitchlense-object-storage/uploads/a181cd09-095e-49d6-bb6f-4ee7b01b8678/Invoice-Aug.pdf'}],
   "startup_text": "<all startup info as a single organized text string>",
   "use_mock": false,                 # optional; default: auto based on GEMINI_API_KEY
   "categories": ["Market Risk Analysis", ...],  # optional; subset of analyses to run
-  "destination_gcs": "gs://bucket/path/to/output.json"  # optional; write results to GCS
+  "destination_gcs": "gs://bucket/path/to/output.json",  # optional; write results to GCS
+  "pretty": false                    # optional; indent the JSON output (GCS file and response body)
 }
 
 {
@@ -33,8 +36,11 @@ Response:
 }
 
 Notes:
-  - Analyses are executed in parallel using a thread pool. This is appropriate because
-    the workload is dominated by network-bound LLM/API calls rather than CPU-bound work.
+  - The request runs as one coroutine on a per-instance asyncio event loop; analyses are
+    executed concurrently (asyncio.gather over the Gemini async client) and blocking SDK
+    calls run in worker threads. This is appropriate because the workload is dominated by
+    network-bound LLM/API calls rather than CPU-bound work. The loop outlives requests so
+    pooled async HTTP clients keep their connections warm.
   - If GEMINI_API_KEY is not set or use_mock=true, a mock LLM client is used.
 
 in GCP Cloud Function add below in the requirements.txt 
@@ -45,16 +51,31 @@ py-key-value-aio==0.2.4
 flask
 google-cloud-storage
 serpapi
+redis  # optional, enables the shared exact-match analysis cache (REDIS_URL)
+orjson  # optional, faster request/response (de)serialization
 
 """
 import functions_framework
 
 import os
+import re
+import gzip
 import json
+import time
+import hashlib
+import asyncio
+import inspect
+import threading
 from datetime import datetime, timezone
+from collections import OrderedDict
 from urllib.parse import urlparse
-from typing import Any, Dict, Callable, Tuple
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, Callable, Iterator, List, Optional, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
+
+try:
+    import orjson  # optional C-accelerated JSON
+except ImportError:  # pragma: no cover - falls back to stdlib json
+    orjson = None
 
 # Cloud Functions provides a Flask-like request object
 try:
@@ -63,174 +84,1072 @@ try:
 except Exception:  # pragma: no cover - for local static analysis
     Request = Any  # type: ignore
 
-from pitchlense_mcp import (
-    CustomerRiskMCPTool,
-    FinancialRiskMCPTool,
-    MarketRiskMCPTool,
-    TeamRiskMCPTool,
-    OperationalRiskMCPTool,
-    CompetitiveRiskMCPTool,
-    ExitRiskMCPTool,
-    LegalRiskMCPTool,
-    ProductRiskMCPTool,
-    PeerBenchmarkMCPTool,
-    SocialCoverageRiskMCPTool,
-    LVAnalysisMCPTool,
-    GeminiLLM,
-    SerpNewsMCPTool,
-    SerpPdfSearchMCPTool,
-    PerplexityMCPTool,
-    UploadExtractor,
-    KnowledgeGraphMCPTool,
-    LinkedInAnalyzerMCPTool,
-    GoogleContentModerationMCPTool,
-    SocialMediaResearchMCPTool
-)
+# The package exports resolve lazily (PEP 562), so tool modules and the Gemini
+# SDK are only imported when a request first needs them. core.base (pydantic
+# models) is imported by the functions that use it for the same reason
+import pitchlense_mcp
 from pitchlense_mcp.core.mock_client import MockLLM
+from pitchlense_mcp.core.router import AnalysisRouter
+from pitchlense_mcp.core.semantic_cache import SemanticCache
+from pitchlense_mcp.utils.async_utils import run_in_thread
 from pitchlense_mcp.utils.json_extractor import extract_json_from_response
 from pitchlense_mcp.utils.token_tracker import token_tracker
 
 
-def _build_tools_and_methods() -> Dict[str, Tuple[Any, str]]:
+def _json_dumps(payload: Any, pretty: bool = False) -> bytes | str:
+    """Serialize payload with orjson when installed, else the stdlib json module."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        try:
+            return orjson.dumps(payload, option=option)
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; stdlib handles them
+    if pretty:
+        return json.dumps(payload, ensure_ascii=False, indent=2)
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+
+
+def _json_loads(data: bytes | str) -> Any:
+    """Parse JSON with orjson when installed, else the stdlib json module."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Fixed error responses, serialized once at import
+_MISSING_INPUT_RESPONSE = (
+    _json_dumps({"error": "Missing 'startup_text' or 'uploads' in request body"}),
+    400,
+    {"Content-Type": "application/json"},
+)
+_SYNTHESIS_FAILED_RESPONSE = (
+    _json_dumps({"error": "Failed to synthesize startup_text from uploads"}),
+    400,
+    {"Content-Type": "application/json"},
+)
+
+
+def _max_startup_chars() -> int:
+    """Largest accepted startup_text (MCP_MAX_STARTUP_CHARS, default 200,000 characters)."""
+    return int(os.getenv("MCP_MAX_STARTUP_CHARS", "200000"))
+
+
+# Analysis name -> (MCP tool class exported by pitchlense_mcp, analysis method name)
+_TOOL_SPECS: Dict[str, Tuple[str, str]] = {
+    "Customer Risk Analysis": ("CustomerRiskMCPTool", "analyze_customer_risks"),
+    "Financial Risk Analysis": ("FinancialRiskMCPTool", "analyze_financial_risks"),
+    "Market Risk Analysis": ("MarketRiskMCPTool", "analyze_market_risks"),
+    "Team Risk Analysis": ("TeamRiskMCPTool", "analyze_team_risks"),
+    "Operational Risk Analysis": ("OperationalRiskMCPTool", "analyze_operational_risks"),
+    "Competitive Risk Analysis": ("CompetitiveRiskMCPTool", "analyze_competitive_risks"),
+    "Exit Risk Analysis": ("ExitRiskMCPTool", "analyze_exit_risks"),
+    "Legal Risk Analysis": ("LegalRiskMCPTool", "analyze_legal_risks"),
+    "Product Risk Analysis": ("ProductRiskMCPTool", "analyze_product_risks"),
+    "Social Coverage Risk Analysis": ("SocialCoverageRiskMCPTool", "analyze_social_coverage_risks"),
+    "Peer Benchmarking": ("PeerBenchmarkMCPTool", "analyze_peer_benchmark"),
+    "LV-Analysis": ("LVAnalysisMCPTool", "analyze_lv_business_note"),
+}
+
+
+def _build_tools_and_methods(names: Optional[List[str]] = None) -> Dict[str, Tuple[Any, str]]:
     """Create MCP tools and map them to their analysis method names.
 
+    Args:
+        names: Analysis names to create tools for (default: all of them)
+
     Returns:
         Mapping of human-readable analysis name to (tool instance, method name).
     """
-    tools: Dict[str, Tuple[Any, str]] = {
-        "Customer Risk Analysis": (CustomerRiskMCPTool(), "analyze_customer_risks"),
-        "Financial Risk Analysis": (FinancialRiskMCPTool(), "analyze_financial_risks"),
-        "Market Risk Analysis": (MarketRiskMCPTool(), "analyze_market_risks"),
-        "Team Risk Analysis": (TeamRiskMCPTool(), "analyze_team_risks"),
-        "Operational Risk Analysis": (OperationalRiskMCPTool(), "analyze_operational_risks"),
-        "Competitive Risk Analysis": (CompetitiveRiskMCPTool(), "analyze_competitive_risks"),
-        "Exit Risk Analysis": (ExitRiskMCPTool(), "analyze_exit_risks"),
-        "Legal Risk Analysis": (LegalRiskMCPTool(), "analyze_legal_risks"),
-        "Product Risk Analysis": (ProductRiskMCPTool(), "analyze_product_risks"),
-        "Social Coverage Risk Analysis": (SocialCoverageRiskMCPTool(), "analyze_social_coverage_risks"),
-        "Peer Benchmarking": (PeerBenchmarkMCPTool(), "analyze_peer_benchmark"),
-        "LV-Analysis": (LVAnalysisMCPTool(), "analyze_lv_business_note"),
-    }
+    selected = list(_TOOL_SPECS) if names is None else names
+    tools: Dict[str, Tuple[Any, str]] = {}
+    for name in selected:
+        class_name, method_name = _TOOL_SPECS[name]
+        tools[name] = (getattr(pitchlense_mcp, class_name)(), method_name)
     return tools
 
 
+# Warm instances reuse LLM clients and tool objects across requests. Tools are
+# kept per client type so concurrent mock and Gemini requests never swap the
+# client out from under each other.
+_singletons_lock = threading.Lock()
+_llm_clients: Dict[str, Any] = {}
+_tools_by_client: Dict[str, Dict[str, Tuple[Any, str]]] = {}
+
+
+def _get_llm_client(llm_type: str):
+    """Return the process-wide LLM client for llm_type ("gemini" or "mock")."""
+    client = _llm_clients.get(llm_type)
+    if client is None:
+        with _singletons_lock:
+            client = _llm_clients.get(llm_type)
+            if client is None:
+                client = pitchlense_mcp.GeminiLLM() if llm_type == "gemini" else MockLLM()
+                _llm_clients[llm_type] = client
+    return client
+
+
+def _get_tools_and_methods(llm_type: str, names: Optional[List[str]] = None) -> Dict[str, Tuple[Any, str]]:
+    """Return process-wide tools for names (default: all) with the llm_type client attached.
+
+    Tools are created on the first request that needs them, so a cold instance
+    serving two categories only imports and builds those two.
+    """
+    wanted = list(_TOOL_SPECS) if names is None else [name for name in _TOOL_SPECS if name in names]
+    tools = _tools_by_client.get(llm_type, {})
+    missing = [name for name in wanted if name not in tools]
+    if missing:
+        llm_client = _get_llm_client(llm_type)
+        with _singletons_lock:
+            tools = _tools_by_client.setdefault(llm_type, {})
+            missing = [name for name in wanted if name not in tools]
+            for name, (tool, method_name) in _build_tools_and_methods(missing).items():
+                try:
+                    tool.set_llm_client(llm_client)
+                except Exception:
+                    pass
+                tools[name] = (tool, method_name)
+    return {name: tools[name] for name in wanted}
+
+
+# Search/enrichment tools hold no per-request state, so one instance of each serves
+# every request on the instance
+_aux_tools: Dict[str, Any] = {}
+
+
+def _get_aux_tool(class_name: str) -> Any:
+    """Return the process-wide instance of a stateless helper tool (news, PDF search, ...)."""
+    tool = _aux_tools.get(class_name)
+    if tool is None:
+        with _singletons_lock:
+            tool = _aux_tools.get(class_name)
+            if tool is None:
+                tool = _aux_tools[class_name] = getattr(pitchlense_mcp, class_name)()
+    return tool
+
+
 def _select_llm_client(use_mock: bool | None = None):
     """Select LLM client based on environment and input flag."""
     if use_mock is True:
-        return MockLLM(), "mock"
+        return _get_llm_client("mock"), "mock"
     if os.getenv("GEMINI_API_KEY"):
-        return GeminiLLM(), "gemini"
-    return MockLLM(), "mock"
+        return _get_llm_client("gemini"), "gemini"
+    return _get_llm_client("mock"), "mock"
+
+
+class _ExactAnalysisCache:
+    """Exact-match cache of analysis results keyed on sha256(startup_text) + analysis name.
 
+    Uses Redis (shared across instances, one MGET per request, gzip-compressed JSON
+    values) when REDIS_URL is set and the redis package is installed, fronted by a
+    short-lived in-process L1; otherwise only the bounded in-process LRU, with the
+    full entry TTL. Nothing is written to disk, where Cloud Functions would count it
+    against instance memory.
+
+    Environment variables:
+        MCP_EXACT_CACHE: Set to 0 to disable (default enabled)
+        MCP_EXACT_CACHE_TTL: Entry TTL in seconds, Redis or local (default 86400)
+        MCP_EXACT_CACHE_L1_TTL: In-process L1 TTL in front of Redis, in seconds (default 600)
+        REDIS_URL: e.g. redis://10.0.0.3:6379/0 for Memorystore
+    """
+
+    L1_MAX_ENTRIES = 1024
+
+    def __init__(self):
+        self.ttl = int(os.getenv("MCP_EXACT_CACHE_TTL", "86400"))
+        self.l1_ttl = float(os.getenv("MCP_EXACT_CACHE_L1_TTL", "600"))
+        self._l1: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._l1_lock = threading.Lock()
+        self.redis = None
+        redis_url = os.getenv("REDIS_URL", "").strip()
+        if redis_url:
+            try:
+                import redis  # type: ignore
+                self.redis = redis.Redis.from_url(redis_url, socket_timeout=2)
+            except Exception as exc:
+                print(f"[CloudFn] Redis unavailable, using local analysis cache: {exc}")
 
-def _run_parallel_analyses(
+    @staticmethod
+    def text_key(startup_text: str, llm_type: str) -> str:
+        # Whitespace-only differences (re-pasted text, trailing newlines) share an entry
+        normalized = " ".join(startup_text.split())
+        return f"{llm_type}:{hashlib.sha256(normalized.encode('utf-8')).hexdigest()}"
+
+    def _l1_get(self, key: str) -> Optional[Any]:
+        with self._l1_lock:
+            entry = self._l1.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self._l1[key]
+                return None
+            self._l1.move_to_end(key)
+            return entry[1]
+
+    def _l1_put(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        with self._l1_lock:
+            self._l1[key] = (time.monotonic() + (self.l1_ttl if ttl is None else ttl), value)
+            self._l1.move_to_end(key)
+            while len(self._l1) > self.L1_MAX_ENTRIES:
+                self._l1.popitem(last=False)
+
+    @staticmethod
+    def _encode(result: Any) -> bytes:
+        data = _json_dumps(result)
+        return gzip.compress(data if isinstance(data, bytes) else data.encode("utf-8"))
+
+    @staticmethod
+    def _decode(value: bytes) -> Any:
+        # Entries written before compression was added are plain JSON
+        if value[:2] == b"\x1f\x8b":
+            value = gzip.decompress(value)
+        return _json_loads(value)
+
+    def get_many(self, text_key: str, names: List[str]) -> Dict[str, Any]:
+        """Return cached results for the given analysis names (misses omitted)."""
+        if not names:
+            return {}
+        hits: Dict[str, Any] = {}
+        missing = []
+        for name in names:
+            value = self._l1_get(f"{text_key}:{name}")
+            if value is not None:
+                hits[name] = value
+            else:
+                missing.append(name)
+        if self.redis is not None and missing:
+            try:
+                values = self.redis.mget([f"{text_key}:{name}" for name in missing])
+                for name, value in zip(missing, values):
+                    if value:
+                        hits[name] = self._decode(value)
+                        self._l1_put(f"{text_key}:{name}", hits[name])
+            except Exception as exc:
+                print(f"[CloudFn] Redis MGET failed: {exc}")
+        return hits
+
+    def set_many(self, text_key: str, results: Dict[str, Any]) -> None:
+        """Store successful analysis results."""
+        results = {name: r for name, r in results.items() if isinstance(r, dict) and "error" not in r}
+        if not results:
+            return
+        if self.redis is not None:
+            try:
+                pipe = self.redis.pipeline(transaction=False)
+                for name, result in results.items():
+                    pipe.setex(f"{text_key}:{name}", self.ttl, self._encode(result))
+                    self._l1_put(f"{text_key}:{name}", result)
+                pipe.execute()
+                return
+            except Exception as exc:
+                print(f"[CloudFn] Redis SETEX failed: {exc}")
+        for name, result in results.items():
+            self._l1_put(f"{text_key}:{name}", result, ttl=self.ttl)
+
+
+_exact_cache: Optional[_ExactAnalysisCache] = None
+_exact_cache_lock = threading.Lock()
+
+
+def _get_exact_cache() -> Optional[_ExactAnalysisCache]:
+    global _exact_cache
+    if os.getenv("MCP_EXACT_CACHE", "1").lower() in ("0", "false", "no"):
+        return None
+    if _exact_cache is None:
+        with _exact_cache_lock:
+            if _exact_cache is None:
+                _exact_cache = _ExactAnalysisCache()
+    return _exact_cache
+
+
+# Warm instances keep the semantic cache in memory between requests
+_semantic_cache: Optional[SemanticCache] = None
+_semantic_cache_lock = threading.Lock()
+
+
+def _semantic_cache_enabled() -> bool:
+    return os.getenv("MCP_SEMANTIC_CACHE", "").lower() in ("1", "true", "yes")
+
+
+_routers: Dict[str, Optional[AnalysisRouter]] = {}
+_routers_lock = threading.Lock()
+
+
+def _get_router(llm_client: Any, llm_type: str) -> Optional[AnalysisRouter]:
+    """Return the process-wide analysis router, or None when routing is not configured.
+
+    Environment variables:
+        MCP_ROUTER_PROTOTYPES: JSON object mapping analysis name to a list of
+            descriptions of startups that analysis does not apply to
+        MCP_ROUTER_THRESHOLD: Minimum cosine similarity to skip a category (default 0.85)
+    """
+    if llm_type not in _routers:
+        with _routers_lock:
+            if llm_type not in _routers:
+                _routers[llm_type] = _build_router(llm_client)
+    return _routers[llm_type]
+
+
+def _build_router(llm_client: Any) -> Optional[AnalysisRouter]:
+    raw = os.getenv("MCP_ROUTER_PROTOTYPES", "").strip()
+    if not raw or not hasattr(llm_client, "embed"):
+        return None
+    try:
+        prototypes = {
+            name: texts for name, texts in _json_loads(raw).items() if name in _TOOL_SPECS and texts
+        }
+        if prototypes:
+            threshold = float(os.getenv("MCP_ROUTER_THRESHOLD", "0.85"))
+            return AnalysisRouter(llm_client.embed, prototypes, threshold=threshold)
+    except Exception as exc:
+        print(f"[CloudFn] Ignoring invalid MCP_ROUTER_PROTOTYPES: {exc}")
+    return None
+
+
+def _get_semantic_cache() -> SemanticCache:
+    """Return the process-wide semantic cache, loading it from GCS on a cold start.
+
+    Environment variables:
+        MCP_SEMANTIC_CACHE_THRESHOLD: Minimum cosine similarity for a hit (default 0.95)
+        MCP_SEMANTIC_CACHE_GCS: Optional gs:// URI the index is persisted to
+    """
+    global _semantic_cache
+    if _semantic_cache is None:
+        # Concurrent cold requests must share one cache (and one GCS load)
+        with _semantic_cache_lock:
+            if _semantic_cache is None:
+                threshold = float(os.getenv("MCP_SEMANTIC_CACHE_THRESHOLD", "0.95"))
+                cache = SemanticCache(threshold=threshold)
+                gcs_uri = os.getenv("MCP_SEMANTIC_CACHE_GCS", "").strip()
+                if gcs_uri:
+                    try:
+                        cache = SemanticCache.from_dict(_read_json_from_gcs(gcs_uri))
+                        cache.threshold = threshold
+                    except Exception as exc:
+                        print(f"[CloudFn] Semantic cache not loaded from {gcs_uri}: {exc}")
+                _semantic_cache = cache
+    return _semantic_cache
+
+
+# Minimum number of plain risk analyses before they are fused into one LLM call
+_BATCH_MIN_ANALYSES = 3
+
+
+def _batching_enabled() -> bool:
+    # Set MCP_BATCH_ANALYSES=0 to run every analysis as its own LLM call
+    return os.getenv("MCP_BATCH_ANALYSES", "1").lower() not in ("0", "false", "no")
+
+
+def _analysis_timeouts() -> Tuple[float, float]:
+    """(per-analysis, whole fan-out) limits in seconds.
+
+    A stuck LLM call turns into a "timeout" error for its categories while the
+    analyses that did finish are still returned.
+    """
+    return (
+        float(os.getenv("MCP_PER_ANALYSIS_TIMEOUT", "90")),
+        float(os.getenv("MCP_TOTAL_TIMEOUT", "300")),
+    )
+
+
+def _is_batchable(tool: Any) -> bool:
+    """True for tools whose analyzer uses the standard risk request and response format."""
+    from pitchlense_mcp.core.base import BaseRiskAnalyzer
+
+    analyzer = getattr(tool, "analyzer", None)
+    if not isinstance(analyzer, BaseRiskAnalyzer) or analyzer.llm_client is None:
+        return False
+    # Analyzers with a custom prompt or output shape (e.g. Peer Benchmarking) run on their own
+    return (
+        type(analyzer)._build_llm_request is BaseRiskAnalyzer._build_llm_request
+        and type(analyzer)._parse_llm_response is BaseRiskAnalyzer._parse_llm_response
+    )
+
+
+# In-flight analyses keyed by prompt hash. Shared across concurrent requests on
+# this instance so duplicate invocations (e.g. retries) wait on one LLM call.
+_inflight: Dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+
+
+async def _run_analysis(tool: Any, method_name: str, startup_text: str) -> Dict[str, Any]:
+    """Run one analysis on the event loop.
+
+    Tools backed by a BaseRiskAnalyzer await the LLM client's async path, tools
+    with an async counterpart of their method (a<method_name>, e.g. LV-Analysis)
+    await that, and any other tool runs its sync method in a worker thread.
+    """
+    from pitchlense_mcp.core.base import BaseRiskAnalyzer
+
+    if isinstance(getattr(tool, "analyzer", None), BaseRiskAnalyzer):
+        return await tool.aanalyze(startup_text)
+    async_method = getattr(tool, f"a{method_name}", None)
+    if async_method is not None and inspect.iscoroutinefunction(async_method):
+        return await async_method(startup_text)
+    analyze_method: Callable[[str], Dict[str, Any]] = getattr(tool, method_name)
+    return await run_in_thread(analyze_method, startup_text)
+
+
+def _inflight_key(tool: Any, startup_text: str) -> Optional[str]:
+    try:
+        prompt = tool.build_prompt(startup_text)
+    except Exception:
+        return None
+    if prompt is None:
+        return None
+    client_name = type(getattr(tool.analyzer, "llm_client", None)).__name__
+    raw = f"{type(tool).__name__}\0{client_name}\0{prompt}"
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+async def _analyze_one(tool: Any, method_name: str, startup_text: str) -> Dict[str, Any]:
+    """Run one analysis, joining an identical in-flight analysis if there is one."""
+    key = _inflight_key(tool, startup_text)
+    if key is None:
+        return await _run_analysis(tool, method_name, startup_text)
+
+    with _inflight_lock:
+        future = _inflight.get(key)
+        is_owner = future is None
+        if is_owner:
+            future = Future()
+            _inflight[key] = future
+    if not is_owner:
+        # Shielded: a joiner timing out must not cancel the owner's shared future
+        return dict(await asyncio.shield(asyncio.wrap_future(future)))
+
+    try:
+        result = await _run_analysis(tool, method_name, startup_text)
+        future.set_result(result)
+        return result
+    except BaseException as exc:
+        # Joiners get an ordinary error if the owner is cancelled (e.g. timed out)
+        future.set_exception(exc if isinstance(exc, Exception) else RuntimeError("Analysis was cancelled"))
+        raise
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+
+
+async def _arun_parallel_analyses(
     tools_and_methods: Dict[str, Tuple[Any, str]],
     startup_text: str,
-    max_workers: int,
+    max_concurrency: int,
+    semantic_cache: Optional[SemanticCache] = None,
+    embedding: Optional[List[float]] = None,
+    on_result: Optional[Callable[[str, Any], None]] = None,
 ) -> Tuple[Dict[str, Any], Dict[str, str]]:
-    """Run all analyses in parallel.
+    """Run all analyses concurrently with asyncio.gather.
+
+    Plain risk categories are fused into one JSON-mode LLM call (BatchedRiskAnalyzer);
+    categories it cannot answer, and all other analyses, run individually.
 
     Args:
         tools_and_methods: Mapping of analysis name to (tool instance, method name)
         startup_text: The single text input containing all startup details
-        max_workers: Thread pool size
+        max_concurrency: Maximum number of analyses in flight at once (0 or less:
+            one slot per analysis)
+        semantic_cache: Optional cache consulted per analysis before calling the LLM
+        embedding: Embedding of startup_text (required for semantic_cache lookups)
+        on_result: Optional callback invoked with (name, result) as each analysis finishes
+
+    Each job is limited to MCP_PER_ANALYSIS_TIMEOUT seconds and the whole fan-out
+    to MCP_TOTAL_TIMEOUT; analyses cut off by either are reported as "timeout".
 
     Returns:
         Tuple of (results_by_name, errors_by_name)
     """
     results: Dict[str, Any] = {}
     errors: Dict[str, str] = {}
+    use_cache = semantic_cache is not None and embedding is not None
 
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        future_to_name: Dict[Any, str] = {}
-        for analysis_name, (tool, method_name) in tools_and_methods.items():
-            analyze_method: Callable[[str], Dict[str, Any]] = getattr(tool, method_name)
-            future = executor.submit(analyze_method, startup_text)
-            future_to_name[future] = analysis_name
+    def report(name: str, result: Any) -> None:
+        if on_result is not None:
+            on_result(name, result)
+    semaphore = asyncio.Semaphore(max_concurrency if max_concurrency > 0 else max(1, len(tools_and_methods)))
+    per_analysis_timeout, total_timeout = _analysis_timeouts()
 
-        for future in as_completed(future_to_name):
-            name = future_to_name[future]
-            try:
-                result = future.result()
-                results[name] = result
-            except Exception as exc:  # pragma: no cover - defensive path
-                errors[name] = str(exc)
+    async def bounded(tool: Any, method_name: str) -> Dict[str, Any]:
+        async with semaphore:
+            return await asyncio.wait_for(_analyze_one(tool, method_name, startup_text), per_analysis_timeout)
+
+    pending: Dict[str, Tuple[Any, str]] = {}
+    for analysis_name, (tool, method_name) in tools_and_methods.items():
+        if use_cache:
+            cached = semantic_cache.get(analysis_name, embedding)
+            if cached is not None:
+                results[analysis_name] = cached
+                report(analysis_name, cached)
+                continue
+        pending[analysis_name] = (tool, method_name)
+
+    # Results land here as each analysis finishes, so a job cut off by the total
+    # timeout still keeps the categories it already completed
+    finished: Dict[str, Any] = {}
+
+    async def single(name: str, tool: Any, method_name: str) -> None:
+        try:
+            result = await bounded(tool, method_name)
+        except asyncio.TimeoutError:
+            errors[name] = "timeout"
+            return
+        finished[name] = result
+        report(name, result)
+
+    async def batched(names: List[str], analyzer: "pitchlense_mcp.BatchedRiskAnalyzer") -> None:
+        # Only the fused call is time-boxed here; it never holds more than one slot
+        try:
+            async with semaphore:
+                outcome = await asyncio.wait_for(analyzer.aanalyze_batched(startup_text), per_analysis_timeout)
+        except asyncio.TimeoutError:
+            outcome = {}
+        for name, result in outcome.items():
+            finished[name] = result
+            report(name, result)
+        # Categories the fused call did not answer (all of them for long inputs) run as
+        # ordinary jobs: own slot, own timeout, in-flight dedup
+        await asyncio.gather(*(single(name, *pending[name]) for name in names if name not in outcome))
+
+    # Send the plain risk categories in one JSON-mode call when there are enough of them
+    batchable = [name for name, (tool, _) in pending.items() if _is_batchable(tool)]
+    jobs: List[Tuple[List[str], Any]] = []
+    if _batching_enabled() and len(batchable) >= _BATCH_MIN_ANALYSES:
+        analyzers = {name: pending[name][0].analyzer for name in batchable}
+        llm_client = next(iter(analyzers.values())).llm_client
+        # Any accepted startup_text fits the fused call
+        analyzer = pitchlense_mcp.BatchedRiskAnalyzer(llm_client, analyzers, max_input_chars=_max_startup_chars())
+        jobs.append((batchable, batched(batchable, analyzer)))
+    else:
+        batchable = []
+    for name, (tool, method_name) in pending.items():
+        if name not in batchable:
+            jobs.append(([name], single(name, tool, method_name)))
+
+    tasks = [asyncio.ensure_future(job) for _, job in jobs]
+    if tasks:
+        _, unfinished = await asyncio.wait(tasks, timeout=total_timeout)
+        for task in unfinished:
+            task.cancel()
+        # Let cancelled jobs unwind (e.g. release in-flight entries) before returning
+        await asyncio.gather(*unfinished, return_exceptions=True)
+    for (names, _), task in zip(jobs, tasks):
+        failure = None if task.cancelled() else task.exception()
+        for name in names:
+            if name in finished or name in errors:
+                continue
+            errors[name] = "timeout" if failure is None else str(failure)
+    for name in pending:
+        if name not in finished:
+            continue
+        result = finished[name]
+        results[name] = result
+        if use_cache and isinstance(result, dict) and "error" not in result:
+            semantic_cache.put(name, embedding, result)
 
     return results, errors
 
 
-def mcp_analyze(data: dict):
+# One event loop per instance, kept alive across requests so the pooled async
+# clients (Gemini SDK, httpx) keep their connections between invocations
+_event_loop: Optional[asyncio.AbstractEventLoop] = None
+_event_loop_lock = threading.Lock()
+# Threads for blocking I/O (Serp, GCS, sync tools): sized by the number of independent
+# calls a request can have in flight, not by vCPUs. Idle workers are never spawned
+_IO_MAX_WORKERS = 24
+
+
+def _get_event_loop() -> asyncio.AbstractEventLoop:
+    global _event_loop
+    if _event_loop is None:
+        with _event_loop_lock:
+            if _event_loop is None:
+                loop = asyncio.new_event_loop()
+                loop.set_default_executor(ThreadPoolExecutor(max_workers=_IO_MAX_WORKERS, thread_name_prefix="mcp-io"))
+                threading.Thread(target=loop.run_forever, name="mcp-event-loop", daemon=True).start()
+                _event_loop = loop
+    return _event_loop
+
+
+def _run_coroutine(coro: Any) -> Any:
+    """Run a coroutine on the shared event loop and block until it finishes."""
+    return asyncio.run_coroutine_threadsafe(coro, _get_event_loop()).result()
+
+
+# Static prompt text is kept byte-identical across requests and placed before the
+# variable part, so provider-side prefix caching can reuse it
+_METADATA_SYSTEM_PROMPT = "You extract concise company metadata. Respond with JSON only within <JSON></JSON> tags."
+_METADATA_USER_PREFIX = (
+    "From the following startup description, extract the following fields strictly as JSON: "
+    "{\"company_name\": string, \"domain\": short industry/domain, \"area\": product area/category}.\n"
+    "Keep values short (1-6 words). If unknown, use an empty string.\n"
+    "Text:\n"
+)
+_MARKET_PROMPT_PREFIX = (
+    "You are a market research assistant. Based on the following domain and area, "
+    "return ONLY JSON inside <JSON></JSON> tags with this exact shape:\n"
+    "{\n"
+    "  \"market_value\": [ { \"year\": 2021, \"value_usd_billion\": 0.0 } ],\n"
+    "  \"market_size\": [ { \"segment\": \"SMB\", \"share_percent\": 0 } ]\n"
+    "}\n"
+    "- market_value should be a yearly time series (past 10 years and next 5 years forecast)\n"
+    "- Use numeric values only; omit currency symbols; values are in USD billions\n"
+    "- market_size should include a few key segments with percentage share totaling ~100\n"
+)
+# Upper bounds for single enrichment calls, so a hung provider cannot hold the
+# request open until the platform timeout (retries included)
+_METADATA_TIMEOUT = 15.0
+_MARKET_TIMEOUT = 30.0
+
+
+async def _extract_metadata(
+    llm_client: Any, startup_text: str, known: Optional[Dict[str, str]] = None
+) -> Dict[str, Any]:
+    """LLM-driven company metadata (company_name, domain, area) for the search stages.
+
+    When the request already supplies a company name plus a domain or area, those
+    are used as-is and no LLM call is made. Non-string values are dropped; returns an
+    empty dict if extraction fails.
+    """
+    if known and known.get("company_name") and (known.get("domain") or known.get("area")):
+        return dict(known)
+    try:
+        llm_resp = await asyncio.wait_for(
+            llm_client.apredict(
+                system_message=_METADATA_SYSTEM_PROMPT,
+                user_message=_METADATA_USER_PREFIX + startup_text,
+                tool_name="MetadataExtractor",
+                method_name="extract_company_metadata"
+            ),
+            timeout=_METADATA_TIMEOUT,
+        )
+        print("LLM Response", llm_resp)
+        extracted_metadata = extract_json_from_response(llm_resp.get("response", ""))
+        if not isinstance(extracted_metadata, dict):
+            raise ValueError("Failed to parse JSON metadata from LLM response")
+        # Callers .strip() these values; drop anything the LLM returned that is not text
+        return {key: value for key, value in extracted_metadata.items() if isinstance(value, str)}
+    except Exception as e:
+        print(f"[CloudFn] Error in LLM JSON extraction: {str(e) or type(e).__name__}")
+        return {}
+
+
+async def _fetch_news(metadata: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+    """Google News for the company name, domain and area, queried concurrently.
+
+    Returns:
+        Tuple of (news_query, first fetch with results in company/domain/area order)
+    """
+    empty = {"results": [], "error": None}
+    # Build news query strictly from the extracted JSON
+    terms = [(metadata.get(key) or "").strip() for key in ("company_name", "domain", "area")]
+    terms = [t for t in terms if t]
+    news_query = " ".join(terms)
+    if not terms:
+        return news_query, empty
+    # Company name, domain and area often coincide; fetch each distinct query once
+    queries = list({term.lower(): term for term in terms}.values())
+    try:
+        serp_news_tool = _get_aux_tool("SerpNewsMCPTool")
+        fetches = await asyncio.gather(
+            *(run_in_thread(serp_news_tool.fetch_google_news, query, num_results=10) for query in queries)
+        )
+        for query, fetch in zip(queries, fetches):
+            print(f"[CloudFn] News links for '{query}': {len(fetch.get('results', []))} results")
+        # Fall back from company to domain to area news when the narrower query finds nothing
+        return news_query, next(
+            (fetch for fetch in fetches if fetch.get("results")),
+            next((fetch for fetch in fetches if fetch), empty),
+        )
+    except Exception as e:
+        print(f"[CloudFn] Error fetching news: {str(e)}")
+        return "", empty
+
+
+async def _search_pdfs(company_name: str) -> Dict[str, Any]:
+    """Internet documents search for PDFs using the company name."""
+    try:
+        if not company_name:
+            print("[CloudFn] No company name extracted, skipping PDF search")
+            return {"results": [], "error": None}
+        pdf_query = f"{company_name} filetype:pdf"
+        serp_pdf_tool = _get_aux_tool("SerpPdfSearchMCPTool")
+        pdf_fetch = await run_in_thread(serp_pdf_tool.search_pdf_documents, pdf_query, num_results=10)
+        print(f"[CloudFn] PDF search for '{company_name}': {len(pdf_fetch.get('results', []))} results")
+        return pdf_fetch
+    except Exception as e:
+        print(f"[CloudFn] Error in PDF document search: {str(e)}")
+        return {"results": [], "error": str(e)}
+
+
+async def _fetch_market_data(metadata: Dict[str, Any]) -> Tuple[list, list, list]:
+    """Market value and market size via Perplexity, based on the extracted metadata.
+
+    Returns:
+        Tuple of (market_value, market_size, market_sources) where market_value is a list of
+        {"year", "value_usd_billion"}, market_size a list of {"segment", "share_percent"}
+        and market_sources a list of {"url", "title"}
+    """
+    market_value: list = []
+    market_size: list = []
+    market_sources: list = []
+    try:
+        domain = (metadata.get("domain") or "").strip()
+        area = (metadata.get("area") or "").strip()
+        if domain or area:
+            ppx = _get_aux_tool("PerplexityMCPTool")
+            market_prompt = _MARKET_PROMPT_PREFIX + f"\nDomain: {domain}\nArea: {area}\n"
+            ppx_resp = await asyncio.wait_for(ppx.asearch_perplexity(market_prompt), timeout=_MARKET_TIMEOUT)
+            if isinstance(ppx_resp, dict) and not ppx_resp.get("error"):
+                answer_text = (ppx_resp.get("answer") or "").strip()
+                market_sources = ppx_resp.get("sources", [])
+                market_json = extract_json_from_response(answer_text)
+                if isinstance(market_json, dict):
+                    mv = market_json.get("market_value")
+                    ms = market_json.get("market_size")
+                    if isinstance(mv, list):
+                        market_value = mv
+                    if isinstance(ms, list):
+                        market_size = ms
+    except Exception:
+        return [], [], []
+    return market_value, market_size, market_sources
+
+
+async def _generate_knowledge_graph(llm_client: Any, llm_type: str, startup_text: str, company_name: str) -> Dict[str, Any]:
+    """Knowledge graph of the startup; the KG tool extracts the company name if none is given."""
+    try:
+        print(f"[CloudFn] Company name: {company_name}")
+        print(f"[CloudFn] Startup text length: {len(startup_text)}")
+
+        # Generate knowledge graph if we have startup text
+        if not (startup_text and len(startup_text) > 100):
+            print(f"[CloudFn] Skipping knowledge graph generation: startup_text too short ({len(startup_text)} chars)")
+            return {}
+        print(f"[CloudFn] Generating knowledge graph...")
+        if company_name:
+            print(f"[CloudFn] Using company name: {company_name}")
+        else:
+            print(f"[CloudFn] Company name will be extracted by KG tool")
+
+        kg_tool = _get_aux_tool("KnowledgeGraphMCPTool")
+        kg_tool.set_llm_client(llm_client if llm_type == "gemini" else _get_llm_client("gemini"))
+        knowledge_graph = await run_in_thread(
+            kg_tool.generate_knowledge_graph,
+            startup_text=startup_text,
+            company_name=company_name if company_name else None
+        )
+        if knowledge_graph.get("error"):
+            print(f"[CloudFn] Knowledge graph error: {knowledge_graph.get('error')}")
+        else:
+            print(f"[CloudFn] Knowledge graph generated successfully")
+        return knowledge_graph
+    except Exception as e:
+        print(f"[CloudFn] Error generating knowledge graph: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return {"error": str(e)}
+
+
+# Same matches as the former per-check substring tests, in one pass each
+_LINKEDIN_FILETYPE_RE = re.compile(r"linkedin|profile|resume|curriculum vitae", re.IGNORECASE)
+_LINKEDIN_FILENAME_RE = re.compile(r"\Alinkedin|linkedin_|linkedin\.pdf\Z|\Aprofile_|profile\.pdf\Z", re.IGNORECASE)
+
+
+def _is_linkedin_file(file_info: Dict[str, Any]) -> bool:
+    # "founder profile" and "linkedin profile" filetypes are covered by "profile"/"linkedin"
+    return bool(
+        _LINKEDIN_FILETYPE_RE.search(file_info.get("filetype") or "")
+        or _LINKEDIN_FILENAME_RE.search(file_info.get("filename") or "")
+    )
+
+
+def _analyze_linkedin_file(file_info: Dict[str, Any], data: Optional[bytes] = None) -> Dict[str, Any]:
+    """Analyze a single LinkedIn file and return results.
+
+    data, if given, is the file content already downloaded for upload extraction
+    and is used instead of downloading the file again.
+    """
+    try:
+        filepath = file_info.get("filepath", "")
+        filename = file_info.get("filename", "unknown")
+
+        if data is None and filepath and filepath.startswith("gs://"):
+            data = _download_bytes_from_gcs(filepath)
+            print(f"[CloudFn] Downloaded {filename} ({len(data)} bytes)")
+
+        if data is not None:
+            analyzer = _get_aux_tool("LinkedInAnalyzerMCPTool")
+            result = analyzer.analyze_linkedin_profile(
+                filepath or filename, api_key=os.getenv("GEMINI_API_KEY"), pdf_bytes=data
+            )
+            return {
+                "filename": filename,
+                "filepath": filepath,
+                "analysis": result,
+                "success": True
+            }
+        else:
+            # Local file path
+            analyzer = _get_aux_tool("LinkedInAnalyzerMCPTool")
+            result = analyzer.analyze_linkedin_profile(filepath, api_key=os.getenv("GEMINI_API_KEY"))
+            return {
+                "filename": filename,
+                "filepath": filepath,
+                "analysis": result,
+                "success": True
+            }
+
+    except Exception as e:
+        print(f"[CloudFn] Error analyzing {file_info.get('filename', 'unknown')}: {str(e)}")
+        return {
+            "filename": file_info.get("filename", "unknown"),
+            "filepath": file_info.get("filepath", ""),
+            "analysis": {"error": str(e)},
+            "success": False
+        }
+
+
+async def _analyze_linkedin_files(
+    extracted_files_info: List[Dict[str, Any]], upload_data: Optional[Dict[str, bytes]] = None
+) -> Dict[str, Any]:
+    """LinkedIn profile analysis for any uploaded files that look like LinkedIn profiles.
+
+    upload_data maps an upload's filepath to its already-downloaded content.
+    """
+    upload_data = upload_data or {}
+    try:
+        linkedin_files = []
+        for file_info in extracted_files_info:
+            if _is_linkedin_file(file_info):
+                print(f"[CloudFn] Detected LinkedIn profile: {file_info.get('filename')} (filetype: {file_info.get('filetype', '').lower()})")
+                linkedin_files.append(file_info)
+
+        if not linkedin_files:
+            print("[CloudFn] No LinkedIn profile files detected")
+            return {}
+
+        print(f"[CloudFn] Found {len(linkedin_files)} LinkedIn profile files - analyzing in parallel...")
+
+        # Analyze all LinkedIn files in parallel
+        outcomes = await asyncio.gather(
+            *(
+                run_in_thread(_analyze_linkedin_file, file_info, upload_data.get(file_info.get("filepath", "")))
+                for file_info in linkedin_files
+            ),
+            return_exceptions=True,
+        )
+        linkedin_analyses = []
+        for file_info, result in zip(linkedin_files, outcomes):
+            if isinstance(result, BaseException):
+                print(f"[CloudFn] Unexpected error analyzing {file_info.get('filename', 'unknown')}: {str(result)}")
+                result = {
+                    "filename": file_info.get("filename", "unknown"),
+                    "filepath": file_info.get("filepath", ""),
+                    "analysis": {"error": str(result)},
+                    "success": False
+                }
+            elif result["success"]:
+                print(f"[CloudFn] Successfully analyzed: {result['filename']}")
+            else:
+                print(f"[CloudFn] Failed to analyze: {result['filename']}")
+            linkedin_analyses.append(result)
+
+        # Structure the final response
+        successful_analyses = [a for a in linkedin_analyses if a["success"]]
+        failed_analyses = [a for a in linkedin_analyses if not a["success"]]
+
+        print(f"[CloudFn] LinkedIn analysis complete: {len(successful_analyses)}/{len(linkedin_files)} successful")
+        return {
+            "total_files": len(linkedin_files),
+            "successful_analyses": len(successful_analyses),
+            "failed_analyses": len(failed_analyses),
+            "analyses": linkedin_analyses,
+            "primary_analysis": successful_analyses[0]["analysis"] if successful_analyses else None,
+            "all_analyses": [a["analysis"] for a in successful_analyses]
+        }
+    except Exception as e:
+        print(f"[CloudFn] Error in LinkedIn analysis: {str(e)}")
+        return {"error": str(e)}
+
+
+async def _research_social_media(company_name: str, linkedin_analysis: Dict[str, Any]) -> Dict[str, Any]:
+    """Social media research for the company and founders named in the LinkedIn uploads."""
+    try:
+        if not company_name:
+            print("[CloudFn] No company name available for social media research")
+            return {}
+        print(f"[CloudFn] Researching social media coverage for: {company_name}")
+
+        # Initialize social media research tool
+        social_research_tool = _get_aux_tool("SocialMediaResearchMCPTool")
+
+        # Extract founder names from LinkedIn analysis if available
+        founder_names = []
+        if linkedin_analysis and "analyses" in linkedin_analysis:
+            for analysis in linkedin_analysis.get("analyses", []):
+                if analysis.get("success") and "analysis" in analysis:
+                    # Try to extract founder name from filename or analysis
+                    filename = analysis.get("filename", "")
+                    if "linkedin" in filename.lower():
+                        # Extract name from filename like "(1) Karthik Chandrashekar _ LinkedIn.pdf"
+                        name_part = filename.split("_")[0].replace("(", "").replace(")", "").strip()
+                        if name_part and name_part != "1":
+                            founder_names.append(name_part)
+
+        # Research social media coverage
+        social_data = await run_in_thread(
+            social_research_tool.research_social_coverage,
+            company_name=company_name,
+            founder_names=founder_names if founder_names else None
+        )
+
+        print(f"[CloudFn] Social media research complete for {company_name}")
+        return {
+            "company_name": company_name,
+            "founder_names": founder_names,
+            "research_data": social_data,
+            "research_timestamp": "2024-01-01T00:00:00Z"
+        }
+    except Exception as e:
+        print(f"[CloudFn] Error in social media research: {str(e)}")
+        return {"error": str(e)}
+
+
+def _iter_text(value: Any) -> Iterator[str]:
+    """Yield the non-empty string values nested anywhere in a JSON-like payload."""
+    if isinstance(value, str):
+        if value.strip():
+            yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _iter_text(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _iter_text(item)
+
+
+def mcp_analyze(
+    data: dict,
+    on_result: Optional[Callable[[str, Any], None]] = None,
+    include_body: bool = True,
+):
     """HTTP Cloud Function entrypoint to run MCP analyses in parallel.
 
     - Accepts POST with JSON body containing `startup_text` and optional `use_mock`, `categories`.
     - Returns structured JSON with results and radar chart data.
+    - `on_result`, if given, is called with (name, result) as each analysis completes
+      (cache hits included), while the enrichment stages are still running.
+    - `include_body=False` skips serializing a successful response (the body is
+      returned empty), for callers that only need the status or read the results
+      from `destination_gcs`.
     """
+    return _run_coroutine(_amcp_analyze(data, on_result, include_body))
+
+
+async def _amcp_analyze(
+    data: dict,
+    on_result: Optional[Callable[[str, Any], None]] = None,
+    include_body: bool = True,
+):
+    """Async body of mcp_analyze(); blocking SDK calls run in worker threads."""
     try:
+        # One timezone-aware timestamp per request
+        analysis_timestamp = datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
         startup_text: str = (data.get("startup_text") or "").strip()
         request_company_name: str = (data.get("company_name") or "").strip()
+        request_metadata = {
+            "company_name": request_company_name,
+            "domain": (data.get("domain") or "").strip(),
+            "area": (data.get("area") or "").strip(),
+        }
         extracted_files_info: list[dict] = []
+        upload_data: Dict[str, bytes] = {}  # upload filepath -> downloaded content, reused by LinkedIn
         all_sources: list[dict] = []  # Track all sources from Perplexity calls
+        max_chars = _max_startup_chars()
+        if len(startup_text) > max_chars:
+            # Reject before any download or LLM work; every analysis would resend it
+            return (
+                _json_dumps({
+                    "error": f"'startup_text' is too large ({len(startup_text)} characters; limit {max_chars})"
+                }),
+                413,
+                {"Content-Type": "application/json"},
+            )
         if not startup_text:
             # Try to build startup_text from uploads if provided
             uploads = data.get("uploads") or []
             if not uploads:
-                return (
-                    json.dumps({"error": "Missing 'startup_text' or 'uploads' in request body"}),
-                    400,
-                    {"Content-Type": "application/json"},
-                )
+                return _MISSING_INPUT_RESPONSE
 
         requested_categories = data.get("categories")
         use_mock_flag = data.get("use_mock")  # may be None
         destination_gcs = (data.get("destination_gcs") or "").strip()
+        pretty_output = bool(data.get("pretty"))
 
-        tools_map = _build_tools_and_methods()
+        llm_client, llm_type = _select_llm_client(use_mock=use_mock_flag)
+
+        category_names = None
         if requested_categories:
-            tools_map = {k: v for k, v in tools_map.items() if k in set(requested_categories)}
-            if not tools_map:
+            if not isinstance(requested_categories, list) or not all(
+                isinstance(name, str) for name in requested_categories
+            ):
                 return (
-                    json.dumps({"error": "No valid categories requested"}),
+                    _json_dumps({"error": "'categories' must be a list of analysis names"}),
                     400,
                     {"Content-Type": "application/json"},
                 )
-
-        llm_client, llm_type = _select_llm_client(use_mock=use_mock_flag)
+            wanted = frozenset(requested_categories)
+            unknown = sorted(wanted.difference(_TOOL_SPECS))
+            if unknown:
+                return (
+                    _json_dumps({"error": f"Unknown categories: {unknown}", "valid_categories": list(_TOOL_SPECS)}),
+                    400,
+                    {"Content-Type": "application/json"},
+                )
+            category_names = [name for name in _TOOL_SPECS if name in wanted]
+        tools_map = _get_tools_and_methods(llm_type, category_names)
 
         # If startup_text is empty but uploads present, download files and extract
         if not startup_text:
-            # Support local paths or gs:// URIs in uploads.filepath
-            prepared: list[dict] = []
-            for u in uploads:
+            # Support local paths or gs:// URIs in uploads.filepath. GCS objects are downloaded
+            # into memory (in parallel, on the shared storage client) and handed to Gemini as
+            # bytes, so nothing is staged in /tmp; each file is extracted as soon as it arrives
+            extractor = pitchlense_mcp.UploadExtractor(llm_client if llm_type == "gemini" else _get_llm_client("gemini"))
+            download_slots = asyncio.Semaphore(_GCS_DOWNLOAD_CONCURRENCY)
+
+            async def prepare(u: dict) -> Optional[Tuple[dict, dict]]:
                 fp = (u.get("filepath") or "").strip()
                 if not fp:
-                    continue
-                local_path = fp
-                if fp.startswith("gs://"):
-                    # Download to tmp from GCS
-                    parsed = urlparse(fp)
-                    bucket_name = parsed.netloc
-                    blob_path = parsed.path.lstrip("/")
-                    from google.cloud import storage  # lazy import
-                    client = storage.Client()
-                    bucket = client.bucket(bucket_name)
-                    blob = bucket.blob(blob_path)
-                    local_dir = os.path.join("/tmp", os.path.dirname(blob_path))
-                    os.makedirs(local_dir, exist_ok=True)
-                    local_path = os.path.join("/tmp", blob_path)
-                    os.makedirs(os.path.dirname(local_path), exist_ok=True)
-                    blob.download_to_filename(local_path)
-
-                prepared.append({
+                    return None
+                item = {
                     "filename": u.get("filename"),
                     "file_extension": u.get("file_extension"),
-                    "local_path": local_path,
+                    "local_path": fp,
                     "filetype": u.get("filetype"),
                     "filepath": fp,  # Store original GCS filepath
-                })
+                }
+                if fp.startswith("gs://"):
+                    item["local_path"] = None
+                    item["filename"] = item["filename"] or os.path.basename(urlparse(fp).path)
+                    async with download_slots:
+                        try:
+                            item["data"] = await run_in_thread(_download_bytes_from_gcs, fp)
+                        except ValueError as exc:
+                            # Oversized upload: skip it rather than fail the other files
+                            print(f"[CloudFn] Skipping upload: {exc}")
+                            return None
+                doc = await run_in_thread(extractor.extract_document, item)
+                data = item.pop("data", None)
+                # Only LinkedIn analysis reads the file again; every other download is released here
+                if data is not None and _is_linkedin_file(
+                    {"filetype": item["filetype"] or doc.get("type"), "filename": doc.get("name")}
+                ):
+                    upload_data[fp] = data
+                return item, doc
 
-            extractor = UploadExtractor(llm_client if isinstance(llm_client, GeminiLLM) else GeminiLLM())
-            docs = extractor.extract_documents(prepared)
-            synthesis_result = extractor.synthesize_startup_text_with_sources(docs)
+            extracted = [p for p in await asyncio.gather(*(prepare(u) for u in uploads)) if p]
+            prepared: list[dict] = [item for item, _ in extracted]
+            docs = [doc for _, doc in extracted]
+            synthesis_result = await run_in_thread(extractor.synthesize_startup_text_with_sources, docs)
             startup_text = (synthesis_result.get("text") or "").strip()
             synthesis_sources = synthesis_result.get("sources", [])
             all_sources.extend(synthesis_sources)
@@ -250,360 +1169,141 @@ def mcp_analyze(data: dict):
                     })
             except Exception:
                 extracted_files_info = []
+            if len(startup_text) > max_chars:
+                print(f"[CloudFn] Truncating synthesized startup_text from {len(startup_text)} to {max_chars} characters")
+                startup_text = startup_text[:max_chars]
             if not startup_text:
-                return (
-                    json.dumps({"error": "Failed to synthesize startup_text from uploads"}),
-                    400,
-                    {"Content-Type": "application/json"},
-                )
+                return _SYNTHESIS_FAILED_RESPONSE
 
-        # Attach the LLM client to each tool
-        for _, (tool, _) in tools_map.items():
-            try:
-                tool.set_llm_client(llm_client)
-            except Exception:
-                pass
-
-        # Thread pool size: default to 2 * CPU cores, minimum 4, max 16
-        cpu_count = os.cpu_count() or 2
-        default_workers = max(4, min(16, cpu_count * 2))
+        # Concurrency limit = number of independent analyses (network-bound LLM calls),
+        # not a vCPU multiple: fewer serializes them, more only adds idle slots.
+        # MCP_PARALLEL_WORKERS=0 removes the cap entirely
+        default_workers = max(1, min(len(tools_map), _IO_MAX_WORKERS))
         max_workers = int(os.getenv("MCP_PARALLEL_WORKERS", default_workers))
 
-        analysis_results, analysis_errors = _run_parallel_analyses(
-            tools_and_methods=tools_map,
-            startup_text=startup_text,
-            max_workers=max_workers,
-        )
+        async def run_analyses() -> Tuple[Dict[str, Any], Dict[str, str]]:
+            # Exact-match cache: identical re-invocations (e.g. retries) skip the LLM entirely
+            exact_cache = _get_exact_cache()
+            exact_key = _ExactAnalysisCache.text_key(startup_text, llm_type) if exact_cache else None
+            exact_hits = await run_in_thread(exact_cache.get_many, exact_key, list(tools_map)) if exact_cache else {}
+            pending_tools = {k: v for k, v in tools_map.items() if k not in exact_hits}
+            if exact_hits:
+                print(f"[CloudFn] Exact cache hits: {len(exact_hits)}/{len(tools_map)}")
+                if on_result is not None:
+                    for name, result in exact_hits.items():
+                        on_result(name, result)
 
-        # LLM-driven metadata extraction for news query
-        extracted_metadata = None
-        llm_extracted_metadata = None
-        try:
-            system_msg = "You extract concise company metadata. Respond with JSON only within <JSON></JSON> tags."
-            user_msg = (
-                "From the following startup description, extract the following fields strictly as JSON: "
-                "{\"company_name\": string, \"domain\": short industry/domain, \"area\": product area/category}.\n"
-                "Keep values short (1-6 words). If unknown, use an empty string.\n"
-                "Text:\n" + startup_text
-            )
-            llm_resp = llm_client.predict(
-                system_message=system_msg, 
-                user_message=user_msg,
-                tool_name="MetadataExtractor",
-                method_name="extract_company_metadata"
-            )
-            print("LLM Response", llm_resp)
-            extracted_metadata = extract_json_from_response(llm_resp.get("response", ""))
-            if not isinstance(extracted_metadata, dict):
-                raise ValueError("Failed to parse JSON metadata from LLM response")
-
-            # Build news query strictly from the extracted JSON
-            news_query_terms = [
-                (extracted_metadata.get("company_name") or "").strip(),
-                (extracted_metadata.get("domain") or "").strip(),
-                (extracted_metadata.get("area") or "").strip(),
-            ]
-            news_query = " ".join([t for t in news_query_terms if t])
-            company_name = extracted_metadata.get("company_name") or None
-            domain = extracted_metadata.get("domain") or None
-            area = extracted_metadata.get("area") or None
-            serp_news_tool = SerpNewsMCPTool()
-            if company_name:
-                news_fetch_company = serp_news_tool.fetch_google_news(company_name, num_results=10)
-                print(f"[CloudFn] News links for '{company_name}': {len(news_fetch_company.get('results', []))} results")
-            if domain:
-                news_fetch_domain = serp_news_tool.fetch_google_news(domain, num_results=10)
-                print(f"[CloudFn] News links for '{domain}': {len(news_fetch_domain.get('results', []))} results")
-            if area:
-                news_fetch_area = serp_news_tool.fetch_google_news(area, num_results=10)
-                print(f"[CloudFn] News links for '{area}': {len(news_fetch_area.get('results', []))} results")
-            news_fetch = news_fetch_company or news_fetch_domain or news_fetch_area
-            print(f"[CloudFn] News links for '{company_name}', '{domain}', '{area}': {len(news_fetch.get('results', []))} results")
-        except Exception as e:
-            print(f"[CloudFn] Error in LLM JSON extraction: {str(e)}")
-            import traceback
-            traceback.print_exc()
-            extracted_metadata = {}
-            news_query = ""
-            news_fetch = {"results": [], "error": None}
-
-        # Internet documents search for PDFs using company name
-        internet_documents = {"results": [], "error": None}
-        try:
-            company_name = (extracted_metadata.get("company_name") or request_company_name or "").strip() if isinstance(extracted_metadata, dict) else request_company_name
-            if company_name:
-                pdf_query = f"{company_name} filetype:pdf"
-                serp_pdf_tool = SerpPdfSearchMCPTool()
-                pdf_fetch = serp_pdf_tool.search_pdf_documents(pdf_query, num_results=10)
-                internet_documents = pdf_fetch
-                print(f"[CloudFn] PDF search for '{company_name}': {len(pdf_fetch.get('results', []))} results")
-            else:
-                print("[CloudFn] No company name extracted, skipping PDF search")
-        except Exception as e:
-            print(f"[CloudFn] Error in PDF document search: {str(e)}")
-            internet_documents = {"results": [], "error": str(e)}
+            # Embed startup_text once; the embedding feeds both the router and the semantic cache
+            semantic_cache = None
+            embedding = None
+            router = _get_router(llm_client, llm_type)
+            if pending_tools and (_semantic_cache_enabled() or router) and hasattr(llm_client, "embed"):
+                try:
+                    embedding = await run_in_thread(llm_client.embed, startup_text)
+                except Exception as e:
+                    print(f"[CloudFn] Embedding failed; routing and semantic cache skipped: {e}")
 
-        # Market value and market size via Perplexity (based on extracted LLM metadata)
-        market_value = []  # list of {"year": int, "value_usd_billion": float}
-        market_size = []   # list of {"segment": str, "share_percent": number}
-        market_sources = []  # list of {"url", "title"} from Perplexity
-        try:
-            domain = (extracted_metadata.get("domain") or "").strip() if isinstance(extracted_metadata, dict) else ""
-            area = (extracted_metadata.get("area") or "").strip() if isinstance(extracted_metadata, dict) else ""
-            if domain or area:
-                ppx = PerplexityMCPTool()
-                market_prompt = (
-                    "You are a market research assistant. Based on the following domain and area, "
-                    "return ONLY JSON inside <JSON></JSON> tags with this exact shape:\n"
-                    "{\n"
-                    "  \"market_value\": [ { \"year\": 2021, \"value_usd_billion\": 0.0 } ],\n"
-                    "  \"market_size\": [ { \"segment\": \"SMB\", \"share_percent\": 0 } ]\n"
-                    "}\n"
-                    "- market_value should be a yearly time series (past 10 years and next 5 years forecast)\n"
-                    "- Use numeric values only; omit currency symbols; values are in USD billions\n"
-                    "- market_size should include a few key segments with percentage share totaling ~100\n"
-                    f"\nDomain: {domain}\nArea: {area}\n"
-                )
-                ppx_resp = ppx.search_perplexity(market_prompt)
-                if isinstance(ppx_resp, dict) and not ppx_resp.get("error"):
-                    answer_text = (ppx_resp.get("answer") or "").strip()
-                    market_sources = ppx_resp.get("sources", [])
-                    all_sources.extend(market_sources)
-                    market_json = extract_json_from_response(answer_text)
-                    if isinstance(market_json, dict):
-                        mv = market_json.get("market_value")
-                        ms = market_json.get("market_size")
-                        if isinstance(mv, list):
-                            market_value = mv
-                        if isinstance(ms, list):
-                            market_size = ms
-        except Exception:
-            market_value = []
-            market_size = []
-            market_sources = []
-
-        # Knowledge Graph generation
-        knowledge_graph = {}
-        try:
-            # Extract company name from metadata if available, otherwise use request data
-            final_company_name = ""
-            if isinstance(extracted_metadata, dict) and extracted_metadata.get("company_name"):
-                final_company_name = extracted_metadata.get("company_name").strip()
-            elif request_company_name:
-                final_company_name = request_company_name
-            
-            print(f"[CloudFn] Company name: {final_company_name}")
-            print(f"[CloudFn] Startup text length: {len(startup_text)}")
-            
-            # Generate knowledge graph if we have startup text
-            if startup_text and len(startup_text) > 100:
-                print(f"[CloudFn] Generating knowledge graph...")
-                if final_company_name:
-                    print(f"[CloudFn] Using company name: {final_company_name}")
-                else:
-                    print(f"[CloudFn] Company name will be extracted by KG tool")
-                
-                kg_tool = KnowledgeGraphMCPTool()
-                kg_tool.set_llm_client(llm_client if isinstance(llm_client, GeminiLLM) else GeminiLLM())
-                knowledge_graph = kg_tool.generate_knowledge_graph(
-                    startup_text=startup_text,
-                    company_name=final_company_name if final_company_name else None
-                )
-                if knowledge_graph.get("error"):
-                    print(f"[CloudFn] Knowledge graph error: {knowledge_graph.get('error')}")
-                else:
-                    print(f"[CloudFn] Knowledge graph generated successfully")
-            else:
-                print(f"[CloudFn] Skipping knowledge graph generation: startup_text too short ({len(startup_text)} chars)")
-        except Exception as e:
-            print(f"[CloudFn] Error generating knowledge graph: {str(e)}")
-            import traceback
-            traceback.print_exc()
-            knowledge_graph = {"error": str(e)}
+            # Router: categories clearly not applicable to this startup get a stock result
+            routed_results: Dict[str, Any] = {}
+            if router is not None and embedding is not None:
+                try:
+                    routes = await run_in_thread(router.predict, embedding, list(pending_tools))
+                    for name, route in routes.items():
+                        if route == "template":
+                            routed_results[name] = AnalysisRouter.template_result(name)
+                            if on_result is not None:
+                                on_result(name, routed_results[name])
+                except Exception as e:
+                    print(f"[CloudFn] Routing failed, running all analyses: {e}")
+                    routed_results = {}
+                if routed_results:
+                    print(f"[CloudFn] Routed to template: {sorted(routed_results)}")
+                    pending_tools = {k: v for k, v in pending_tools.items() if k not in routed_results}
 
-        # LinkedIn Profile Analysis (if LinkedIn PDFs are provided)
-        linkedin_analysis = {}
-        try:
-            # Check if any uploaded files are LinkedIn profiles
-            linkedin_files = []
-            for file_info in extracted_files_info:
-                filename = file_info.get("filename", "").lower()
-                filetype = file_info.get("filetype", "").lower()
-                
-                # Check for LinkedIn profile filetypes
-                linkedin_filetypes = ["founder profile", "linkedin", "profile", "linkedin profile","resume", "curriculum vitae"]
-                is_linkedin_file = (
-                    any(ft in filetype for ft in linkedin_filetypes) or
-                    (filename.startswith("linkedin") or filename.endswith("linkedin.pdf") or "linkedin_" in filename) or 
-                    (filename.endswith("profile.pdf") or filename.startswith("profile_"))
-                )
-                
-                if is_linkedin_file:
-                    print(f"[CloudFn] Detected LinkedIn profile: {file_info.get('filename')} (filetype: {filetype})")
-                    linkedin_files.append(file_info)
-            
-            if linkedin_files:
-                print(f"[CloudFn] Found {len(linkedin_files)} LinkedIn profile files - analyzing in parallel...")
-                
-                def analyze_single_linkedin_file(file_info):
-                    """Analyze a single LinkedIn file and return results."""
-                    try:
-                        filepath = file_info.get("filepath", "")
-                        filename = file_info.get("filename", "unknown")
-                        
-                        if filepath and filepath.startswith("gs://"):
-                            # Download from GCS first
-                            from google.cloud import storage
-                            parsed = urlparse(filepath)
-                            bucket_name = parsed.netloc
-                            blob_path = parsed.path.lstrip("/")
-                            client = storage.Client()
-                            bucket = client.bucket(bucket_name)
-                            blob = bucket.blob(blob_path)
-                            local_path = os.path.join("/tmp", f"{filename}_{os.path.basename(blob_path)}")
-                            blob.download_to_filename(local_path)
-                            
-                            print(f"[CloudFn] Downloaded {filename} to: {local_path}")
-                            analyzer = LinkedInAnalyzerMCPTool()
-                            result = analyzer.analyze_linkedin_profile(local_path, api_key=os.getenv("GEMINI_API_KEY"))
-                            
-                            # Clean up temporary file
-                            try:
-                                os.remove(local_path)
-                            except:
-                                pass
-                                
-                            return {
-                                "filename": filename,
-                                "filepath": filepath,
-                                "analysis": result,
-                                "success": True
-                            }
-                        else:
-                            # Local file path
-                            analyzer = LinkedInAnalyzerMCPTool()
-                            result = analyzer.analyze_linkedin_profile(filepath, api_key=os.getenv("GEMINI_API_KEY"))
-                            return {
-                                "filename": filename,
-                                "filepath": filepath,
-                                "analysis": result,
-                                "success": True
-                            }
-                            
-                    except Exception as e:
-                        print(f"[CloudFn] Error analyzing {file_info.get('filename', 'unknown')}: {str(e)}")
-                        return {
-                            "filename": file_info.get("filename", "unknown"),
-                            "filepath": file_info.get("filepath", ""),
-                            "analysis": {"error": str(e)},
-                            "success": False
-                        }
-                
-                # Analyze all LinkedIn files in parallel
-                with ThreadPoolExecutor(max_workers=min(4, len(linkedin_files))) as executor:
-                    # Submit all analysis tasks
-                    future_to_file = {
-                        executor.submit(analyze_single_linkedin_file, file_info): file_info 
-                        for file_info in linkedin_files
-                    }
-                    
-                    # Collect results
-                    linkedin_analyses = []
-                    for future in as_completed(future_to_file):
-                        file_info = future_to_file[future]
-                        try:
-                            result = future.result()
-                            linkedin_analyses.append(result)
-                            if result["success"]:
-                                print(f"[CloudFn] Successfully analyzed: {result['filename']}")
-                            else:
-                                print(f"[CloudFn] Failed to analyze: {result['filename']}")
-                        except Exception as e:
-                            print(f"[CloudFn] Unexpected error analyzing {file_info.get('filename', 'unknown')}: {str(e)}")
-                            linkedin_analyses.append({
-                                "filename": file_info.get("filename", "unknown"),
-                                "filepath": file_info.get("filepath", ""),
-                                "analysis": {"error": str(e)},
-                                "success": False
-                            })
-                
-                # Structure the final response
-                successful_analyses = [a for a in linkedin_analyses if a["success"]]
-                failed_analyses = [a for a in linkedin_analyses if not a["success"]]
-                
-                linkedin_analysis = {
-                    "total_files": len(linkedin_files),
-                    "successful_analyses": len(successful_analyses),
-                    "failed_analyses": len(failed_analyses),
-                    "analyses": linkedin_analyses,
-                    "primary_analysis": successful_analyses[0]["analysis"] if successful_analyses else None,
-                    "all_analyses": [a["analysis"] for a in successful_analyses]
-                }
-                
-                print(f"[CloudFn] LinkedIn analysis complete: {len(successful_analyses)}/{len(linkedin_files)} successful")
-            else:
-                print("[CloudFn] No LinkedIn profile files detected")
-        except Exception as e:
-            print(f"[CloudFn] Error in LinkedIn analysis: {str(e)}")
-            linkedin_analysis = {"error": str(e)}
+            # Semantic cache: reuse results of near-duplicate pitches
+            if embedding is not None and _semantic_cache_enabled():
+                semantic_cache = await run_in_thread(_get_semantic_cache)
+            cache_revision = semantic_cache.revision if semantic_cache is not None else 0
 
-        # Social Media Research (if company name is available)
-        social_media_research = {}
-        try:
-            if final_company_name:
-                print(f"[CloudFn] Researching social media coverage for: {final_company_name}")
-                
-                # Initialize social media research tool
-                social_research_tool = SocialMediaResearchMCPTool()
-                
-                # Extract founder names from LinkedIn analysis if available
-                founder_names = []
-                if linkedin_analysis and "analyses" in linkedin_analysis:
-                    for analysis in linkedin_analysis.get("analyses", []):
-                        if analysis.get("success") and "analysis" in analysis:
-                            # Try to extract founder name from filename or analysis
-                            filename = analysis.get("filename", "")
-                            if "linkedin" in filename.lower():
-                                # Extract name from filename like "(1) Karthik Chandrashekar _ LinkedIn.pdf"
-                                name_part = filename.split("_")[0].replace("(", "").replace(")", "").strip()
-                                if name_part and name_part != "1":
-                                    founder_names.append(name_part)
-                
-                # Research social media coverage
-                social_data = social_research_tool.research_social_coverage(
-                    company_name=final_company_name,
-                    founder_names=founder_names if founder_names else None
-                )
-                
-                social_media_research = {
-                    "company_name": final_company_name,
-                    "founder_names": founder_names,
-                    "research_data": social_data,
-                    "research_timestamp": "2024-01-01T00:00:00Z"
+            analysis_results, analysis_errors = await _arun_parallel_analyses(
+                tools_and_methods=pending_tools,
+                startup_text=startup_text,
+                max_concurrency=max_workers,
+                semantic_cache=semantic_cache,
+                embedding=embedding,
+                on_result=on_result,
+            )
+            if exact_cache:
+                await run_in_thread(exact_cache.set_many, exact_key, analysis_results)
+            if exact_hits or routed_results:
+                served = {**exact_hits, **routed_results}
+                analysis_results = {
+                    name: served.get(name, analysis_results.get(name))
+                    for name in tools_map
+                    if name in served or name in analysis_results
                 }
-                
-                print(f"[CloudFn] Social media research complete for {final_company_name}")
-            else:
-                print("[CloudFn] No company name available for social media research")
-        except Exception as e:
-            print(f"[CloudFn] Error in social media research: {str(e)}")
-            social_media_research = {"error": str(e)}
 
-        # Radar chart data from category scores (exclude LV-Analysis as it's not a risk analysis)
-        radar_dimensions = []
-        radar_scores = []
-        for name, result in analysis_results.items():
-            # Skip LV-Analysis for radar chart as it's a detailed business note, not a risk analysis
-            if name == "LV-Analysis":
-                continue
-            if isinstance(result, dict) and "category_score" in result and "error" not in result:
-                radar_dimensions.append(name)
-                radar_scores.append(result.get("category_score", 0))
-            else:
+            semantic_cache_gcs = os.getenv("MCP_SEMANTIC_CACHE_GCS", "").strip()
+            if semantic_cache is not None and semantic_cache_gcs and semantic_cache.revision != cache_revision:
                 try:
-                    print(f"[CloudFn] Analysis result missing or error for {name}: keys={list(result.keys()) if isinstance(result, dict) else type(result)}")
-                except Exception:
-                    pass
+                    await run_in_thread(_write_json_to_gcs, semantic_cache_gcs, semantic_cache.to_dict())
+                except Exception as e:
+                    print(f"[CloudFn] Error persisting semantic cache: {e}")
+
+            return analysis_results, analysis_errors
+
+        async def enrich() -> Tuple[Any, ...]:
+            # LinkedIn profiles only need the uploads; everything else waits on the metadata
+            linkedin_task = asyncio.ensure_future(_analyze_linkedin_files(extracted_files_info, upload_data))
+            # Handshake with Perplexity while the metadata call is in flight
+            prewarm_task = (
+                asyncio.ensure_future(_get_aux_tool("PerplexityMCPTool").aprewarm())
+                if os.getenv("PERPLEXITY_API_KEY") else None
+            )
+            metadata = await _extract_metadata(llm_client, startup_text, request_metadata)
+            company_name = (metadata.get("company_name") or "").strip() or request_company_name
+            news, documents, market, graph, linkedin = await asyncio.gather(
+                _fetch_news(metadata),
+                _search_pdfs(company_name),
+                _fetch_market_data(metadata),
+                _generate_knowledge_graph(llm_client, llm_type, startup_text, company_name),
+                linkedin_task,
+            )
+            if prewarm_task is not None:
+                await prewarm_task
+            social = await _research_social_media(company_name, linkedin)
+            return metadata, news, documents, market, graph, linkedin, social
+
+        # Enrichment (metadata -> news/PDF/market/KG/LinkedIn -> social) runs alongside
+        # the analyses, so wall time is the slower of the two chains rather than the sum
+        (analysis_results, analysis_errors), enrichment = await asyncio.gather(run_analyses(), enrich())
+        (
+            extracted_metadata,
+            (news_query, news_fetch),
+            internet_documents,
+            (market_value, market_size, market_sources),
+            knowledge_graph,
+            linkedin_analysis,
+            social_media_research,
+        ) = enrichment
+        all_sources.extend(market_sources)
+
+        # Radar chart data from category scores (exclude LV-Analysis as it's not a risk analysis)
+        # Skip LV-Analysis for radar chart as it's a detailed business note, not a risk analysis
+        radar_points = [
+            (name, result["category_score"])
+            for name, result in analysis_results.items()
+            if name != "LV-Analysis"
+            and isinstance(result, dict)
+            and result.get("category_score") is not None
+            and "error" not in result
+        ]
+        radar_dimensions = [name for name, _ in radar_points]
+        radar_scores = [score for _, score in radar_points]
+        scored = set(radar_dimensions)
+        unscored = [name for name in analysis_results if name != "LV-Analysis" and name not in scored]
+        if unscored:
+            print(f"[CloudFn] Analyses without a score (missing or error): {unscored}")
 
         # Deduplicate sources by URL
         seen_urls = set()
@@ -617,6 +1317,7 @@ def mcp_analyze(data: dict):
         response_payload: Dict[str, Any] = {
             "files": extracted_files_info,
             "startup_analysis": {
+                "analysis_timestamp": analysis_timestamp,
                 "llm_client_type": llm_type,
                 "total_analyses": len(analysis_results),
                 "analyses": analysis_results,
@@ -642,19 +1343,25 @@ def mcp_analyze(data: dict):
             "content_moderation" : False,
             "moderation_details" : {},
             "errors": analysis_errors,
+            "meta": {
+                "input_chars": len(startup_text),
+                # Same ~4 characters per token approximation as the token tracker
+                "input_tokens_estimate": len(startup_text) // 4,
+            },
         }
 
         # Content Moderation Check
         print("[CloudFn] Performing content moderation check...")
         try:
-            # Convert the entire response to JSON string for moderation
-            response_json_string = json.dumps(response_payload, ensure_ascii=False, indent=2)
+            # Only the text in the response can need moderation; scores, sizes and
+            # graph structure are skipped instead of being serialized
+            response_text = "\n".join(_iter_text(response_payload))
             
             # Initialize content moderation tool
-            content_moderator = GoogleContentModerationMCPTool()
+            content_moderator = _get_aux_tool("GoogleContentModerationMCPTool")
             
             # Check if content requires moderation
-            moderation_result = content_moderator.moderate_content(response_json_string)
+            moderation_result = await run_in_thread(content_moderator.moderate_content, response_text)
             
             if moderation_result.get("moderation_required", False):
                 print("[CloudFn] Content moderation issues detected - marking response")
@@ -677,7 +1384,7 @@ def mcp_analyze(data: dict):
         # If a GCS destination was provided, write the JSON there
         if destination_gcs:
             try:
-                _write_json_to_gcs(destination_gcs, response_payload)
+                await run_in_thread(_write_json_to_gcs, destination_gcs, response_payload, pretty=pretty_output)
             except Exception as gcs_exc:
                 # Include GCS error in response but do not fail the analysis results
                 print(gcs_exc)
@@ -741,17 +1448,96 @@ def mcp_analyze(data: dict):
             print(f"[CloudFn] Error generating token summary: {str(e)}")
             response_payload["token_usage"] = {"error": str(e)}
 
-        return (json.dumps(response_payload), 200, {"Content-Type": "application/json"})
+        body = _json_dumps(response_payload, pretty=pretty_output) if include_body else b""
+        return (body, 200, {"Content-Type": "application/json"})
 
     except Exception as exc:  # pragma: no cover - defensive path
         error_payload = {"error": f"Unhandled error: {str(exc)}"}
         print(error_payload)
-        return (json.dumps(error_payload), 500, {"Content-Type": "application/json"})
+        return (_json_dumps(error_payload), 500, {"Content-Type": "application/json"})
+
+_gcs_client = None
+_gcs_client_lock = threading.Lock()
+# Parallel blob downloads per request; the storage client's pool is shared
+_GCS_DOWNLOAD_CONCURRENCY = 8
+# Streamed uploads buffer one chunk (the writer's default is 40 MiB); must be a
+# multiple of 256 KiB
+_GCS_UPLOAD_CHUNK_SIZE = 1024 * 1024
+# Encoded payloads up to this size are sent in a single (multipart) request
+# instead of a resumable session; 8 MiB is the client's own multipart limit
+_GCS_SINGLE_REQUEST_MAX = 8 * 1024 * 1024
+# Result JSON is stored gzip-encoded (mostly English text, typically 5x+ smaller);
+# GCS decompresses it on the fly for readers that do not accept gzip
+_GCS_GZIP_LEVEL = 3
+
+
+def _gcs_gzip_enabled() -> bool:
+    # Opt-in: Content-Encoding: gzip changes what raw or byte-range readers of
+    # destination_gcs objects get back. Set MCP_GCS_GZIP=1 to compress result JSON
+    return os.getenv("MCP_GCS_GZIP", "0").lower() in ("1", "true", "yes")
+
+
+def _get_gcs_client():
+    """Return a process-wide storage client so warm requests skip auth and TLS setup.
+
+    The client keeps its authorized requests session (and connection pool) for
+    the life of the instance.
+    """
+    global _gcs_client
+    if _gcs_client is None:
+        with _gcs_client_lock:
+            if _gcs_client is None:
+                # Lazy import to keep runtime lean when GCS not used
+                from google.cloud import storage  # type: ignore
+                _gcs_client = storage.Client()
+    return _gcs_client
+
+
+def _max_upload_bytes() -> int:
+    """Largest upload downloaded into memory (MCP_MAX_UPLOAD_BYTES, default 20 MiB,
+    Gemini's inline request limit)."""
+    return int(os.getenv("MCP_MAX_UPLOAD_BYTES", str(20 * 1024 * 1024)))
+
+
+def _download_bytes_from_gcs(gcs_uri: str) -> bytes:
+    """Download a gs://bucket/path object into memory with the shared client.
+
+    Gemini receives uploads as inline bytes anyway, so keeping them in memory
+    avoids a second copy in /tmp (which is memory-backed on Cloud Functions).
+    The object's size is checked before anything is buffered, so memory per
+    download is bounded by _max_upload_bytes().
+
+    Args:
+        gcs_uri: Source URI
+
+    Returns:
+        The object's content
+
+    Raises:
+        ValueError: If the object is larger than _max_upload_bytes()
+    """
+    parsed = urlparse(gcs_uri)
+    blob = _get_gcs_client().bucket(parsed.netloc).blob(parsed.path.lstrip("/"))
+    blob.reload()
+    limit = _max_upload_bytes()
+    if blob.size is not None and blob.size > limit:
+        raise ValueError(f"{gcs_uri} is {blob.size} bytes; uploads are limited to {limit} bytes")
+    # Pin the generation that was measured, so a concurrent overwrite cannot slip past the cap
+    return blob.download_as_bytes(if_generation_match=blob.generation)
 
-def _write_json_to_gcs(gcs_uri: str, payload: Dict[str, Any]) -> None:
+
+def _write_json_to_gcs(gcs_uri: str, payload: Dict[str, Any], pretty: bool = False) -> None:
     """Write payload JSON to a GCS URI like gs://bucket/path/file.json.
 
+    The object is stored with Content-Encoding: gzip when MCP_GCS_GZIP=1. Small
+    payloads are uploaded in one request; larger ones are streamed in
+    _GCS_UPLOAD_CHUNK_SIZE chunks rather than buffered whole by the writer.
     Requires the environment to have credentials with storage write access.
+
+    Args:
+        gcs_uri: Destination URI
+        payload: JSON-serializable payload
+        pretty: Indent the output for human readers (compact by default)
     """
     parsed = urlparse(gcs_uri)
     if parsed.scheme != "gs" or not parsed.netloc or not parsed.path:
@@ -761,25 +1547,103 @@ def _write_json_to_gcs(gcs_uri: str, payload: Dict[str, Any]) -> None:
     # strip leading slash from path
     blob_path = parsed.path.lstrip("/")
 
-    # Lazy import to keep runtime lean when GCS not used
-    from google.cloud import storage  # type: ignore
-
-    client = storage.Client()
+    client = _get_gcs_client()
     bucket = client.bucket(bucket_name)
     blob = bucket.blob(blob_path)
-    blob.upload_from_string(
-        data=json.dumps(payload, ensure_ascii=False, indent=2),
-        content_type="application/json",
+    compress = _gcs_gzip_enabled()
+    if compress:
+        blob.content_encoding = "gzip"
+    if orjson is not None or compress:
+        # orjson encodes straight to UTF-8 bytes, so there is no intermediate str copy.
+        # gzip output is always built in memory: gzip.open() flushes into the blob
+        # writer, which the resumable upload rejects.
+        data = _json_dumps(payload, pretty=pretty)
+        if isinstance(data, str):
+            # stdlib json (orjson missing or it rejected the payload)
+            data = data.encode("utf-8")
+        if compress:
+            data = gzip.compress(data, compresslevel=_GCS_GZIP_LEVEL)
+        if len(data) <= _GCS_SINGLE_REQUEST_MAX:
+            # Known size: one upload request, no resumable session to open and finalize
+            blob.upload_from_string(data, content_type="application/json")
+            return
+        with blob.open("wb", chunk_size=_GCS_UPLOAD_CHUNK_SIZE, content_type="application/json") as fh:
+            fh.write(data)
+        return
+
+    with blob.open("w", chunk_size=_GCS_UPLOAD_CHUNK_SIZE, content_type="application/json") as fh:
+        _json_dump_stdlib(payload, fh, pretty)
+
+
+def _json_dump_stdlib(payload: Any, fh: Any, pretty: bool) -> None:
+    if pretty:
+        json.dump(payload, fh, ensure_ascii=False, indent=2)
+    else:
+        json.dump(payload, fh, ensure_ascii=False, separators=(",", ":"))
+
+
+def _read_json_from_gcs(gcs_uri: str) -> Any:
+    """Read and parse a JSON object from a GCS URI like gs://bucket/path/file.json."""
+    parsed = urlparse(gcs_uri)
+    if parsed.scheme != "gs" or not parsed.netloc or not parsed.path:
+        raise ValueError("GCS URI must be in the form gs://bucket/path/file.json")
+
+    client = _get_gcs_client()
+    blob = client.bucket(parsed.netloc).blob(parsed.path.lstrip("/"))
+    data = blob.download_as_bytes()
+    if data[:2] == b"\x1f\x8b":
+        # gzip-encoded object fetched without transcoding
+        data = gzip.decompress(data)
+    return _json_loads(data)
+
+
+def _stream_analysis(data: dict):
+    """Yield NDJSON lines: one {"name", "result"} per finished analysis, then the full payload.
+
+    mcp_analyze runs in a worker thread and pushes results through a queue, so the
+    first line is sent as soon as the fastest analysis (or a cache hit) is ready.
+    The last line is {"status": <http status>, "summary": <mcp_analyze response>}.
+    """
+    import queue
+
+    events: "queue.Queue[Tuple[str, Any]]" = queue.Queue()
+    worker = threading.Thread(
+        target=lambda: events.put(("done", mcp_analyze(data, on_result=lambda n, r: events.put(("result", (n, r)))))),
+        daemon=True,
     )
+    worker.start()
+
+    while True:
+        kind, value = events.get()
+        if kind == "result":
+            name, result = value
+            line = _json_dumps({"name": name, "result": result})
+            yield (line if isinstance(line, bytes) else line.encode("utf-8")) + b"\n"
+            continue
+        body, status, _ = value
+        body = body if isinstance(body, bytes) else body.encode("utf-8")
+        # The body is already serialized JSON, so splice it in rather than re-encoding it
+        yield b'{"status":' + str(status).encode("ascii") + b',"summary":' + body + b"}\n"
+        return
 
 
 @functions_framework.http
 def hello_http(request):
-    request_json = request.get_json(silent=True)
+    try:
+        request_json = _json_loads(request.get_data() or b"{}")
+    except ValueError:
+        request_json = None
 
     print("Request Payload :",request_json)
 
-    _, status, __ = mcp_analyze(request_json)
+    # Opt-in streaming: clients sending Accept: application/x-ndjson get each analysis as it finishes
+    accept = (getattr(request, "headers", None) or {}).get("Accept", "") or ""
+    if "application/x-ndjson" in accept and isinstance(request_json, dict):
+        from flask import Response, stream_with_context
+        return Response(stream_with_context(_stream_analysis(request_json)), mimetype="application/x-ndjson")
+
+    # Only the status is returned; results go to destination_gcs
+    _, status, __ = mcp_analyze(request_json, include_body=False)
     return {
         "status" : status
     }
@@ -16,56 +16,102 @@ __version__ = "1.1.0"
 __author__ = "Aman Ulla"
 __email__ = "connectamanulla@gmail.com"
 
-from .core.base import BaseRiskAnalyzer, BaseMCPTool
-from .core.gemini_client import GeminiLLM
-from .models.risk_models import (
-    RiskLevel, 
-    RiskIndicator, 
-    RiskCategory, 
-    StartupRiskAnalysis,
-    StartupData
-)
+import importlib
 
-# Import all analyzers
-from .analyzers.market_risk import MarketRiskAnalyzer, MarketRiskMCPTool
-from .analyzers.product_risk import ProductRiskAnalyzer, ProductRiskMCPTool
-from .analyzers.team_risk import TeamRiskAnalyzer, TeamRiskMCPTool
-from .analyzers.social_coverage_risk import SocialCoverageRiskAnalyzer
-from .analyzers.social_coverage_risk_mcp import SocialCoverageRiskMCPTool
-from .analyzers.financial_risk import FinancialRiskAnalyzer, FinancialRiskMCPTool
-from .analyzers.customer_risk import CustomerRiskAnalyzer, CustomerRiskMCPTool
-from .analyzers.operational_risk import OperationalRiskAnalyzer, OperationalRiskMCPTool
-from .analyzers.competitive_risk import CompetitiveRiskAnalyzer, CompetitiveRiskMCPTool
-from .analyzers.legal_risk import LegalRiskAnalyzer, LegalRiskMCPTool
-from .analyzers.exit_risk import ExitRiskAnalyzer, ExitRiskMCPTool
-from .analyzers.peer_benchmark import PeerBenchmarkAnalyzer, PeerBenchmarkMCPTool
-from .analyzers.lv_analysis import LVAnalysisAnalyzer
-from .tools.lv_analysis_tool import LVAnalysisMCPTool
+# Public names are imported lazily (PEP 562) so that importing the package, or a
+# single tool, does not pull in every analyzer, SDK and HTTP client up front.
+_LAZY_IMPORTS = {
+    # Core classes
+    "BaseRiskAnalyzer": ".core.base",
+    "BaseMCPTool": ".core.base",
+    "GeminiLLM": ".core.gemini_client",
+    "CachedLLM": ".core.cached_client",
+    "ResponseCache": ".core.cached_client",
+    "SemanticCache": ".core.semantic_cache",
+    "AnalysisRouter": ".core.router",
+    
+    # Models
+    "RiskLevel": ".models.risk_models",
+    "RiskIndicator": ".models.risk_models",
+    "RiskCategory": ".models.risk_models",
+    "StartupRiskAnalysis": ".models.risk_models",
+    "StartupData": ".models.risk_models",
+    
+    # Individual analyzers
+    "MarketRiskAnalyzer": ".analyzers.market_risk",
+    "ProductRiskAnalyzer": ".analyzers.product_risk",
+    "TeamRiskAnalyzer": ".analyzers.team_risk",
+    "SocialCoverageRiskAnalyzer": ".analyzers.social_coverage_risk",
+    "FinancialRiskAnalyzer": ".analyzers.financial_risk",
+    "CustomerRiskAnalyzer": ".analyzers.customer_risk",
+    "OperationalRiskAnalyzer": ".analyzers.operational_risk",
+    "CompetitiveRiskAnalyzer": ".analyzers.competitive_risk",
+    "LegalRiskAnalyzer": ".analyzers.legal_risk",
+    "ExitRiskAnalyzer": ".analyzers.exit_risk",
+    "PeerBenchmarkAnalyzer": ".analyzers.peer_benchmark",
+    "LVAnalysisAnalyzer": ".analyzers.lv_analysis",
+    "BatchedRiskAnalyzer": ".analyzers.batched_risk",
+    
+    # MCP Tools
+    "MarketRiskMCPTool": ".analyzers.market_risk",
+    "ProductRiskMCPTool": ".analyzers.product_risk",
+    "TeamRiskMCPTool": ".analyzers.team_risk",
+    "SocialCoverageRiskMCPTool": ".analyzers.social_coverage_risk_mcp",
+    "FinancialRiskMCPTool": ".analyzers.financial_risk",
+    "CustomerRiskMCPTool": ".analyzers.customer_risk",
+    "OperationalRiskMCPTool": ".analyzers.operational_risk",
+    "CompetitiveRiskMCPTool": ".analyzers.competitive_risk",
+    "LegalRiskMCPTool": ".analyzers.legal_risk",
+    "ExitRiskMCPTool": ".analyzers.exit_risk",
+    "PeerBenchmarkMCPTool": ".analyzers.peer_benchmark",
+    "LVAnalysisMCPTool": ".tools.lv_analysis_tool",
+    
+    # Comprehensive scanner and research tools
+    "ComprehensiveRiskScanner": ".core.comprehensive_scanner",
+    "SerpNewsMCPTool": ".tools.serp_news",
+    "SerpPdfSearchMCPTool": ".tools.serp_pdf_search",
+    "PerplexityMCPTool": ".tools.perplexity_search",
+    "UploadExtractor": ".tools.upload_extractor",
+    "KnowledgeGraphMCPTool": ".tools.knowledge_graph",
+    "LinkedInAnalyzerMCPTool": ".tools.linkedin_analyzer",
+    "GoogleContentModerationMCPTool": ".tools.content_moderation",
+    "SocialMediaResearchMCPTool": ".tools.social_media_research",
+    
+    # Google Cloud tools
+    "VertexAIRAGMCPTool": ".tools.vertex_ai_rag",
+    "VertexAIAgentBuilderMCPTool": ".tools.vertex_ai_agent_builder",
+}
+
+
+def __getattr__(name):
+    if name == "VERTEX_AI_AVAILABLE":
+        try:
+            importlib.import_module(".tools.vertex_ai_rag", __name__)
+            importlib.import_module(".tools.vertex_ai_agent_builder", __name__)
+            value = True
+        except ImportError:
+            value = False
+    elif name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
 
-# Import comprehensive scanner
-from .core.comprehensive_scanner import ComprehensiveRiskScanner
-from .tools.serp_news import SerpNewsMCPTool
-from .tools.serp_pdf_search import SerpPdfSearchMCPTool
-from .tools.perplexity_search import PerplexityMCPTool
-from .tools.upload_extractor import UploadExtractor
-from .tools.knowledge_graph import KnowledgeGraphMCPTool
-from .tools.linkedin_analyzer import LinkedInAnalyzerMCPTool
-from .tools.content_moderation import GoogleContentModerationMCPTool
-from .tools.social_media_research import SocialMediaResearchMCPTool
 
-# Conditional imports for Google Cloud tools
-try:
-    from .tools.vertex_ai_rag import VertexAIRAGMCPTool
-    from .tools.vertex_ai_agent_builder import VertexAIAgentBuilderMCPTool
-    VERTEX_AI_AVAILABLE = True
-except ImportError:
-    VERTEX_AI_AVAILABLE = False
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS) | {"VERTEX_AI_AVAILABLE"})
+
 
 __all__ = [
     # Core classes
     "BaseRiskAnalyzer",
     "BaseMCPTool", 
     "GeminiLLM",
+    "CachedLLM",
+    "ResponseCache",
+    "SemanticCache",
+    "AnalysisRouter",
     
     # Models
     "RiskLevel",
@@ -87,6 +133,7 @@ __all__ = [
     "ExitRiskAnalyzer",
     "PeerBenchmarkAnalyzer",
     "LVAnalysisAnalyzer",
+    "BatchedRiskAnalyzer",
     
     # MCP Tools
     "MarketRiskMCPTool",
@@ -112,11 +159,8 @@ __all__ = [
     "LinkedInAnalyzerMCPTool",
     "GoogleContentModerationMCPTool",
     "SocialMediaResearchMCPTool",
+    
+    # Google Cloud tools
+    "VertexAIRAGMCPTool",
+    "VertexAIAgentBuilderMCPTool",
 ]
-
-# Add Vertex AI tools to __all__ if available
-if VERTEX_AI_AVAILABLE:
-    __all__.extend([
-        "VertexAIRAGMCPTool",
-        "VertexAIAgentBuilderMCPTool",
-    ])
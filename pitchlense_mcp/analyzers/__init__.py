@@ -14,6 +14,7 @@ from .competitive_risk import CompetitiveRiskAnalyzer
 from .legal_risk import LegalRiskAnalyzer
 from .exit_risk import ExitRiskAnalyzer
 from .lv_analysis import LVAnalysisAnalyzer
+from .batched_risk import BatchedRiskAnalyzer
 
 __all__ = [
     "MarketRiskAnalyzer",
@@ -26,4 +27,5 @@ __all__ = [
     "LegalRiskAnalyzer",
     "ExitRiskAnalyzer",
     "LVAnalysisAnalyzer",
+    "BatchedRiskAnalyzer",
 ]
@@ -0,0 +1,199 @@
+"""
+Batched Risk Analyzer for PitchLense MCP Package.
+
+Runs several risk categories through a single LLM call instead of one call per
+category, so the startup information is sent once rather than once per analyzer.
+"""
+
+import asyncio
+import inspect
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List
+from ..core.base import BaseRiskAnalyzer
+from ..prompts import BATCHED_RISK_PROMPT
+from ..utils.json_extractor import extract_json_from_response
+from ..utils.async_utils import run_in_thread
+
+
+class BatchedRiskAnalyzer:
+    """
+    Fuse multiple risk analyzers into batched LLM calls.
+
+    Categories missing from the batched response, and inputs longer than
+    max_input_chars, fall back to the per-analyzer path (run in parallel).
+
+    Usage example:
+        >>> analyzers = {"Market Risk Analysis": MarketRiskAnalyzer(llm), "Team Risk Analysis": TeamRiskAnalyzer(llm)}
+        >>> results = BatchedRiskAnalyzer(llm, analyzers).analyze(startup_data)
+        >>> results["Market Risk Analysis"]["category_score"]
+    """
+
+    def __init__(
+        self,
+        llm_client,
+        analyzers: Dict[str, BaseRiskAnalyzer],
+        max_input_chars: int = 200000,
+        max_batch_size: int = 10
+    ):
+        """
+        Initialize the batched analyzer.
+
+        Args:
+            llm_client: LLM client instance for analysis
+            analyzers: Mapping of result key to the analyzer for that category
+            max_input_chars: Inputs longer than this use the per-analyzer path. The
+                default (~50k tokens plus the category list) sits well inside Gemini's
+                context window, so synthesized multi-document decks still batch
+            max_batch_size: Maximum number of categories per LLM call
+        """
+        self.llm_client = llm_client
+        self.analyzers = analyzers
+        self.max_input_chars = max_input_chars
+        self.max_batch_size = max(1, max_batch_size)
+
+    @staticmethod
+    def _json_key(name: str) -> str:
+        """Convert a result key into a JSON-friendly key for the prompt."""
+        return re.sub(r"[^a-z0-9]+", "_", name.lower()).strip("_")
+
+    def _build_prompt(self, names: List[str], startup_data: str) -> str:
+        """Build the batched prompt for the given result keys."""
+        categories = []
+        for name in names:
+            analyzer = self.analyzers[name]
+            indicators = ", ".join(analyzer.get_risk_indicators())
+            categories.append(f"- {self._json_key(name)}: {analyzer.category_name} ({indicators})")
+        return BATCHED_RISK_PROMPT.format(
+            startup_data=startup_data,
+            categories="\n".join(categories)
+        )
+
+    def _batch_request(self, names: List[str], startup_data: str) -> Dict[str, Any]:
+        """Build the predict() keyword arguments for one batch."""
+        return {
+            "system_message": "You are an expert startup risk analyst. Maintain professional language and avoid inappropriate content. Focus strictly on business and financial risk assessment.",
+            "user_message": self._build_prompt(names, startup_data),
+            "tool_name": "BatchedRiskAnalyzer",
+            "method_name": "analyze",
+            # JSON mode: the reply is a single object keyed by category
+            "response_mime_type": "application/json"
+        }
+
+    def _parse_batch(self, names: List[str], response_text: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Split a batched response into per-category results.
+
+        Returns:
+            Results for the categories that were parsed successfully
+        """
+        parsed = extract_json_from_response(response_text)
+        if not isinstance(parsed, dict):
+            return {}
+
+        results = {}
+        for name in names:
+            category = parsed.get(self._json_key(name))
+            if isinstance(category, dict) and "overall_risk_level" in category:
+                category.setdefault("category_name", self.analyzers[name].category_name)
+                results[name] = category
+        return results
+
+    def _analyze_batch(self, names: List[str], startup_data: str) -> Dict[str, Dict[str, Any]]:
+        """Analyze one batch of categories with a single LLM call."""
+        try:
+            result = self.llm_client.predict(**self._batch_request(names, startup_data))
+            return self._parse_batch(names, result.get("response", ""))
+        except Exception:
+            return {}
+
+    async def _aanalyze_batch(self, names: List[str], startup_data: str) -> Dict[str, Dict[str, Any]]:
+        """Async variant of _analyze_batch()."""
+        apredict = getattr(self.llm_client, "apredict", None)
+        if not inspect.iscoroutinefunction(apredict):
+            return await run_in_thread(self._analyze_batch, names, startup_data)
+        try:
+            result = await apredict(**self._batch_request(names, startup_data))
+            return self._parse_batch(names, result.get("response", ""))
+        except Exception:
+            return {}
+
+    def _analyze_individually(self, names: List[str], startup_data: str) -> Dict[str, Dict[str, Any]]:
+        """Run the per-analyzer path for the given result keys in parallel."""
+        if not names:
+            return {}
+        with ThreadPoolExecutor(max_workers=len(names)) as executor:
+            futures = {name: executor.submit(self.analyzers[name].analyze, startup_data) for name in names}
+            return {name: future.result() for name, future in futures.items()}
+
+    async def _aanalyze_individually(self, names: List[str], startup_data: str) -> Dict[str, Dict[str, Any]]:
+        """Async variant of _analyze_individually()."""
+        results = await asyncio.gather(*(self.analyzers[name].aanalyze(startup_data) for name in names))
+        return dict(zip(names, results))
+
+    def _batches(self, names: List[str]) -> List[List[str]]:
+        return [names[i:i + self.max_batch_size] for i in range(0, len(names), self.max_batch_size)]
+
+    def analyze(self, startup_data: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Perform risk analysis for all configured categories.
+
+        Args:
+            startup_data: String containing comprehensive startup information
+
+        Returns:
+            Dictionary mapping each analyzer key to its risk analysis result
+        """
+        names = list(self.analyzers)
+        if not self.llm_client or len(startup_data) > self.max_input_chars:
+            return self._analyze_individually(names, startup_data)
+
+        batches = self._batches(names)
+        results: Dict[str, Dict[str, Any]] = {}
+        with ThreadPoolExecutor(max_workers=len(batches)) as executor:
+            for batch_results in executor.map(lambda batch: self._analyze_batch(batch, startup_data), batches):
+                results.update(batch_results)
+
+        missing = [name for name in names if name not in results]
+        results.update(self._analyze_individually(missing, startup_data))
+        return {name: results[name] for name in names}
+
+    async def aanalyze(self, startup_data: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Async variant of analyze(); batches and fallbacks run via asyncio.gather.
+
+        Args:
+            startup_data: String containing comprehensive startup information
+
+        Returns:
+            Dictionary mapping each analyzer key to its risk analysis result
+        """
+        names = list(self.analyzers)
+        results = await self.aanalyze_batched(startup_data)
+        missing = [name for name in names if name not in results]
+        results.update(await self._aanalyze_individually(missing, startup_data))
+        return {name: results[name] for name in names}
+
+    async def aanalyze_batched(self, startup_data: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Run only the batched LLM calls, without the per-analyzer fallback.
+
+        Lets callers schedule (and time-box) the fallback for the missing
+        categories themselves.
+
+        Args:
+            startup_data: String containing comprehensive startup information
+
+        Returns:
+            Results for the categories parsed from the batched responses (empty when
+            the input is too long to batch)
+        """
+        if not self.llm_client or len(startup_data) > self.max_input_chars:
+            return {}
+
+        results: Dict[str, Dict[str, Any]] = {}
+        for batch_results in await asyncio.gather(
+            *(self._aanalyze_batch(batch, startup_data) for batch in self._batches(list(self.analyzers)))
+        ):
+            results.update(batch_results)
+        return results
@@ -2,9 +2,11 @@
 LV-Analysis MCP Tool for detailed startup analysis based on hackathon requirements.
 """
 
+import asyncio
+import functools
 from typing import Dict, Any, List, Optional
-from fastmcp import FastMCP
 from ..core.base import BaseMCPTool
+from ..utils.async_utils import run_in_thread
 
 
 class LVAnalysisAnalyzer:
@@ -14,6 +16,17 @@ class LVAnalysisAnalyzer:
         self.llm_client = llm_client
         self.perplexity_tool = perplexity_tool
 
+    # Perplexity queries backing the market research section
+    RESEARCH_QUERIES = [
+        "Indian FMCG market size 2024 healthy food trends",
+        "millet based products market India growth statistics",
+        "clean label food brands India market analysis",
+        "women led startups India FMCG sector trends",
+        "B2B food distribution India market opportunities"
+    ]
+
+    SYSTEM_MESSAGE = "You are an expert startup business analyst specializing in detailed business note generation for investment evaluation. Maintain professional language and avoid inappropriate content. Focus strictly on business and investment analysis."
+
     def analyze(self, startup_text: str) -> Dict[str, Any]:
         """
         Perform detailed LV-Analysis based on hackathon requirements.
@@ -26,11 +39,45 @@ class LVAnalysisAnalyzer:
         """
         # Get additional market information using Perplexity
         market_research = self._get_market_research(startup_text)
-        market_info = market_research.get("research_text", "")
-        market_sources = market_research.get("sources", [])
-        
+        prompt = self._build_analysis_prompt(self._build_context(startup_text, market_research))
+
+        try:
+            response = self.llm_client.predict(
+                system_message=self.SYSTEM_MESSAGE,
+                user_message=prompt
+            )
+            return self._build_result(response, startup_text, market_research)
+        except Exception as e:
+            return self._error_result(e)
+
+    async def aanalyze(self, startup_text: str) -> Dict[str, Any]:
+        """
+        Async variant of analyze(): the Perplexity queries run concurrently and
+        the LLM call uses the client's async path.
+
+        Args:
+            startup_text: The startup description and details
+
+        Returns:
+            Detailed analysis in hackathon format
+        """
+        market_research = await self._aget_market_research(startup_text)
+        prompt = self._build_analysis_prompt(self._build_context(startup_text, market_research))
+
+        try:
+            response = await self.llm_client.apredict(
+                system_message=self.SYSTEM_MESSAGE,
+                user_message=prompt
+            )
+            return self._build_result(response, startup_text, market_research)
+        except Exception as e:
+            return self._error_result(e)
+
+    @staticmethod
+    def _build_context(startup_text: str, market_research: Dict[str, Any]) -> str:
         # Combine startup text with market research
-        enhanced_context = f"""
+        market_info = market_research.get("research_text", "")
+        return f"""
         Startup Information:
         {startup_text}
         
@@ -39,30 +86,27 @@ class LVAnalysisAnalyzer:
         
         Please analyze this startup and provide a detailed business note in the following format:
         """
-        
-        prompt = self._build_analysis_prompt(enhanced_context)
-        
-        try:
-            response = self.llm_client.predict(
-                system_message="You are an expert startup business analyst specializing in detailed business note generation for investment evaluation. Maintain professional language and avoid inappropriate content. Focus strictly on business and investment analysis.",
-                user_message=prompt
-            )
-            analysis_result = response.get("response", "")
-            
-            # Extract structured data from the response
-            structured_analysis = self._extract_structured_data(analysis_result, startup_text, market_info)
-            
-            # Add sources to the analysis result
-            structured_analysis["sources"] = market_sources
-            
-            return structured_analysis
-            
-        except Exception as e:
-            return {
-                "error": f"Analysis failed: {str(e)}",
-                "category_name": "LV-Analysis",
-                "analysis_type": "detailed_business_note"
-            }
+
+    def _build_result(self, response: Dict[str, Any], startup_text: str, market_research: Dict[str, Any]) -> Dict[str, Any]:
+        analysis_result = response.get("response", "")
+
+        # Extract structured data from the response
+        structured_analysis = self._extract_structured_data(
+            analysis_result, startup_text, market_research.get("research_text", "")
+        )
+
+        # Add sources to the analysis result
+        structured_analysis["sources"] = market_research.get("sources", [])
+
+        return structured_analysis
+
+    @staticmethod
+    def _error_result(exc: Exception) -> Dict[str, Any]:
+        return {
+            "error": f"Analysis failed: {str(exc)}",
+            "category_name": "LV-Analysis",
+            "analysis_type": "detailed_business_note"
+        }
 
     def _get_market_research(self, startup_text: str) -> Dict[str, Any]:
         """Get market research data using Perplexity."""
@@ -73,50 +117,72 @@ class LVAnalysisAnalyzer:
             }
             
         try:
-            # Extract key terms for market research
-            research_queries = [
-                "Indian FMCG market size 2024 healthy food trends",
-                "millet based products market India growth statistics",
-                "clean label food brands India market analysis",
-                "women led startups India FMCG sector trends",
-                "B2B food distribution India market opportunities"
-            ]
-            
-            market_data = []
-            all_sources = []
-            for query in research_queries:
+            results = []
+            for query in self.RESEARCH_QUERIES:
                 try:
-                    result = self.perplexity_tool.search_perplexity(query)
-                    if result and "answer" in result:
-                        market_data.append(f"Query: {query}\nResult: {result['answer']}\n")
-                        # Collect sources
-                        sources = result.get("sources", [])
-                        if sources:
-                            all_sources.extend(sources)
+                    results.append(self.perplexity_tool.search_perplexity(query))
                 except Exception as e:
-                    print(f"Perplexity search failed for {query}: {e}")
-                    continue
-            
-            # Deduplicate sources by URL
-            seen_urls = set()
-            unique_sources = []
-            for source in all_sources:
-                url = source.get("url")
-                if url and url not in seen_urls:
-                    seen_urls.add(url)
-                    unique_sources.append(source)
+                    results.append(e)
+            return self._summarize_research(results)
             
+        except Exception as e:
             return {
-                "research_text": "\n".join(market_data),
-                "sources": unique_sources
+                "research_text": f"Market research unavailable: {str(e)}",
+                "sources": []
             }
-            
+
+    async def _aget_market_research(self, startup_text: str) -> Dict[str, Any]:
+        """Get market research data using concurrent Perplexity searches."""
+        if not self.perplexity_tool:
+            return {
+                "research_text": "Market research unavailable: Perplexity tool not provided",
+                "sources": []
+            }
+
+        try:
+            search = getattr(self.perplexity_tool, "asearch_perplexity", None)
+            if search is None:
+                search = functools.partial(run_in_thread, self.perplexity_tool.search_perplexity)
+            results = await asyncio.gather(
+                *(search(query) for query in self.RESEARCH_QUERIES), return_exceptions=True
+            )
+            return self._summarize_research(results)
+
         except Exception as e:
             return {
                 "research_text": f"Market research unavailable: {str(e)}",
                 "sources": []
             }
 
+    def _summarize_research(self, results: List[Any]) -> Dict[str, Any]:
+        """Combine per-query Perplexity results (or exceptions) in query order."""
+        market_data = []
+        all_sources = []
+        for query, result in zip(self.RESEARCH_QUERIES, results):
+            if isinstance(result, BaseException):
+                print(f"Perplexity search failed for {query}: {result}")
+                continue
+            if result and "answer" in result:
+                market_data.append(f"Query: {query}\nResult: {result['answer']}\n")
+                # Collect sources
+                sources = result.get("sources", [])
+                if sources:
+                    all_sources.extend(sources)
+
+        # Deduplicate sources by URL
+        seen_urls = set()
+        unique_sources = []
+        for source in all_sources:
+            url = source.get("url")
+            if url and url not in seen_urls:
+                seen_urls.add(url)
+                unique_sources.append(source)
+
+        return {
+            "research_text": "\n".join(market_data),
+            "sources": unique_sources
+        }
+
     def _build_analysis_prompt(self, context: str) -> str:
         """Build the analysis prompt for the LLM."""
         return f"""
@@ -28,39 +28,27 @@ class PeerBenchmarkAnalyzer(BaseRiskAnalyzer):
     def get_analysis_prompt(self) -> str:
         return PEER_BENCHMARK_PROMPT
     
-    def analyze(self, startup_data: str) -> Dict[str, Any]:
-        """
-        Perform peer benchmarking analysis for the given startup data.
+    def _build_llm_request(self, startup_data: str) -> Dict[str, Any]:
+        """Build the peer benchmarking predict() arguments."""
+        prompt = self.get_analysis_prompt()
+        # Format the prompt with the startup data
+        full_prompt = prompt.format(startup_data=startup_data)
+        return {
+            "system_message": "You are an expert venture analyst specializing in benchmarking startups against sector peers. Maintain professional language and avoid inappropriate content. Focus strictly on business and investment analysis.",
+            "user_message": full_prompt,
+            "tool_name": "PeerBenchmarkAnalyzer",
+            "method_name": "analyze"
+        }
+    
+    def _parse_llm_response(self, response_text: str) -> Dict[str, Any]:
+        """Parse the benchmark JSON and map it onto the standard risk format."""
+        analysis_result = extract_json_from_response(response_text)
         
-        Args:
-            startup_data: String containing comprehensive startup information
-            
-        Returns:
-            Dictionary containing peer benchmarking analysis results
-        """
-        try:
-            prompt = self.get_analysis_prompt()
-            # Format the prompt with the startup data
-            full_prompt = prompt.format(startup_data=startup_data)
-            
-            # Use the LLM client to generate analysis
-            result = self.llm_client.predict(
-                system_message="You are an expert venture analyst specializing in benchmarking startups against sector peers. Maintain professional language and avoid inappropriate content. Focus strictly on business and investment analysis.",
-                user_message=full_prompt
-            )
-            
-            # Parse the response using the JSON extractor
-            response_text = result.get("response", "")
-            analysis_result = extract_json_from_response(response_text)
-            
-            if analysis_result is not None:
-                # Transform the peer benchmark result to match the expected structure
-                return self._transform_to_standard_format(analysis_result)
-            else:
-                return self._create_fallback_response(response_text, "JSON extraction failed")
-                
-        except Exception as e:
-            return self._create_error_response(str(e))
+        if analysis_result is not None:
+            # Transform the peer benchmark result to match the expected structure
+            return self._transform_to_standard_format(analysis_result)
+        else:
+            return self._create_fallback_response(response_text, "JSON extraction failed")
     
     def _transform_to_standard_format(self, benchmark_result: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -4,13 +4,40 @@ Core module for PitchLense MCP package.
 Contains base classes, Gemini integration, and core functionality.
 """
 
-from .base import BaseRiskAnalyzer, BaseMCPTool
-from .gemini_client import GeminiLLM
-from .comprehensive_scanner import ComprehensiveRiskScanner
+import importlib
+
+# Imported lazily so that e.g. importing core.base does not load the Gemini SDK
+_LAZY_IMPORTS = {
+    "BaseRiskAnalyzer": ".base",
+    "BaseMCPTool": ".base",
+    "GeminiLLM": ".gemini_client",
+    "CachedLLM": ".cached_client",
+    "ResponseCache": ".cached_client",
+    "SemanticCache": ".semantic_cache",
+    "AnalysisRouter": ".router",
+    "ComprehensiveRiskScanner": ".comprehensive_scanner",
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = [
     "BaseRiskAnalyzer",
     "BaseMCPTool", 
     "GeminiLLM",
+    "CachedLLM",
+    "ResponseCache",
+    "SemanticCache",
+    "AnalysisRouter",
     "ComprehensiveRiskScanner",
 ]
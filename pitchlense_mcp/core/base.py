@@ -5,12 +5,13 @@ Provides abstract base classes and common functionality for all risk analyzers.
 """
 
 from abc import ABC, abstractmethod
+import inspect
 from typing import Dict, Any, Optional, List
-from fastmcp import FastMCP
 import json
 
 from ..models.risk_models import RiskCategory, RiskLevel, StartupData
 from ..utils.json_extractor import extract_json_from_response
+from ..utils.async_utils import run_in_thread
 
 
 class BaseLLM(ABC):
@@ -44,6 +45,30 @@ class BaseLLM(ABC):
         """
         pass
     
+    async def apredict(
+        self, 
+        system_message: str, 
+        user_message: str, 
+        image_base64: Optional[str] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Async variant of predict().
+        
+        The default runs predict() in a worker thread; providers with a native
+        async client should override it.
+        
+        Args:
+            system_message: System instruction for the model
+            user_message: User's input message
+            image_base64: Optional base64 encoded image
+            **kwargs: Extra provider arguments (e.g. tool_name)
+            
+        Returns:
+            Dictionary containing the response and usage information
+        """
+        return await run_in_thread(self.predict, system_message, user_message, image_base64, **kwargs)
+    
     @abstractmethod
     async def predict_stream(self, user_message: str):
         """
@@ -111,32 +136,75 @@ class BaseRiskAnalyzer(ABC):
             if not self.llm_client:
                 return self._create_error_response("LLM client not configured")
             
-            prompt = self.get_analysis_prompt()
-            # Format the prompt with the startup data
-            full_prompt = prompt.format(startup_data=startup_data)
-            
             # Use the LLM client to generate analysis
-            result = self.llm_client.predict(
-                system_message="You are an expert startup risk analyst. Maintain professional language and avoid inappropriate content. Focus strictly on business and financial risk assessment.",
-                user_message=full_prompt,
-                tool_name=f"{self.category_name}Analyzer",
-                method_name="analyze"
-            )
-            
-            # Parse the response using the JSON extractor
-            response_text = result.get("response", "")
-            # Extract JSON from the response first; don't treat mere mentions of the word
-            # "error" in normal prose as actual failures.
-            analysis_result = extract_json_from_response(response_text)
-            
-            if analysis_result is not None:
-                return analysis_result
-            else:
-                return self._create_fallback_response(response_text, "JSON extraction failed")
+            result = self.llm_client.predict(**self._build_llm_request(startup_data))
+            return self._parse_llm_response(result.get("response", ""))
                 
         except Exception as e:
             return self._create_error_response(str(e))
     
+    async def aanalyze(self, startup_data: str) -> Dict[str, Any]:
+        """
+        Async variant of analyze() for asyncio fan-outs.
+        
+        Awaits the client's apredict() when it has one; otherwise runs
+        analyze() in a worker thread.
+        
+        Args:
+            startup_data: String containing comprehensive startup information
+            
+        Returns:
+            Dictionary containing risk analysis results
+        """
+        apredict = getattr(self.llm_client, "apredict", None)
+        if not inspect.iscoroutinefunction(apredict):
+            return await run_in_thread(self.analyze, startup_data)
+        
+        try:
+            result = await apredict(**self._build_llm_request(startup_data))
+            return self._parse_llm_response(result.get("response", ""))
+        except Exception as e:
+            return self._create_error_response(str(e))
+    
+    def _build_llm_request(self, startup_data: str) -> Dict[str, Any]:
+        """
+        Build the keyword arguments for the LLM predict call.
+        
+        Args:
+            startup_data: String containing comprehensive startup information
+            
+        Returns:
+            Dictionary of predict() keyword arguments
+        """
+        prompt = self.get_analysis_prompt()
+        # Format the prompt with the startup data
+        full_prompt = prompt.format(startup_data=startup_data)
+        return {
+            "system_message": "You are an expert startup risk analyst. Maintain professional language and avoid inappropriate content. Focus strictly on business and financial risk assessment.",
+            "user_message": full_prompt,
+            "tool_name": f"{self.category_name}Analyzer",
+            "method_name": "analyze"
+        }
+    
+    def _parse_llm_response(self, response_text: str) -> Dict[str, Any]:
+        """
+        Parse the raw LLM response into the analysis result.
+        
+        Args:
+            response_text: Raw response text from LLM
+            
+        Returns:
+            Dictionary containing risk analysis results
+        """
+        # Extract JSON from the response first; don't treat mere mentions of the word
+        # "error" in normal prose as actual failures.
+        analysis_result = extract_json_from_response(response_text)
+        
+        if analysis_result is not None:
+            return analysis_result
+        else:
+            return self._create_fallback_response(response_text, "JSON extraction failed")
+    
     def _create_fallback_response(self, raw_response: str, error_msg: str = "") -> Dict[str, Any]:
         """
         Create a fallback response when JSON parsing fails.
@@ -193,7 +261,16 @@ class BaseMCPTool:
         """
         self.tool_name = tool_name
         self.description = description
-        self.mcp = FastMCP(tool_name)
+        self._mcp = None
+    
+    @property
+    def mcp(self):
+        """FastMCP server for this tool, created on first use."""
+        if self._mcp is None:
+            # Deferred: fastmcp is slow to import and only needed to serve tools
+            from fastmcp import FastMCP
+            self._mcp = FastMCP(self.tool_name)
+        return self._mcp
     
     def register_tool(self, func):
         """
@@ -221,6 +298,44 @@ class BaseMCPTool:
         # Basic validation - check if it's a non-empty string
         return isinstance(startup_data, str) and len(startup_data.strip()) > 0
     
+    def build_prompt(self, startup_data: str) -> Optional[str]:
+        """
+        Return the full prompt (system + user message) this tool would send.
+        
+        Tools are pure with respect to this prompt, so it identifies the
+        analysis for deduplication. Returns None for tools not backed by a
+        BaseRiskAnalyzer.
+        
+        Args:
+            startup_data: String containing comprehensive startup information
+        """
+        analyzer = getattr(self, "analyzer", None)
+        if not isinstance(analyzer, BaseRiskAnalyzer):
+            return None
+        request = analyzer._build_llm_request(startup_data)
+        return f"{request['system_message']}\0{request['user_message']}"
+    
+    async def aanalyze(self, startup_data: str) -> Dict[str, Any]:
+        """
+        Async analysis through self.analyzer.aanalyze().
+        
+        Mirrors the validation and error handling of the tools' sync
+        analyze_* methods, for tools backed by a BaseRiskAnalyzer.
+        
+        Args:
+            startup_data: String containing comprehensive startup information
+            
+        Returns:
+            Analysis result or standardized error response
+        """
+        if not self.validate_startup_data(startup_data):
+            return self.create_error_response("Invalid startup data format")
+        
+        try:
+            return await self.analyzer.aanalyze(startup_data)
+        except Exception as e:
+            return self.create_error_response(f"Analysis failed: {str(e)}")
+    
     def create_error_response(self, error_message: str) -> Dict[str, Any]:
         """
         Create a standardized error response.
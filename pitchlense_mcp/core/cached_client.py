@@ -0,0 +1,228 @@
+"""
+Response caching for LLM and search calls.
+
+Analysis prompts are deterministic for a given startup description, so repeat
+runs (demos, CI, iterative development) can be served from a keyed on-disk
+cache instead of re-issuing the same requests.
+
+Environment variables:
+    PITCHLENSE_CACHE_DIR: Root cache directory (default: ~/.cache/pitchlense).
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+from ..utils.async_utils import run_in_thread
+
+
+def default_cache_dir() -> str:
+    """Return the root directory used for on-disk caches."""
+    return os.getenv("PITCHLENSE_CACHE_DIR") or os.path.join(
+        os.path.expanduser("~"), ".cache", "pitchlense"
+    )
+
+
+class ResponseCache:
+    """
+    Two-level (in-memory LRU + on-disk JSON) cache for a single namespace.
+
+    Entries are stored as ``<cache_dir>/<namespace>/<key>.json`` and written
+    atomically so concurrent runs never observe partial files.
+    """
+
+    def __init__(self, namespace: str, cache_dir: Optional[str] = None, maxsize: int = 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            namespace: Subdirectory separating unrelated cached calls
+            cache_dir: Root cache directory (defaults to default_cache_dir())
+            maxsize: Maximum number of entries kept in memory
+        """
+        self.directory = os.path.join(cache_dir or default_cache_dir(), namespace)
+        self.maxsize = maxsize
+        self._memory: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Build a stable hex key from the given parts."""
+        raw = "\0".join("" if part is None else str(part) for part in parts)
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=32).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _remember(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._memory[key] = value
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.maxsize:
+                self._memory.popitem(last=False)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None on a miss."""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                value = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        self._remember(key, value)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store value under key in memory and on disk."""
+        self._remember(key, value)
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(value, f)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError):
+            # Disk cache is best-effort; the in-memory entry is still usable
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def get_or_call(self, key: str, fn: Callable[[], Any], should_cache: Callable[[Any], bool] = None) -> Any:
+        """
+        Return the cached value for key, calling fn and caching its result on a miss.
+
+        Args:
+            key: Cache key (see make_key)
+            fn: Zero-argument callable producing the value
+            should_cache: Optional predicate; results it rejects are not stored
+
+        Returns:
+            Cached or freshly computed value
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        value = fn()
+        if value is not None and (should_cache is None or should_cache(value)):
+            self.set(key, value)
+        return value
+
+
+class CachedLLM:
+    """
+    LLM client wrapper that caches predict() responses by prompt hash.
+
+    Usage example:
+        >>> from pitchlense_mcp import GeminiLLM, CachedLLM
+        >>> llm = CachedLLM(GeminiLLM())
+        >>> llm.predict(system_message="...", user_message="...")  # API call
+        >>> llm.predict(system_message="...", user_message="...")  # cache hit
+    """
+
+    def __init__(self, llm_client, cache_dir: Optional[str] = None, maxsize: int = 1024):
+        """
+        Initialize the cached client.
+
+        Args:
+            llm_client: Wrapped client exposing predict(system_message, user_message, ...)
+            cache_dir: Root cache directory (defaults to default_cache_dir())
+            maxsize: Maximum number of responses kept in memory
+        """
+        self.llm_client = llm_client
+        self.model = getattr(llm_client, "model", type(llm_client).__name__)
+        self.cache = ResponseCache("llm", cache_dir=cache_dir, maxsize=maxsize)
+
+    def predict(
+        self,
+        system_message: str,
+        user_message: str,
+        image_base64: Optional[str] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Return a cached response when available, otherwise call the wrapped client.
+
+        Args:
+            system_message: System instruction for the model
+            user_message: User's input message
+            image_base64: Optional base64 encoded image
+            **kwargs: Passed through to the wrapped client (e.g. tool_name)
+
+        Returns:
+            Dictionary containing the response and usage information
+        """
+        key = self._key(system_message, user_message, image_base64)
+        result = self.cache.get_or_call(
+            key,
+            lambda: self.llm_client.predict(
+                system_message=system_message,
+                user_message=user_message,
+                image_base64=image_base64,
+                **kwargs
+            ),
+            should_cache=self._should_cache,
+        )
+        # Hand out a copy so callers can't mutate the cached entry
+        return dict(result) if isinstance(result, dict) else result
+
+    async def apredict(
+        self,
+        system_message: str,
+        user_message: str,
+        image_base64: Optional[str] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Async variant of predict(); awaits the wrapped client's apredict() on a miss.
+
+        Falls back to running the wrapped predict() in a worker thread when the
+        client has no async path.
+        """
+        key = self._key(system_message, user_message, image_base64)
+        result = self.cache.get(key)
+        if result is None:
+            request = dict(
+                system_message=system_message,
+                user_message=user_message,
+                image_base64=image_base64,
+                **kwargs
+            )
+            apredict = getattr(self.llm_client, "apredict", None)
+            if inspect.iscoroutinefunction(apredict):
+                result = await apredict(**request)
+            else:
+                result = await run_in_thread(self.llm_client.predict, **request)
+            if self._should_cache(result):
+                self.cache.set(key, result)
+        return dict(result) if isinstance(result, dict) else result
+
+    def _key(self, system_message: str, user_message: str, image_base64: Optional[str]) -> str:
+        return ResponseCache.make_key(system_message, user_message, self.model, image_base64)
+
+    @staticmethod
+    def _should_cache(result: Any) -> bool:
+        # Never persist failed or empty generations
+        return isinstance(result, dict) and bool(result.get("response"))
+
+    async def predict_stream(self, user_message: str):
+        """Stream predictions from the wrapped client (not cached)."""
+        async for chunk in self.llm_client.predict_stream(user_message):
+            yield chunk
+
+    def __getattr__(self, name: str):
+        # Expose the wrapped client's other analyzers/attributes unchanged
+        if name == "llm_client":
+            raise AttributeError(name)
+        return getattr(self.llm_client, name)
@@ -6,7 +6,6 @@ Combines all individual risk analyzers to provide comprehensive startup risk ana
 
 from typing import Dict, Any, List
 import re
-from fastmcp import FastMCP
 import json
 
 from .base import BaseMCPTool
@@ -9,6 +9,7 @@ import os
 import base64
 import pathlib
 import time
+import threading
 from typing import Optional, Union, List, Dict, Any
 import requests
 
@@ -20,6 +21,33 @@ except ImportError as e:
 
 from .base import BaseLLM
 from ..utils.token_tracker import token_tracker
+from ..utils.async_utils import run_in_thread
+from ..utils.retry import retry
+from ..utils.concurrency import provider_limit
+
+_http_session: Optional[requests.Session] = None
+_http_session_lock = threading.Lock()
+
+
+def _get_http_session() -> requests.Session:
+    """Return a process-wide requests session so downloads reuse keep-alive connections."""
+    global _http_session
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=32,
+                    pool_maxsize=32,
+                    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _http_session = session
+    return _http_session
 
 
 class GeminiTextGenerator:
@@ -30,27 +58,34 @@ class GeminiTextGenerator:
     and user prompts.
     """
     
-    def __init__(self, api_key: Optional[str] = None, model: str = "gemini-2.5-flash"):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: str = "gemini-2.5-flash",
+        client: Optional["genai.Client"] = None
+    ):
         """
         Initialize the text generator.
         
         Args:
             api_key: Gemini API key (defaults to environment variable)
             model: Model name to use for generation
+            client: Optional shared genai.Client (reuses its connection pool)
         """
         self.api_key = api_key or os.getenv("GEMINI_API_KEY")
         if not self.api_key:
             raise ValueError("Gemini API key is required")
         
         self.model = model
-        self.client = genai.Client(api_key=self.api_key)
+        self.client = client or genai.Client(api_key=self.api_key)
     
     def predict(
         self, 
         user_prompt: str, 
         system_instruction: Optional[str] = None,
         tool_name: str = "GeminiTextGenerator",
-        method_name: str = "predict"
+        method_name: str = "predict",
+        response_mime_type: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Generate text content using Gemini.
@@ -60,24 +95,80 @@ class GeminiTextGenerator:
             system_instruction: Optional system instruction to guide the model
             tool_name: Name of the tool making the call (for tracking)
             method_name: Name of the method (for tracking)
+            response_mime_type: Optional output MIME type (e.g. "application/json" for JSON mode)
             
         Returns:
             Dictionary containing the generated text and metadata
         """
         start_time = time.time()
         
-        config = None
-        if system_instruction:
-            config = types.GenerateContentConfig(
-                system_instruction=system_instruction
-            )
+        response = self._generate(user_prompt, system_instruction, response_mime_type)
         
-        response = self.client.models.generate_content(
-            model=self.model,
-            config=config,
-            contents=user_prompt
-        )
+        return self._build_result(response, user_prompt, system_instruction, tool_name, method_name, start_time)
+    
+    async def apredict(
+        self, 
+        user_prompt: str, 
+        system_instruction: Optional[str] = None,
+        tool_name: str = "GeminiTextGenerator",
+        method_name: str = "predict",
+        response_mime_type: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Generate text content using Gemini's async client.
+        
+        Same arguments and return value as predict(); the request is awaited on
+        the event loop instead of blocking a thread.
+        """
+        start_time = time.time()
+        
+        response = await self._agenerate(user_prompt, system_instruction, response_mime_type)
         
+        return self._build_result(response, user_prompt, system_instruction, tool_name, method_name, start_time)
+    
+    @retry()
+    def _generate(self, user_prompt: str, system_instruction: Optional[str], response_mime_type: Optional[str] = None):
+        """Call generate_content, retrying transient (429/5xx/network) failures."""
+        with provider_limit("gemini"):
+            return self.client.models.generate_content(
+                model=self.model,
+                config=self._build_config(system_instruction, response_mime_type),
+                contents=user_prompt
+            )
+    
+    @retry()
+    async def _agenerate(self, user_prompt: str, system_instruction: Optional[str], response_mime_type: Optional[str] = None):
+        """Async generate_content, retrying transient (429/5xx/network) failures."""
+        async with provider_limit("gemini"):
+            return await self.client.aio.models.generate_content(
+                model=self.model,
+                config=self._build_config(system_instruction, response_mime_type),
+                contents=user_prompt
+            )
+    
+    def _build_config(
+        self,
+        system_instruction: Optional[str],
+        response_mime_type: Optional[str] = None
+    ) -> Optional["types.GenerateContentConfig"]:
+        """Build the generation config for an optional system instruction and output type."""
+        if not system_instruction and not response_mime_type:
+            return None
+        return types.GenerateContentConfig(
+            system_instruction=system_instruction,
+            response_mime_type=response_mime_type
+        )
+    
+    def _build_result(
+        self,
+        response,
+        user_prompt: str,
+        system_instruction: Optional[str],
+        tool_name: str,
+        method_name: str,
+        start_time: float
+    ) -> Dict[str, Any]:
+        """Track token usage for a response and build the result dictionary."""
         # Calculate token usage (approximate)
         input_tokens = self._estimate_tokens(user_prompt + (system_instruction or ""))
         output_tokens = self._estimate_tokens(response.text)
@@ -132,20 +223,26 @@ class GeminiImageAnalyzer:
     or answering questions about image content.
     """
     
-    def __init__(self, api_key: Optional[str] = None, model: str = "gemini-2.5-flash"):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: str = "gemini-2.5-flash",
+        client: Optional["genai.Client"] = None
+    ):
         """
         Initialize the image analyzer.
         
         Args:
             api_key: Gemini API key (defaults to environment variable)
             model: Model name to use for analysis
+            client: Optional shared genai.Client (reuses its connection pool)
         """
         self.api_key = api_key or os.getenv("GEMINI_API_KEY")
         if not self.api_key:
             raise ValueError("Gemini API key is required")
         
         self.model = model
-        self.client = genai.Client(api_key=self.api_key)
+        self.client = client or genai.Client(api_key=self.api_key)
     
     def predict_from_url(
         self, 
@@ -164,16 +261,17 @@ class GeminiImageAnalyzer:
         Returns:
             Dictionary containing the analysis result and metadata
         """
-        image_bytes = requests.get(image_url).content
+        image_bytes = _get_http_session().get(image_url).content
         image = types.Part.from_bytes(
             data=image_bytes, 
             mime_type=mime_type
         )
         
-        response = self.client.models.generate_content(
-            model=self.model,
-            contents=[prompt, image]
-        )
+        with provider_limit("gemini"):
+            response = self.client.models.generate_content(
+                model=self.model,
+                contents=[prompt, image]
+            )
         
         return {
             "text": response.text,
@@ -228,10 +326,11 @@ class GeminiImageAnalyzer:
             mime_type=mime_type
         )
         
-        response = self.client.models.generate_content(
-            model=self.model,
-            contents=[prompt, image]
-        )
+        with provider_limit("gemini"):
+            response = self.client.models.generate_content(
+                model=self.model,
+                contents=[prompt, image]
+            )
         
         # Calculate token usage (approximate)
         input_tokens = self._estimate_tokens(prompt) + self._estimate_image_tokens(image_bytes)
@@ -324,20 +423,26 @@ class GeminiVideoAnalyzer:
     quizzes, or answering questions about video content.
     """
     
-    def __init__(self, api_key: Optional[str] = None, model: str = "gemini-2.5-flash"):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: str = "gemini-2.5-flash",
+        client: Optional["genai.Client"] = None
+    ):
         """
         Initialize the video analyzer.
         
         Args:
             api_key: Gemini API key (defaults to environment variable)
             model: Model name to use for analysis
+            client: Optional shared genai.Client (reuses its connection pool)
         """
         self.api_key = api_key or os.getenv("GEMINI_API_KEY")
         if not self.api_key:
             raise ValueError("Gemini API key is required")
         
         self.model = model
-        self.client = genai.Client(api_key=self.api_key)
+        self.client = client or genai.Client(api_key=self.api_key)
     
     def predict(
         self, 
@@ -377,17 +482,18 @@ class GeminiVideoAnalyzer:
             raise ValueError("Video file size exceeds 20MB limit for Gemini API")
         
         # Create video content using inline data
-        response = self.client.models.generate_content(
-            model=self.model,
-            contents=types.Content(
-                parts=[
-                    types.Part(
-                        inline_data=types.Blob(data=video_bytes, mime_type=mime_type)
-                    ),
-                    types.Part(text=prompt)
-                ]
+        with provider_limit("gemini"):
+            response = self.client.models.generate_content(
+                model=self.model,
+                contents=types.Content(
+                    parts=[
+                        types.Part(
+                            inline_data=types.Blob(data=video_bytes, mime_type=mime_type)
+                        ),
+                        types.Part(text=prompt)
+                    ]
+                )
             )
-        )
         
         return {
             "text": response.text,
@@ -445,20 +551,26 @@ class GeminiAudioAnalyzer:
     descriptions or transcriptions.
     """
     
-    def __init__(self, api_key: Optional[str] = None, model: str = "gemini-2.5-flash"):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: str = "gemini-2.5-flash",
+        client: Optional["genai.Client"] = None
+    ):
         """
         Initialize the audio analyzer.
         
         Args:
             api_key: Gemini API key (defaults to environment variable)
             model: Model name to use for analysis
+            client: Optional shared genai.Client (reuses its connection pool)
         """
         self.api_key = api_key or os.getenv("GEMINI_API_KEY")
         if not self.api_key:
             raise ValueError("Gemini API key is required")
         
         self.model = model
-        self.client = genai.Client(api_key=self.api_key)
+        self.client = client or genai.Client(api_key=self.api_key)
     
     def predict(
         self, 
@@ -498,16 +610,17 @@ class GeminiAudioAnalyzer:
             raise ValueError("Audio file size exceeds 50MB limit for Gemini API")
         
         # Create audio content using inline data
-        response = self.client.models.generate_content(
-            model=self.model,
-            contents=[
-                prompt,
-                types.Part.from_bytes(
-                    data=audio_bytes,
-                    mime_type=mime_type,
-                )
-            ]
-        )
+        with provider_limit("gemini"):
+            response = self.client.models.generate_content(
+                model=self.model,
+                contents=[
+                    prompt,
+                    types.Part.from_bytes(
+                        data=audio_bytes,
+                        mime_type=mime_type,
+                    )
+                ]
+            )
         
         return {
             "text": response.text,
@@ -565,20 +678,26 @@ class GeminiDocumentAnalyzer:
     generating summaries or answering questions about document content.
     """
     
-    def __init__(self, api_key: Optional[str] = None, model: str = "gemini-2.5-flash"):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: str = "gemini-2.5-flash",
+        client: Optional["genai.Client"] = None
+    ):
         """
         Initialize the document analyzer.
         
         Args:
             api_key: Gemini API key (defaults to environment variable)
             model: Model name to use for analysis
+            client: Optional shared genai.Client (reuses its connection pool)
         """
         self.api_key = api_key or os.getenv("GEMINI_API_KEY")
         if not self.api_key:
             raise ValueError("Gemini API key is required")
         
         self.model = model
-        self.client = genai.Client(api_key=self.api_key)
+        self.client = client or genai.Client(api_key=self.api_key)
     
     def predict(
         self, 
@@ -599,21 +718,42 @@ class GeminiDocumentAnalyzer:
         """
         filepath = pathlib.Path(document_path)
         
-        response = self.client.models.generate_content(
-            model=self.model,
-            contents=[
-                types.Part.from_bytes(
-                    data=filepath.read_bytes(),
-                    mime_type=mime_type,
-                ),
-                prompt
-            ]
-        )
+        result = self.predict_from_bytes(filepath.read_bytes(), prompt, mime_type)
+        result["document_path"] = document_path
+        return result
+    
+    def predict_from_bytes(
+        self, 
+        document_bytes: bytes, 
+        prompt: str,
+        mime_type: str = "application/pdf"
+    ) -> Dict[str, Any]:
+        """
+        Analyze a document from bytes (e.g. downloaded straight into memory).
+        
+        Args:
+            document_bytes: Raw document bytes
+            prompt: Question or instruction about the document
+            mime_type: MIME type of the document
+            
+        Returns:
+            Dictionary containing the analysis result and metadata
+        """
+        with provider_limit("gemini"):
+            response = self.client.models.generate_content(
+                model=self.model,
+                contents=[
+                    types.Part.from_bytes(
+                        data=document_bytes,
+                        mime_type=mime_type,
+                    ),
+                    prompt
+                ]
+            )
         
         return {
             "text": response.text,
             "model": self.model,
-            "document_path": document_path,
             "prompt": prompt,
             "mime_type": mime_type
         }
@@ -630,7 +770,8 @@ class GeminiLLM(BaseLLM):
     def __init__(
         self, 
         api_key: Optional[str] = None, 
-        model: str = "gemini-2.5-flash"
+        model: str = "gemini-2.5-flash",
+        client: Optional["genai.Client"] = None
     ):
         """
         Initialize the Gemini LLM with all analyzers.
@@ -638,15 +779,22 @@ class GeminiLLM(BaseLLM):
         Args:
             api_key: Gemini API key (defaults to environment variable)
             model: Model name to use for all operations
+            client: Optional genai.Client to share across GeminiLLM instances
         """
         super().__init__()
         
+        # All analyzers share one client (and so one HTTP connection pool)
+        resolved_key = api_key or os.getenv("GEMINI_API_KEY")
+        if client is None and resolved_key:
+            client = genai.Client(api_key=resolved_key)
+        
         # Initialize all analyzers
-        self.text_generator = GeminiTextGenerator(api_key, model)
-        self.image_analyzer = GeminiImageAnalyzer(api_key, model)
-        self.video_analyzer = GeminiVideoAnalyzer(api_key, model)
-        self.audio_analyzer = GeminiAudioAnalyzer(api_key, model)
-        self.document_analyzer = GeminiDocumentAnalyzer(api_key, model)
+        self.text_generator = GeminiTextGenerator(api_key, model, client=client)
+        self.image_analyzer = GeminiImageAnalyzer(api_key, model, client=client)
+        self.video_analyzer = GeminiVideoAnalyzer(api_key, model, client=client)
+        self.audio_analyzer = GeminiAudioAnalyzer(api_key, model, client=client)
+        self.document_analyzer = GeminiDocumentAnalyzer(api_key, model, client=client)
+        self.client = client
         
         self.model = model
         self.api_key = api_key or os.getenv("GEMINI_API_KEY")
@@ -657,7 +805,8 @@ class GeminiLLM(BaseLLM):
         user_message: str, 
         image_base64: Optional[str] = None,
         tool_name: str = "GeminiLLM",
-        method_name: str = "predict"
+        method_name: str = "predict",
+        response_mime_type: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Generate text prediction with optional image analysis.
@@ -668,6 +817,8 @@ class GeminiLLM(BaseLLM):
             image_base64: Optional base64 encoded image
             tool_name: Name of the tool making the call (for tracking)
             method_name: Name of the method (for tracking)
+            response_mime_type: Optional output MIME type for text generation
+                (e.g. "application/json")
             
         Returns:
             Dictionary containing the response and usage information
@@ -696,7 +847,8 @@ class GeminiLLM(BaseLLM):
                 user_message, 
                 system_message,
                 tool_name=tool_name,
-                method_name=method_name
+                method_name=method_name,
+                response_mime_type=response_mime_type
             )
             usage = result.get("usage", {})
             usage.update({
@@ -708,6 +860,72 @@ class GeminiLLM(BaseLLM):
                 "usage": usage
             }
     
+    async def apredict(
+        self, 
+        system_message: str, 
+        user_message: str, 
+        image_base64: Optional[str] = None,
+        tool_name: str = "GeminiLLM",
+        method_name: str = "predict",
+        response_mime_type: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Async variant of predict() for use with asyncio.gather fan-outs.
+        
+        Text generation awaits Gemini's async client; image analysis has no
+        async path yet and runs predict() in a worker thread.
+        
+        Args:
+            system_message: System instruction for the model
+            user_message: User's input message
+            image_base64: Optional base64 encoded image
+            tool_name: Name of the tool making the call (for tracking)
+            method_name: Name of the method (for tracking)
+            response_mime_type: Optional output MIME type for text generation
+                (e.g. "application/json")
+            
+        Returns:
+            Dictionary containing the response and usage information
+        """
+        if image_base64:
+            return await run_in_thread(
+                self.predict, system_message, user_message, image_base64, tool_name, method_name
+            )
+        
+        result = await self.text_generator.apredict(
+            user_message,
+            system_message,
+            tool_name=tool_name,
+            method_name=method_name,
+            response_mime_type=response_mime_type
+        )
+        usage = result.get("usage", {})
+        usage.update({
+            "model": self.model,
+            "type": "text_generation"
+        })
+        return {
+            "response": result["text"],
+            "usage": usage
+        }
+    
+    @retry()
+    def embed(self, text: str, model: str = "text-embedding-004") -> List[float]:
+        """
+        Embed text with a Gemini embedding model.
+        
+        Args:
+            text: Text to embed
+            model: Embedding model name
+            
+        Returns:
+            Embedding vector
+        """
+        client = self.client or self.text_generator.client
+        with provider_limit("gemini"):
+            response = client.models.embed_content(model=model, contents=text)
+        return list(response.embeddings[0].values)
+    
     async def predict_stream(self, user_message: str):
         """
         Stream predictions (placeholder for future implementation).
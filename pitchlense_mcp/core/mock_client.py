@@ -15,7 +15,7 @@ class MockLLM:
         """Initialize the mock LLM client."""
         pass
     
-    def predict(self, system_message: str, user_message: str, image_base64: str = None) -> Dict[str, Any]:
+    def predict(self, system_message: str, user_message: str, image_base64: str = None, **kwargs) -> Dict[str, Any]:
         """
         Generate a mock prediction response.
         
@@ -23,6 +23,7 @@ class MockLLM:
             system_message: System instruction for the model
             user_message: User's input message
             image_base64: Optional base64 encoded image
+            **kwargs: Ignored tracking arguments (tool_name, method_name)
             
         Returns:
             Dictionary containing a mock response
@@ -78,6 +79,12 @@ class MockLLM:
             }
         }
     
+    async def apredict(self, system_message: str, user_message: str, image_base64: str = None, **kwargs) -> Dict[str, Any]:
+        """
+        Async variant of predict(); returns the same mock response.
+        """
+        return self.predict(system_message, user_message, image_base64, **kwargs)
+    
     async def predict_stream(self, user_message: str):
         """
         Mock streaming prediction (not implemented for testing).
@@ -0,0 +1,88 @@
+"""
+Embedding-based analysis router.
+
+Decides, before any LLM call, which analyses are clearly not applicable to a
+startup (e.g. exit risk for an idea-stage pitch) by comparing the startup
+embedding with "not applicable" prototype descriptions per category. Routed
+categories get a stock result instead of an LLM analysis.
+"""
+
+import threading
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from .semantic_cache import _normalize
+
+
+class AnalysisRouter:
+    """
+    Cosine-to-prototype router for analysis categories.
+
+    Usage example:
+        >>> router = AnalysisRouter(llm.embed, {"Exit Risk Analysis": ["Idea-stage concept with no product or revenue"]})
+        >>> router.predict(llm.embed(startup_text))
+        {'Exit Risk Analysis': 'template'}
+    """
+
+    def __init__(
+        self,
+        embed_fn: Callable[[str], Sequence[float]],
+        skip_prototypes: Dict[str, List[str]],
+        threshold: float = 0.85
+    ):
+        """
+        Initialize the router.
+
+        Args:
+            embed_fn: Function returning the embedding of a text (same model as the query)
+            skip_prototypes: Analysis name -> descriptions of startups it does not apply to
+            threshold: Minimum cosine similarity to a prototype for a category to be skipped
+        """
+        self.embed_fn = embed_fn
+        self.skip_prototypes = skip_prototypes
+        self.threshold = threshold
+        self._vectors: Optional[Dict[str, List[List[float]]]] = None
+        self._lock = threading.Lock()
+
+    def _prototype_vectors(self) -> Dict[str, List[List[float]]]:
+        # Prototypes are embedded once per router, on first use
+        if self._vectors is None:
+            with self._lock:
+                if self._vectors is None:
+                    self._vectors = {
+                        name: [_normalize(self.embed_fn(text)) for text in texts]
+                        for name, texts in self.skip_prototypes.items()
+                    }
+        return self._vectors
+
+    def predict(self, embedding: Sequence[float], names: Optional[List[str]] = None) -> Dict[str, str]:
+        """
+        Route each analysis to "llm" or "template".
+
+        Args:
+            embedding: Embedding of the startup text
+            names: Analysis names to route (default: those with prototypes)
+
+        Returns:
+            Mapping of analysis name to "llm" or "template"
+        """
+        query = _normalize(embedding)
+        vectors = self._prototype_vectors()
+        routes = {}
+        for name in names if names is not None else list(vectors):
+            best = max(
+                (sum(a * b for a, b in zip(vector, query)) for vector in vectors.get(name, ()) if len(vector) == len(query)),
+                default=-1.0,
+            )
+            routes[name] = "template" if best >= self.threshold else "llm"
+        return routes
+
+    @staticmethod
+    def template_result(name: str) -> Dict[str, Any]:
+        """Stock result for an analysis routed away from the LLM."""
+        return {
+            "category_name": name,
+            "overall_risk_level": "unknown",
+            "indicators": [],
+            "summary": "Not applicable to this startup based on its profile; no LLM analysis was run.",
+            "routing": "template",
+        }
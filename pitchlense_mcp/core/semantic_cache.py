@@ -0,0 +1,100 @@
+"""
+Semantic (embedding-similarity) cache for analysis results.
+
+Near-duplicate pitches (re-uploads, minor edits) produce near-identical
+embeddings, so a prior analysis result can be reused when the cosine similarity
+between the new and stored embeddings is above a threshold.
+"""
+
+import math
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+
+def _normalize(vector: Sequence[float]) -> List[float]:
+    norm = math.sqrt(sum(x * x for x in vector))
+    if not norm:
+        return [0.0 for _ in vector]
+    return [x / norm for x in vector]
+
+
+class SemanticCache:
+    """
+    In-memory cosine-similarity cache, one flat index per namespace.
+
+    Vectors are L2-normalised on insert so a lookup is a single dot product
+    per stored entry (an exact inner-product search, like FAISS IndexFlatIP).
+
+    Usage example:
+        >>> cache = SemanticCache(threshold=0.95)
+        >>> cache.put("Market Risk Analysis", embedding, result)
+        >>> cache.get("Market Risk Analysis", similar_embedding)
+    """
+
+    def __init__(self, threshold: float = 0.95, max_entries: int = 256):
+        """
+        Initialize the cache.
+
+        Args:
+            threshold: Minimum cosine similarity for a hit
+            max_entries: Maximum entries kept per namespace (oldest evicted first)
+        """
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._entries: Dict[str, List[Tuple[List[float], Any]]] = {}
+        # Incremented on every put() so callers can tell when to persist
+        self.revision = 0
+        self._lock = threading.Lock()
+
+    def get(self, namespace: str, embedding: Sequence[float], threshold: Optional[float] = None) -> Optional[Any]:
+        """
+        Return the stored value most similar to embedding, or None on a miss.
+
+        Args:
+            namespace: Index to search (e.g. the analysis name)
+            embedding: Query embedding
+            threshold: Overrides the cache-wide similarity threshold
+
+        Returns:
+            Cached value if the best match meets the threshold, else None
+        """
+        query = _normalize(embedding)
+        limit = self.threshold if threshold is None else threshold
+        best_score, best_value = -1.0, None
+        with self._lock:
+            for vector, value in self._entries.get(namespace, ()):
+                if len(vector) != len(query):
+                    continue
+                score = sum(a * b for a, b in zip(vector, query))
+                if score > best_score:
+                    best_score, best_value = score, value
+        return best_value if best_score >= limit else None
+
+    def put(self, namespace: str, embedding: Sequence[float], value: Any) -> None:
+        """Store value under namespace for the given embedding."""
+        with self._lock:
+            entries = self._entries.setdefault(namespace, [])
+            entries.append((_normalize(embedding), value))
+            self.revision += 1
+            if len(entries) > self.max_entries:
+                del entries[:len(entries) - self.max_entries]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the cache to a JSON-compatible dict."""
+        with self._lock:
+            return {
+                "threshold": self.threshold,
+                "entries": {
+                    namespace: [{"embedding": vector, "value": value} for vector, value in entries]
+                    for namespace, entries in self._entries.items()
+                },
+            }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], max_entries: int = 256) -> "SemanticCache":
+        """Rebuild a cache serialized with to_dict()."""
+        cache = cls(threshold=data.get("threshold", 0.95), max_entries=max_entries)
+        for namespace, entries in (data.get("entries") or {}).items():
+            for entry in entries[-max_entries:]:
+                cache._entries.setdefault(namespace, []).append((entry["embedding"], entry["value"]))
+        return cache
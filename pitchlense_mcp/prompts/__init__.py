@@ -16,7 +16,8 @@ from .risk_analysis_prompts import (
     TEAM_RISK_PROMPT,
     UNSTRUCTURED_DATA_PROMPT,
     PEER_BENCHMARK_PROMPT,
-    SOCIAL_COVERAGE_RISK_PROMPT
+    SOCIAL_COVERAGE_RISK_PROMPT,
+    BATCHED_RISK_PROMPT
 )
 
 __all__ = [
@@ -31,5 +32,6 @@ __all__ = [
     "TEAM_RISK_PROMPT",
     "UNSTRUCTURED_DATA_PROMPT",
     "PEER_BENCHMARK_PROMPT",
-    "SOCIAL_COVERAGE_RISK_PROMPT"
+    "SOCIAL_COVERAGE_RISK_PROMPT",
+    "BATCHED_RISK_PROMPT"
 ]
@@ -12,23 +12,44 @@ Exports:
 - VertexAIAgentBuilderMCPTool: Google Vertex AI Agent Builder for conversational AI
 """
 
-from .serp_news import SerpNewsMCPTool  # noqa: F401
-from .serp_pdf_search import SerpPdfSearchMCPTool  # noqa: F401
-from .perplexity_search import PerplexityMCPTool  # noqa: F401
-from .upload_extractor import UploadExtractor  # noqa: F401
-from .lv_analysis_tool import LVAnalysisMCPTool  # noqa: F401
-from .knowledge_graph import KnowledgeGraphMCPTool  # noqa: F401
-from .linkedin_analyzer import LinkedInAnalyzerMCPTool  # noqa: F401
-from .content_moderation import GoogleContentModerationMCPTool  # noqa: F401
-from .social_media_research import SocialMediaResearchMCPTool  # noqa: F401
-
-# Conditional imports for Google Cloud tools
-try:
-    from .vertex_ai_rag import VertexAIRAGMCPTool  # noqa: F401
-    from .vertex_ai_agent_builder import VertexAIAgentBuilderMCPTool  # noqa: F401
-    VERTEX_AI_AVAILABLE = True
-except ImportError:
-    VERTEX_AI_AVAILABLE = False
+import importlib
+
+# Tools are imported lazily so that using one tool does not load every other
+# tool's SDK and HTTP client.
+_LAZY_IMPORTS = {
+    "SerpNewsMCPTool": ".serp_news",
+    "SerpPdfSearchMCPTool": ".serp_pdf_search",
+    "PerplexityMCPTool": ".perplexity_search",
+    "UploadExtractor": ".upload_extractor",
+    "LVAnalysisMCPTool": ".lv_analysis_tool",
+    "KnowledgeGraphMCPTool": ".knowledge_graph",
+    "LinkedInAnalyzerMCPTool": ".linkedin_analyzer",
+    "GoogleContentModerationMCPTool": ".content_moderation",
+    "SocialMediaResearchMCPTool": ".social_media_research",
+    "VertexAIRAGMCPTool": ".vertex_ai_rag",
+    "VertexAIAgentBuilderMCPTool": ".vertex_ai_agent_builder",
+}
+
+
+def __getattr__(name):
+    if name == "VERTEX_AI_AVAILABLE":
+        try:
+            importlib.import_module(".vertex_ai_rag", __name__)
+            importlib.import_module(".vertex_ai_agent_builder", __name__)
+            value = True
+        except ImportError:
+            value = False
+    elif name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS) | {"VERTEX_AI_AVAILABLE"})
+
 
 __all__ = [
     "SerpNewsMCPTool",
@@ -40,13 +61,6 @@ __all__ = [
     "LinkedInAnalyzerMCPTool",
     "GoogleContentModerationMCPTool",
     "SocialMediaResearchMCPTool",
+    "VertexAIRAGMCPTool",
+    "VertexAIAgentBuilderMCPTool",
 ]
-
-# Add Vertex AI tools to __all__ if available
-if VERTEX_AI_AVAILABLE:
-    __all__.extend([
-        "VertexAIRAGMCPTool",
-        "VertexAIAgentBuilderMCPTool",
-    ])
-
-
@@ -6,10 +6,22 @@ for inappropriate, harmful, or unsafe content.
 """
 
 import os
+import re
 from typing import Any, Dict, Optional
 from ..core.base import BaseMCPTool
 
 
+# Basic keyword-based moderation (replace with actual Google API)
+_HARMFUL_KEYWORDS = (
+    "hate speech", "violence", "harassment", "threats", "discrimination",
+    "explicit", "inappropriate", "offensive", "abusive", "toxic"
+)
+_PROFANITY_INDICATORS = ("f***", "s***", "b****", "a****", "d***")
+
+# One pass over the (lower-cased) text; the per-keyword breakdown only runs on a match
+_SCREEN_RE = re.compile("|".join(re.escape(term) for term in _HARMFUL_KEYWORDS + _PROFANITY_INDICATORS))
+
+
 class GoogleContentModerationMCPTool(BaseMCPTool):
     """
     Google Content Moderation tool for analyzing text content safety.
@@ -69,23 +81,14 @@ class GoogleContentModerationMCPTool(BaseMCPTool):
         try:
             # For now, implement a basic content moderation check
             # In production, this would use Google's actual content moderation API
-            
-            # Basic keyword-based moderation (replace with actual Google API)
-            harmful_keywords = [
-                "hate speech", "violence", "harassment", "threats", "discrimination",
-                "explicit", "inappropriate", "offensive", "abusive", "toxic"
-            ]
-            
             text_lower = text.lower()
             detected_issues = []
-            
-            for keyword in harmful_keywords:
-                if keyword in text_lower:
-                    detected_issues.append(keyword)
-            
-            # Check for excessive profanity or inappropriate language
-            profanity_indicators = ["f***", "s***", "b****", "a****", "d***"]
-            profanity_detected = any(indicator in text_lower for indicator in profanity_indicators)
+            profanity_detected = False
+
+            if _SCREEN_RE.search(text_lower):
+                detected_issues = [keyword for keyword in _HARMFUL_KEYWORDS if keyword in text_lower]
+                # Check for excessive profanity or inappropriate language
+                profanity_detected = any(indicator in text_lower for indicator in _PROFANITY_INDICATORS)
             
             # Determine if moderation is required
             moderation_required = len(detected_issues) > 0 or profanity_detected
@@ -40,13 +40,16 @@ class LinkedInAnalyzerMCPTool(BaseMCPTool):
         """Set the LLM client for analysis."""
         self.llm_client = llm_client
     
-    def analyze_linkedin_profile(self, pdf_path: str, api_key: Optional[str] = None) -> Dict[str, Any]:
+    def analyze_linkedin_profile(
+        self, pdf_path: str, api_key: Optional[str] = None, pdf_bytes: Optional[bytes] = None
+    ) -> Dict[str, Any]:
         """
         Analyze a LinkedIn profile PDF and return comprehensive founder evaluation.
         
         Args:
-            pdf_path: Path to the LinkedIn profile PDF file
+            pdf_path: Path to the LinkedIn profile PDF file (only used for logging when pdf_bytes is given)
             api_key: Optional Gemini API key (defaults to environment variable)
+            pdf_bytes: Optional PDF content already in memory; analyzed instead of reading pdf_path
 
         Returns:
             Comprehensive founder evaluation JSON with scores, KPIs, and recommendations
@@ -68,11 +71,18 @@ class LinkedInAnalyzerMCPTool(BaseMCPTool):
             # Analyze the document directly
             print("[LinkedIn] Sending PDF to Gemini for analysis...")
             try:
-                result = doc_analyzer.predict(
-                    document_path=pdf_path,
-                    prompt=analysis_prompt,
-                    mime_type="application/pdf"
-                )
+                if pdf_bytes is not None:
+                    result = doc_analyzer.predict_from_bytes(
+                        pdf_bytes,
+                        prompt=analysis_prompt,
+                        mime_type="application/pdf"
+                    )
+                else:
+                    result = doc_analyzer.predict(
+                        document_path=pdf_path,
+                        prompt=analysis_prompt,
+                        mime_type="application/pdf"
+                    )
             except Exception as e:
                 print(f"[LinkedIn] Error during Gemini analysis: {str(e)}")
                 return self.create_error_response(f"Gemini analysis failed: {str(e)}")
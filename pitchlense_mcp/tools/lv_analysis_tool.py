@@ -41,14 +41,7 @@ class LVAnalysisMCPTool(BaseMCPTool):
         try:
             # Check if LLM client is available
             if not self.analyzer.llm_client:
-                print("[LV-Analysis] ERROR: No LLM client provided to analyzer")
-                return {
-                    "category_name": "LV-Analysis",
-                    "analysis_type": "detailed_business_note", 
-                    "status": "error",
-                    "error": "No LLM client available for analysis",
-                    "timestamp": datetime.now(timezone.utc).isoformat()
-                }
+                return self._missing_client_response()
             
             print("[LV-Analysis] LLM client available, proceeding with analysis")
             
@@ -57,20 +50,64 @@ class LVAnalysisMCPTool(BaseMCPTool):
             
             print(f"[LV-Analysis] Analysis completed successfully")
             
-            return {
-                "category_name": "LV-Analysis",
-                "analysis_type": "detailed_business_note",
-                "status": "success",
-                "result": result,
-                "timestamp": datetime.now(timezone.utc).isoformat()
-            }
+            return self._success_response(result)
             
         except Exception as e:
-            print(f"[LV-Analysis] ERROR: Analysis failed with exception: {str(e)}")
-            return {
-                "category_name": "LV-Analysis", 
-                "analysis_type": "detailed_business_note",
-                "status": "error",
-                "error": str(e),
-                "timestamp": datetime.now(timezone.utc).isoformat()
-            }
+            return self._exception_response(e)
+
+    async def aanalyze_lv_business_note(self, startup_text: str) -> Dict[str, Any]:
+        """
+        Async variant of analyze_lv_business_note().
+
+        Args:
+            startup_text: Detailed startup information and description
+
+        Returns:
+            Comprehensive business analysis in hackathon format
+        """
+        print(f"[LV-Analysis] Starting analysis with startup_text length: {len(startup_text)}")
+
+        try:
+            if not self.analyzer.llm_client:
+                return self._missing_client_response()
+
+            result = await self.analyzer.aanalyze(startup_text)
+
+            print(f"[LV-Analysis] Analysis completed successfully")
+
+            return self._success_response(result)
+
+        except Exception as e:
+            return self._exception_response(e)
+
+    @staticmethod
+    def _missing_client_response() -> Dict[str, Any]:
+        print("[LV-Analysis] ERROR: No LLM client provided to analyzer")
+        return {
+            "category_name": "LV-Analysis",
+            "analysis_type": "detailed_business_note", 
+            "status": "error",
+            "error": "No LLM client available for analysis",
+            "timestamp": datetime.now(timezone.utc).isoformat()
+        }
+
+    @staticmethod
+    def _success_response(result: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "category_name": "LV-Analysis",
+            "analysis_type": "detailed_business_note",
+            "status": "success",
+            "result": result,
+            "timestamp": datetime.now(timezone.utc).isoformat()
+        }
+
+    @staticmethod
+    def _exception_response(exc: Exception) -> Dict[str, Any]:
+        print(f"[LV-Analysis] ERROR: Analysis failed with exception: {str(exc)}")
+        return {
+            "category_name": "LV-Analysis", 
+            "analysis_type": "detailed_business_note",
+            "status": "error",
+            "error": str(exc),
+            "timestamp": datetime.now(timezone.utc).isoformat()
+        }
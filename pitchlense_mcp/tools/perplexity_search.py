@@ -9,11 +9,22 @@ Environment variables:
     PERPLEXITY_API_KEY: API key for Perplexity (required).
 """
 
+import asyncio
 import os
+import threading
+import weakref
 from typing import Any, Dict, List, Optional
 import httpx
 
+try:
+    import h2  # noqa: F401  # enables HTTP/2 multiplexing in httpx
+    _HTTP2 = True
+except ImportError:  # pragma: no cover - HTTP/1.1 keep-alive pooling only
+    _HTTP2 = False
+
 from ..core.base import BaseMCPTool
+from ..utils.concurrency import provider_limit
+from ..utils.retry import retry
 
 
 def _extract_sources(resp: Dict[str, Any]) -> List[Dict[str, Optional[str]]]:
@@ -60,6 +71,42 @@ def _extract_sources(resp: Dict[str, Any]) -> List[Dict[str, Optional[str]]]:
     return deduped
 
 
+_http_client: Optional[httpx.Client] = None
+_http_client_lock = threading.Lock()
+
+
+def _get_http_client() -> httpx.Client:
+    """Return a process-wide httpx client so repeated searches reuse TLS connections."""
+    global _http_client
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                _http_client = httpx.Client(
+                    timeout=90,
+                    limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+                )
+    return _http_client
+
+
+# One async client per event loop: httpx pools are bound to the loop that opened them
+_async_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+
+def _get_async_http_client() -> httpx.AsyncClient:
+    """Return the shared async httpx client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _async_http_clients.get(loop)
+    if client is None:
+        client = httpx.AsyncClient(
+            timeout=90,
+            http2=_HTTP2,
+            # Keep idle connections long enough to survive gaps between pipeline stages
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=60),
+        )
+        _async_http_clients[loop] = client
+    return client
+
+
 class PerplexityMCPTool(BaseMCPTool):
     """MCP tool that queries Perplexity and returns answer with source URLs.
 
@@ -106,6 +153,40 @@ class PerplexityMCPTool(BaseMCPTool):
             "max_tokens": 800,
         }
 
+    @staticmethod
+    def _parse_response(query: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        # Extract answer
+        answer = None
+        try:
+            choices = data.get("choices") or []
+            if choices:
+                answer = (choices[0].get("message") or {}).get("content")
+        except Exception:
+            answer = None
+
+        sources = _extract_sources(data)
+        return {
+            "query": query,
+            "answer": answer,
+            "sources": sources,
+        }
+
+    @retry()
+    def _post(self, headers: Dict[str, str], payload: Dict[str, Any]) -> httpx.Response:
+        """POST to the API, retrying transient (429/5xx/network) failures."""
+        with provider_limit("perplexity"):
+            r = _get_http_client().post(self.API_URL, headers=headers, json=payload)
+        r.raise_for_status()
+        return r
+
+    @retry()
+    async def _apost(self, headers: Dict[str, str], payload: Dict[str, Any]) -> httpx.Response:
+        """Async _post() on the shared httpx.AsyncClient."""
+        async with provider_limit("perplexity"):
+            r = await _get_async_http_client().post(self.API_URL, headers=headers, json=payload)
+        r.raise_for_status()
+        return r
+
     def search_perplexity(self, query: str, model: str = "sonar") -> Dict[str, Any]:
         """
         Query Perplexity for a given query.
@@ -123,35 +204,56 @@ class PerplexityMCPTool(BaseMCPTool):
         try:
             headers = self._headers()
             payload = self._payload(query, model=model)
-            with httpx.Client(timeout=90) as client:
-                r = client.post(self.API_URL, headers=headers, json=payload)
-                try:
-                    r.raise_for_status()
-                except httpx.HTTPStatusError as http_exc:
-                    # Include response text to help diagnose 400 errors
-                    raise httpx.HTTPError(f"{str(http_exc)} | response_body={r.text}")
-                data = r.json()
-
-            # Extract answer
-            answer = None
             try:
-                choices = data.get("choices") or []
-                if choices:
-                    answer = (choices[0].get("message") or {}).get("content")
-            except Exception:
-                answer = None
-
-            sources = _extract_sources(data)
-            return {
-                "query": query,
-                "answer": answer,
-                "sources": sources,
-            }
+                r = self._post(headers, payload)
+            except httpx.HTTPStatusError as http_exc:
+                # Include response text to help diagnose 400 errors
+                raise httpx.HTTPError(f"{str(http_exc)} | response_body={http_exc.response.text}")
+            return self._parse_response(query, r.json())
         except httpx.HTTPError as e:
             return self.create_error_response(f"HTTP error: {str(e)}")
         except Exception as e:
             return self.create_error_response(f"Perplexity error: {str(e)}")
 
+    async def asearch_perplexity(self, query: str, model: str = "sonar") -> Dict[str, Any]:
+        """
+        Async variant of search_perplexity() on the shared httpx.AsyncClient.
+
+        Args:
+            query: user query string
+            model: Perplexity model (default: sonar)
+
+        Returns:
+            dict with keys: query, answer, sources (list of {url, title})
+        """
+        if not isinstance(query, str) or not query.strip():
+            return self.create_error_response("Invalid query: must be a non-empty string")
+
+        try:
+            headers = self._headers()
+            payload = self._payload(query, model=model)
+            try:
+                r = await self._apost(headers, payload)
+            except httpx.HTTPStatusError as http_exc:
+                raise httpx.HTTPError(f"{str(http_exc)} | response_body={http_exc.response.text}")
+            return self._parse_response(query, r.json())
+        except httpx.HTTPError as e:
+            return self.create_error_response(f"HTTP error: {str(e)}")
+        except Exception as e:
+            return self.create_error_response(f"Perplexity error: {str(e)}")
+
+    async def aprewarm(self) -> None:
+        """
+        Open a pooled connection to the API host ahead of asearch_perplexity().
+
+        Lets the TCP/TLS handshake overlap with other work (e.g. an LLM call whose
+        output becomes the query). Failures are ignored; the search connects itself.
+        """
+        try:
+            await _get_async_http_client().head(self.API_URL, timeout=5)
+        except Exception:
+            pass
+
     def register_tools(self):
         self.register_tool(self.search_perplexity)
 
@@ -0,0 +1,45 @@
+"""
+Pooled SerpAPI client shared by the SerpAPI tools.
+
+serpapi's GoogleSearch sends each query with a bare requests.get(), i.e. a new
+HTTPS connection (and TLS handshake) per call. PooledGoogleSearch routes the
+same request through one process-wide requests.Session, so warm processes
+reuse keep-alive connections to serpapi.com.
+"""
+
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    from serpapi import GoogleSearch as _GoogleSearch
+except Exception:  # pragma: no cover
+    _GoogleSearch = None
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    """Return the process-wide session used for SerpAPI requests."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                session.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=8))
+                _session = session
+    return _session
+
+
+if _GoogleSearch is not None:
+    class PooledGoogleSearch(_GoogleSearch):
+        """GoogleSearch whose HTTP requests share a pooled requests.Session."""
+
+        def get_response(self, path: str = "/search") -> requests.Response:
+            url, parameter = self.construct_url(path)
+            return _get_session().get(url, params=parameter, timeout=self.timeout)
+else:  # pragma: no cover
+    PooledGoogleSearch = None
@@ -12,11 +12,9 @@ Environment variables:
 import os
 from typing import Dict, Any, List
 from ..core.base import BaseMCPTool
+from ..utils.concurrency import provider_limit
 
-try:
-    from serpapi import GoogleSearch
-except Exception:  # pragma: no cover
-    GoogleSearch = None
+from .serp_client import PooledGoogleSearch as GoogleSearch
 
 
 def _map_news_result(item: Dict[str, Any]) -> Dict[str, Any]:
@@ -84,7 +82,8 @@ class SerpNewsMCPTool(BaseMCPTool):
                 "gl": "us",
             }
             search = GoogleSearch(params)
-            results = search.get_dict() or {}
+            with provider_limit("serp"):
+                results = search.get_dict() or {}
             news_items: List[Dict[str, Any]] = results.get("news_results") or []
             mapped = [_map_news_result(item) for item in news_items[: num_results or 10]]
             return {"query": query, "results": mapped}
@@ -11,11 +11,9 @@ Environment variables:
 import os
 from typing import Dict, Any, List
 from ..core.base import BaseMCPTool
+from ..utils.concurrency import provider_limit
 
-try:
-    from serpapi import GoogleSearch
-except Exception:  # pragma: no cover
-    GoogleSearch = None
+from .serp_client import PooledGoogleSearch as GoogleSearch
 
 
 def _map_pdf_result(item: Dict[str, Any]) -> Dict[str, Any]:
@@ -84,7 +82,8 @@ class SerpPdfSearchMCPTool(BaseMCPTool):
                 "num": num_results or 10,
             }
             search = GoogleSearch(params)
-            results = search.get_dict() or {}
+            with provider_limit("serp"):
+                results = search.get_dict() or {}
             organic_results: List[Dict[str, Any]] = results.get("organic_results") or []
             
             # Filter for PDF results and map to normalized format
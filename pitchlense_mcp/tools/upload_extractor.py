@@ -2,7 +2,7 @@
 Upload extractor tool that uses Gemini LLM analyzers and Perplexity to build startup_text.
 
 Workflow:
-- Accepts a list of local files with metadata (name/type/extension/path).
+- Accepts a list of local files (or in-memory file contents) with metadata (name/type/extension/path).
 - Uses the appropriate Gemini analyzer (text, image, audio, video, document) to extract
   structured textual context per file.
 - Calls Perplexity multiple times to synthesize a comprehensive startup_text string from
@@ -12,7 +12,7 @@ Workflow:
 from __future__ import annotations
 
 import os
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from ..core.gemini_client import GeminiLLM
 from .perplexity_search import PerplexityMCPTool
@@ -49,10 +49,13 @@ class UploadExtractor:
     def __init__(self, llm_client: GeminiLLM):
         self.llm = llm_client
 
-    def _extract_text_from_plainfile(self, file_path: str) -> str:
+    def _extract_text_from_plainfile(self, source: Union[str, bytes]) -> str:
         try:
-            with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                raw = f.read()
+            if isinstance(source, bytes):
+                raw = source.decode("utf-8", errors="ignore")
+            else:
+                with open(source, "r", encoding="utf-8", errors="ignore") as f:
+                    raw = f.read()
         except Exception:
             raw = ""
         if not raw:
@@ -67,10 +70,12 @@ class UploadExtractor:
         )
         return resp.get("response", "")
 
-    def _extract_from_document(self, file_path: str, mime_type: str) -> str:
+    def _extract_from_document(self, source: Union[str, bytes], mime_type: str) -> str:
+        analyzer = self.llm.document_analyzer
         try:
-            result = self.llm.document_analyzer.predict(
-                document_path=file_path,
+            predict = analyzer.predict_from_bytes if isinstance(source, bytes) else analyzer.predict
+            result = predict(
+                source,
                 prompt=(
                     "Extract ALL text content from this document completely. Perform OCR on any images, "
                     "charts, tables, or visual elements to extract text. Present tables in a structured "
@@ -87,10 +92,10 @@ class UploadExtractor:
         except Exception as e:
             return f"Document analysis failed: {str(e)}"
 
-    def _extract_from_image(self, file_path: str, mime_type: str) -> str:
+    def _extract_from_image(self, source: Union[str, bytes], mime_type: str) -> str:
         try:
             result = self.llm.image_analyzer.predict(
-                image_input=file_path,
+                image_input=source,
                 prompt=(
                     "Perform OCR to extract ALL text visible in this image, including text overlays, "
                     "labels, captions, and any written content. If there are tables, present them in "
@@ -108,10 +113,10 @@ class UploadExtractor:
         except Exception as e:
             return f"Image analysis failed: {str(e)}"
 
-    def _extract_from_audio(self, file_path: str, mime_type: str) -> str:
+    def _extract_from_audio(self, source: Union[str, bytes], mime_type: str) -> str:
         try:
             result = self.llm.audio_analyzer.predict(
-                audio_input=file_path,
+                audio_input=source,
                 prompt=(
                     "Transcribe this audio content completely. Provide a word-for-word transcription "
                     "of all spoken content, including any pauses, speaker changes, or background audio. "
@@ -125,10 +130,10 @@ class UploadExtractor:
         except Exception as e:
             return f"Audio analysis failed: {str(e)}"
 
-    def _extract_from_video(self, file_path: str, mime_type: str) -> str:
+    def _extract_from_video(self, source: Union[str, bytes], mime_type: str) -> str:
         try:
             result = self.llm.video_analyzer.predict(
-                video_input=file_path,
+                video_input=source,
                 prompt=(
                     "First, transcribe all spoken content in this video completely. Provide a word-for-word "
                     "transcription of all dialogue, including speaker identification if multiple speakers are present. "
@@ -144,42 +149,57 @@ class UploadExtractor:
         except Exception as e:
             return f"Video analysis failed: {str(e)}"
 
+    def extract_document(self, upload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Extract content from one uploaded file.
+
+        The upload dict should have keys: filename, file_extension, local_path, filetype (optional).
+        Instead of local_path it may carry data (the raw file bytes), which is sent to
+        Gemini as-is without touching the filesystem.
+        """
+        u = upload
+        filename = u.get("filename") or os.path.basename(u.get("local_path") or "")
+        ext = (u.get("file_extension") or os.path.splitext(filename or "")[1].lstrip(".")).lower()
+        source = u.get("data") if u.get("data") is not None else u.get("local_path")
+        filetype = u.get("filetype") or ""
+        mime = _guess_mime_from_extension(ext)
+
+        extracted = ""
+        if mime.startswith("image/"):
+            extracted = self._extract_from_image(source, mime)
+        elif mime.startswith("video/"):
+            extracted = self._extract_from_video(source, mime)
+        elif mime.startswith("audio/"):
+            extracted = self._extract_from_audio(source, mime)
+        elif mime == "text/plain":
+            extracted = self._extract_text_from_plainfile(source)
+        else:
+            # Treat as document by default
+            extracted = self._extract_from_document(source, mime)
+
+        return {
+            "name": filename,
+            "type": filetype or mime,
+            "extension": ext,
+            "mime_type": mime,
+            "content": extracted,
+        }
+
     def extract_documents(self, uploads: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Extract content from a list of uploaded local files.
 
-        Each upload dict should have keys: filename, file_extension, local_path, filetype (optional).
+        Files are extracted in parallel (up to 8 at a time); the result keeps the
+        order of uploads. Each upload dict should have keys: filename,
+        file_extension, local_path, filetype (optional).
         """
-        documents: List[Dict[str, Any]] = []
-        for u in uploads:
-            filename = u.get("filename") or os.path.basename(u.get("local_path", ""))
-            ext = (u.get("file_extension") or os.path.splitext(filename or "")[1].lstrip(".")).lower()
-            local_path = u.get("local_path")
-            filetype = u.get("filetype") or ""
-            mime = _guess_mime_from_extension(ext)
-
-            extracted = ""
-            if mime.startswith("image/"):
-                extracted = self._extract_from_image(local_path, mime)
-            elif mime.startswith("video/"):
-                extracted = self._extract_from_video(local_path, mime)
-            elif mime.startswith("audio/"):
-                extracted = self._extract_from_audio(local_path, mime)
-            elif mime == "text/plain":
-                extracted = self._extract_text_from_plainfile(local_path)
-            else:
-                # Treat as document by default
-                extracted = self._extract_from_document(local_path, mime)
-
-            documents.append({
-                "name": filename,
-                "type": filetype or mime,
-                "extension": ext,
-                "mime_type": mime,
-                "content": extracted,
-            })
-
-        return documents
+        if len(uploads) <= 1:
+            return [self.extract_document(u) for u in uploads]
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(8, len(uploads))) as executor:
+            return list(executor.map(self.extract_document, uploads))
 
     def synthesize_startup_text(self, documents: List[Dict[str, Any]]) -> str:
         """Run 10 Perplexity calls in parallel (one per section) and concatenate results."""
@@ -4,11 +4,19 @@ Utility functions for PitchLense MCP Package.
 
 from .json_extractor import extract_json_from_response
 from .token_tracker import token_tracker, TokenTracker, TokenUsage, TokenSummary
+from .async_utils import run_in_thread
+from .retry import retry, is_transient_error
+from .concurrency import ConcurrencyLimit, provider_limit
 
 __all__ = [
     "extract_json_from_response",
     "token_tracker",
     "TokenTracker", 
     "TokenUsage",
-    "TokenSummary"
+    "TokenSummary",
+    "run_in_thread",
+    "retry",
+    "is_transient_error",
+    "ConcurrencyLimit",
+    "provider_limit"
 ]
\ No newline at end of file
@@ -0,0 +1,27 @@
+"""
+Async helpers for PitchLense MCP Package.
+
+Bridges the synchronous tool and SDK calls into asyncio code paths.
+"""
+
+import asyncio
+import functools
+from typing import Any, Callable
+
+
+async def run_in_thread(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    Run a blocking callable in the default executor and await its result.
+    
+    Equivalent to asyncio.to_thread, which is unavailable on Python 3.8.
+    
+    Args:
+        func: Blocking callable to run
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+        
+    Returns:
+        The callable's return value
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
@@ -0,0 +1,141 @@
+"""
+Per-provider concurrency limits for PitchLense MCP Package.
+
+A single request fans out to Gemini, SerpAPI and Perplexity from both worker
+threads and coroutines. Bounding the calls in flight per provider keeps bursts
+within the provider's rate budget, so requests queue briefly instead of failing
+with HTTP 429 and going through retry backoff.
+"""
+
+import asyncio
+import os
+import threading
+from collections import deque
+from typing import Any, Deque, Dict
+
+# Default in-flight calls per provider; override with PITCHLENSE_<PROVIDER>_CONCURRENCY
+DEFAULT_PROVIDER_LIMITS = {
+    "gemini": 8,
+    "serp": 3,
+    "perplexity": 5,
+}
+
+
+class ConcurrencyLimit:
+    """
+    Counting limit usable as a sync or async context manager.
+
+    The same limit is shared by threads and event loops. Waiters queue in FIFO
+    order and a release hands the slot straight to the longest waiter: threads
+    block on an event, coroutines await a future on their own loop, so nobody
+    polls and a waiting coroutine cannot be starved by threads.
+
+    Usage example:
+        >>> limit = ConcurrencyLimit(2)
+        >>> with limit:
+        ...     call_api()
+        >>> async with limit:
+        ...     await acall_api()
+    """
+
+    def __init__(self, max_concurrent: int):
+        """
+        Initialize the limit.
+
+        Args:
+            max_concurrent: Maximum number of holders at once (at least 1)
+        """
+        self.max_concurrent = max(1, max_concurrent)
+        self._available = self.max_concurrent
+        # threading.Event for blocked threads, (loop, future) for waiting coroutines
+        self._waiters: Deque[Any] = deque()
+        self._lock = threading.Lock()
+
+    def _release(self) -> None:
+        with self._lock:
+            if not self._waiters:
+                if self._available >= self.max_concurrent:
+                    raise ValueError("ConcurrencyLimit released too many times")
+                self._available += 1
+                return
+            waiter = self._waiters.popleft()
+        if isinstance(waiter, threading.Event):
+            waiter.set()
+            return
+        loop, future = waiter
+        try:
+            loop.call_soon_threadsafe(self._wake, future)
+        except RuntimeError:
+            # The waiter's loop is closed; pass the slot on
+            self._release()
+
+    def _wake(self, future: "asyncio.Future[None]") -> None:
+        if future.cancelled():
+            # The coroutine gave up after the slot was handed to it
+            self._release()
+        else:
+            future.set_result(None)
+
+    def __enter__(self) -> "ConcurrencyLimit":
+        with self._lock:
+            if self._available and not self._waiters:
+                self._available -= 1
+                return self
+            event = threading.Event()
+            self._waiters.append(event)
+        event.wait()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._release()
+
+    async def __aenter__(self) -> "ConcurrencyLimit":
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._available and not self._waiters:
+                self._available -= 1
+                return self
+            future = loop.create_future()
+            waiter = (loop, future)
+            self._waiters.append(waiter)
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                queued = waiter in self._waiters
+                if queued:
+                    self._waiters.remove(waiter)
+            if not queued and future.done() and not future.cancelled():
+                # The slot arrived together with the cancellation
+                self._release()
+            raise
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self._release()
+
+
+_limits: Dict[str, ConcurrencyLimit] = {}
+_limits_lock = threading.Lock()
+
+
+def provider_limit(provider: str) -> ConcurrencyLimit:
+    """
+    Return the process-wide concurrency limit for an external provider.
+
+    Args:
+        provider: Provider name, e.g. "gemini", "serp" or "perplexity"
+
+    Returns:
+        Shared ConcurrencyLimit, sized from PITCHLENSE_<PROVIDER>_CONCURRENCY
+        or DEFAULT_PROVIDER_LIMITS on first use
+    """
+    limit = _limits.get(provider)
+    if limit is None:
+        with _limits_lock:
+            limit = _limits.get(provider)
+            if limit is None:
+                default = DEFAULT_PROVIDER_LIMITS.get(provider, 4)
+                size = int(os.getenv(f"PITCHLENSE_{provider.upper()}_CONCURRENCY", default))
+                limit = _limits[provider] = ConcurrencyLimit(size)
+    return limit
@@ -8,6 +8,16 @@ import re
 import json
 from typing import Dict, Any, Optional
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+# Compiled once at import instead of going through re's pattern cache per call
+_JSON_TAG_RE = re.compile(r'<JSON>\s*(.*?)\s*</JSON>', re.DOTALL | re.IGNORECASE)
+_JSON_CODE_BLOCK_RE = re.compile(r'```json\s*(.*?)\s*```', re.DOTALL | re.IGNORECASE)
+_CODE_BLOCK_RE = re.compile(r'```\s*(.*?)\s*```', re.DOTALL | re.IGNORECASE)
+
 
 def extract_json_from_response(response_text: str) -> Optional[Dict[str, Any]]:
     """
@@ -29,31 +39,18 @@ def extract_json_from_response(response_text: str) -> Optional[Dict[str, Any]]:
         return None
     
     # Clean up the response text
-    response_text = response_text.strip()
-    
-    # Method 1: Extract from <JSON> tags
-    json_content = _extract_from_json_tags(response_text)
-    if json_content:
-        parsed = _parse_json(json_content)
-        if parsed:
-            return parsed
-    
-    # Method 2: Extract from ```json code blocks
-    json_content = _extract_from_json_code_blocks(response_text)
-    if json_content:
-        parsed = _parse_json(json_content)
-        if parsed:
-            return parsed
+    stripped_text = response_text.strip()
     
-    # Method 3: Extract from ``` code blocks
-    json_content = _extract_from_code_blocks(response_text)
-    if json_content:
-        parsed = _parse_json(json_content)
-        if parsed:
-            return parsed
+    # Methods 1-3: <JSON> tags, ```json code blocks, ``` code blocks
+    for extractor in (_extract_from_json_tags, _extract_from_json_code_blocks, _extract_from_code_blocks):
+        json_content = extractor(stripped_text)
+        if json_content:
+            parsed = _parse_json(json_content)
+            if parsed:
+                return parsed
     
     # Method 4: Try to parse the entire response as JSON
-    parsed = _parse_json(response_text)
+    parsed = _parse_json(stripped_text)
     if parsed:
         return parsed
     
@@ -62,22 +59,19 @@ def extract_json_from_response(response_text: str) -> Optional[Dict[str, Any]]:
 
 def _extract_from_json_tags(text: str) -> Optional[str]:
     """Extract JSON content between <JSON> and </JSON> tags."""
-    pattern = r'<JSON>\s*(.*?)\s*</JSON>'
-    match = re.search(pattern, text, re.DOTALL | re.IGNORECASE)
+    match = _JSON_TAG_RE.search(text)
     return match.group(1).strip() if match else None
 
 
 def _extract_from_json_code_blocks(text: str) -> Optional[str]:
     """Extract JSON content from ```json code blocks."""
-    pattern = r'```json\s*(.*?)\s*```'
-    match = re.search(pattern, text, re.DOTALL | re.IGNORECASE)
+    match = _JSON_CODE_BLOCK_RE.search(text)
     return match.group(1).strip() if match else None
 
 
 def _extract_from_code_blocks(text: str) -> Optional[str]:
     """Extract JSON content from ``` code blocks."""
-    pattern = r'```\s*(.*?)\s*```'
-    match = re.search(pattern, text, re.DOTALL | re.IGNORECASE)
+    match = _CODE_BLOCK_RE.search(text)
     if match:
         content = match.group(1).strip()
         # Check if it looks like JSON (starts with { or [)
@@ -96,6 +90,12 @@ def _parse_json(json_string: str) -> Optional[Dict[str, Any]]:
     Returns:
         Parsed JSON dictionary if successful, None if parsing fails
     """
+    if orjson is not None:
+        try:
+            return orjson.loads(json_string)
+        except (orjson.JSONDecodeError, TypeError):
+            # Fall through: stdlib also accepts NaN/Infinity and big integers
+            pass
     try:
         return json.loads(json_string)
     except (json.JSONDecodeError, TypeError, ValueError):
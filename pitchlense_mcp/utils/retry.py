@@ -0,0 +1,106 @@
+"""
+Retry helpers for PitchLense MCP Package.
+
+Retries transient network/API failures (timeouts, connection resets, HTTP
+429/5xx) with exponential backoff and jitter. Permanent failures such as
+invalid requests or authentication errors are raised immediately.
+"""
+
+import asyncio
+import functools
+import inspect
+import random
+import time
+from typing import Any, Callable, Optional
+
+TRANSIENT_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+
+
+def _status_code(exc: BaseException) -> Optional[int]:
+    """Best-effort HTTP status code from SDK/HTTP client exceptions."""
+    for attr in ("code", "status_code"):
+        value = getattr(exc, attr, None)
+        if isinstance(value, int):
+            return value
+    response = getattr(exc, "response", None)
+    value = getattr(response, "status_code", None)
+    return value if isinstance(value, int) else None
+
+
+def is_transient_error(exc: BaseException) -> bool:
+    """
+    Return True if the exception looks like a transient failure worth retrying.
+
+    Args:
+        exc: Exception raised by an LLM/search call
+
+    Returns:
+        True for timeouts, connection errors and HTTP 408/429/5xx responses
+    """
+    if isinstance(exc, (TimeoutError, ConnectionError)):
+        return True
+
+    try:
+        import httpx
+        if isinstance(exc, httpx.TransportError):
+            return True
+    except ImportError:  # pragma: no cover
+        pass
+
+    try:
+        import requests
+        if isinstance(exc, (requests.ConnectionError, requests.Timeout)):
+            return True
+    except ImportError:  # pragma: no cover
+        pass
+
+    return _status_code(exc) in TRANSIENT_STATUS_CODES
+
+
+def _delay(attempt: int, backoff: float, jitter: float) -> float:
+    return backoff * (2 ** (attempt - 1)) + random.uniform(0, jitter)
+
+
+def retry(
+    max_attempts: int = 3,
+    backoff: float = 0.5,
+    jitter: float = 0.25,
+    retry_if: Callable[[BaseException], bool] = is_transient_error
+):
+    """
+    Decorator retrying a sync or async function on transient errors.
+
+    Args:
+        max_attempts: Total number of attempts (including the first call)
+        backoff: Base delay in seconds, doubled after each failed attempt
+        jitter: Maximum random seconds added to each delay
+        retry_if: Predicate deciding whether an exception is retryable
+
+    Returns:
+        Decorated function with the same signature
+    """
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                for attempt in range(1, max_attempts + 1):
+                    try:
+                        return await func(*args, **kwargs)
+                    except Exception as e:
+                        if attempt == max_attempts or not retry_if(e):
+                            raise
+                        await asyncio.sleep(_delay(attempt, backoff, jitter))
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            for attempt in range(1, max_attempts + 1):
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    if attempt == max_attempts or not retry_if(e):
+                        raise
+                    time.sleep(_delay(attempt, backoff, jitter))
+        return wrapper
+
+    return decorator
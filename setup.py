@@ -56,12 +56,17 @@ setup(
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
+            "pytest-xdist>=3.0.0",
             "flake8>=6.0.0",
             "mypy>=1.0.0",
             "pre-commit>=3.0.0",
             "isort>=5.12.0",
             "truffleHog3>=3.0.10",
         ],
+        "speedups": [
+            "orjson>=3.8.0",
+            "h2>=4.0.0",
+        ],
         "docs": [
             "sphinx>=6.0.0",
             "sphinx-rtd-theme>=1.2.0",
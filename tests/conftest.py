@@ -0,0 +1,13 @@
+"""
+Shared fixtures for the PitchLense MCP test suite.
+"""
+
+import pytest
+
+from pitchlense_mcp import GoogleContentModerationMCPTool
+
+
+@pytest.fixture(scope="session")
+def moderation_tool():
+    """Stateless moderation tool shared across tests."""
+    return GoogleContentModerationMCPTool()
@@ -4,14 +4,16 @@ Basic tests for PitchLense MCP Package.
 Tests core functionality and basic integration.
 """
 
+import asyncio
 import pytest
 import json
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 from pitchlense_mcp import (
     ComprehensiveRiskScanner,
     MarketRiskAnalyzer,
     GeminiLLM,
+    CachedLLM,
     RiskLevel,
     StartupData
 )
@@ -67,6 +69,15 @@ class TestGeminiLLM:
         for args, kwargs in mock_genai.Client.call_args_list:
             assert kwargs.get("api_key") == "test_key"
     
+    @patch('pitchlense_mcp.core.gemini_client.genai')
+    def test_gemini_llm_shares_client(self, mock_genai):
+        """Test all GeminiLLM analyzers share a single client."""
+        llm = GeminiLLM(api_key="test_key")
+        
+        assert mock_genai.Client.call_count == 1
+        assert llm.text_generator.client is llm.client
+        assert llm.document_analyzer.client is llm.client
+    
     @patch('pitchlense_mcp.core.gemini_client.genai')
     def test_gemini_llm_predict(self, mock_genai):
         """Test GeminiLLM predict method."""
@@ -82,6 +93,35 @@ class TestGeminiLLM:
         assert result["response"] == "Test response"
         assert result["usage"]["model"] == "gemini-2.5-flash"
         assert result["usage"]["type"] == "text_generation"
+    
+    @patch('pitchlense_mcp.core.gemini_client.genai')
+    def test_gemini_llm_apredict(self, mock_genai):
+        """Test GeminiLLM async predict uses the aio client."""
+        mock_client = Mock()
+        mock_response = Mock()
+        mock_response.text = "Async response"
+        mock_client.aio.models.generate_content = AsyncMock(return_value=mock_response)
+        mock_genai.Client.return_value = mock_client
+        
+        llm = GeminiLLM(api_key="test_key")
+        result = asyncio.run(llm.apredict("system", "user"))
+        
+        assert result["response"] == "Async response"
+        mock_client.aio.models.generate_content.assert_awaited_once()
+        mock_client.models.generate_content.assert_not_called()
+    
+    @patch('pitchlense_mcp.core.gemini_client.genai')
+    def test_gemini_llm_json_mode(self, mock_genai):
+        """Test response_mime_type is passed through to the generation config."""
+        mock_client = Mock()
+        mock_client.models.generate_content.return_value = Mock(text='{"ok": true}')
+        mock_genai.Client.return_value = mock_client
+        
+        llm = GeminiLLM(api_key="test_key")
+        llm.predict("system", "user", response_mime_type="application/json")
+        
+        config = mock_client.models.generate_content.call_args.kwargs["config"]
+        assert config.response_mime_type == "application/json"
 
 
 class TestMarketRiskAnalyzer:
@@ -96,6 +136,16 @@ class TestMarketRiskAnalyzer:
         assert "TAM Size Assessment" in analyzer.get_risk_indicators()
         assert "Industry Growth Rate" in analyzer.get_risk_indicators()
     
+    def test_market_risk_analyzer_aanalyze(self):
+        """Test async analysis matches the sync result."""
+        from pitchlense_mcp.core.mock_client import MockLLM
+        
+        analyzer = MarketRiskAnalyzer(MockLLM())
+        result = asyncio.run(analyzer.aanalyze("Test startup in the market"))
+        
+        assert result == analyzer.analyze("Test startup in the market")
+        assert result["category_score"] == 6
+    
     def test_market_risk_analyzer_prompt(self):
         """Test MarketRiskAnalyzer prompt generation."""
         mock_llm = Mock()
@@ -239,5 +289,189 @@ class TestIntegration:
         assert "confidence_score" in result
 
 
+class TestCachedLLM:
+    """Test CachedLLM response caching."""
+    
+    def test_cached_llm_reuses_response(self, tmp_path):
+        """Test repeat prompts are served from cache."""
+        inner = Mock()
+        inner.model = "test-model"
+        inner.predict.return_value = {"response": "ok", "usage": {"total_tokens": 10}}
+        
+        llm = CachedLLM(inner, cache_dir=str(tmp_path))
+        first = llm.predict(system_message="sys", user_message="hello", tool_name="Test")
+        second = llm.predict(system_message="sys", user_message="hello", tool_name="Test")
+        
+        assert first == second == {"response": "ok", "usage": {"total_tokens": 10}}
+        assert inner.predict.call_count == 1
+        
+        # A fresh instance reads the on-disk entry
+        reloaded = CachedLLM(inner, cache_dir=str(tmp_path))
+        assert reloaded.predict(system_message="sys", user_message="hello")["response"] == "ok"
+        assert inner.predict.call_count == 1
+        
+        llm.predict(system_message="sys", user_message="different")
+        assert inner.predict.call_count == 2
+    
+    def test_cached_llm_apredict_reuses_response(self, tmp_path):
+        """Test async predictions share the cache with predict()."""
+        inner = Mock()
+        inner.model = "test-model"
+        inner.apredict = AsyncMock(return_value={"response": "async ok", "usage": {}})
+        
+        llm = CachedLLM(inner, cache_dir=str(tmp_path))
+        first = asyncio.run(llm.apredict(system_message="sys", user_message="hello"))
+        second = llm.predict(system_message="sys", user_message="hello")
+        
+        assert first == second
+        inner.apredict.assert_awaited_once()
+        inner.predict.assert_not_called()
+    
+    def test_cached_llm_skips_empty_responses(self, tmp_path):
+        """Test empty responses are not cached."""
+        inner = Mock()
+        inner.model = "test-model"
+        inner.predict.return_value = {"response": "", "usage": {}}
+        
+        llm = CachedLLM(inner, cache_dir=str(tmp_path))
+        llm.predict(system_message="sys", user_message="hello")
+        llm.predict(system_message="sys", user_message="hello")
+        
+        assert inner.predict.call_count == 2
+
+
+class TestJsonExtractor:
+    """Test JSON extraction from LLM responses."""
+    
+    def test_repeat_extraction_returns_fresh_objects(self):
+        """Test repeated responses parse to equal but independent dicts."""
+        from pitchlense_mcp.utils.json_extractor import extract_json_from_response
+        
+        response = 'Analysis:\n```json\n{"category_score": 4, "indicators": []}\n```'
+        first = extract_json_from_response(response)
+        first["indicators"].append("mutated")
+        second = extract_json_from_response(response)
+        
+        assert second == {"category_score": 4, "indicators": []}
+        assert extract_json_from_response("no json here") is None
+
+
+class TestRetry:
+    """Test the transient-error retry decorator."""
+    
+    def test_retries_transient_errors_only(self):
+        """Test transient errors are retried and permanent ones raised at once."""
+        from pitchlense_mcp.utils.retry import retry
+        
+        flaky = Mock(side_effect=[ConnectionError("reset"), "ok"])
+        assert retry(backoff=0, jitter=0)(flaky)() == "ok"
+        assert flaky.call_count == 2
+        
+        broken = Mock(side_effect=ValueError("bad request"))
+        with pytest.raises(ValueError):
+            retry(backoff=0, jitter=0)(broken)()
+        assert broken.call_count == 1
+
+
+class TestConcurrencyLimit:
+    """Test the per-provider concurrency limit."""
+    
+    def test_bounds_coroutines_in_flight(self):
+        """Test no more than max_concurrent coroutines hold the limit at once."""
+        from pitchlense_mcp.utils.concurrency import ConcurrencyLimit
+        
+        limit = ConcurrencyLimit(2)
+        active, peak = 0, 0
+        
+        async def call():
+            nonlocal active, peak
+            async with limit:
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+        
+        async def main():
+            await asyncio.gather(*(call() for _ in range(6)))
+        
+        asyncio.run(main())
+        assert peak == 2
+        with limit:
+            pass
+    
+    def test_waiters_are_served_in_order_across_threads(self):
+        """Test a release wakes the longest waiter and cancelled waiters free their slot."""
+        import threading
+        from pitchlense_mcp.utils.concurrency import ConcurrencyLimit
+        
+        limit = ConcurrencyLimit(1)
+        order = []
+        
+        async def call(name):
+            async with limit:
+                order.append(name)
+                await asyncio.sleep(0.005)
+        
+        def blocking_call():
+            with limit:
+                order.append("thread")
+        
+        async def main():
+            limit.__enter__()
+            first = asyncio.ensure_future(call("first"))
+            cancelled = asyncio.ensure_future(call("cancelled"))
+            await asyncio.sleep(0.01)
+            thread = threading.Thread(target=blocking_call)
+            thread.start()
+            await asyncio.sleep(0.01)
+            last = asyncio.ensure_future(call("last"))
+            await asyncio.sleep(0.01)
+            cancelled.cancel()
+            # Released from another thread, as a worker thread would
+            threading.Thread(target=limit.__exit__, args=(None, None, None)).start()
+            await asyncio.gather(first, last, asyncio.to_thread(thread.join), return_exceptions=True)
+        
+        asyncio.run(main())
+        assert order == ["first", "thread", "last"]
+        assert limit._available == 1
+
+
+class TestSemanticCache:
+    """Test the embedding-similarity cache."""
+    
+    def test_hits_only_above_threshold(self):
+        """Test near-duplicate embeddings hit and dissimilar ones miss."""
+        from pitchlense_mcp.core.semantic_cache import SemanticCache
+        
+        cache = SemanticCache(threshold=0.95)
+        cache.put("Market Risk Analysis", [1.0, 0.0, 0.0], {"category_score": 6})
+        
+        assert cache.get("Market Risk Analysis", [0.99, 0.05, 0.0]) == {"category_score": 6}
+        assert cache.get("Market Risk Analysis", [0.0, 1.0, 0.0]) is None
+        assert cache.get("Team Risk Analysis", [1.0, 0.0, 0.0]) is None
+        
+        restored = SemanticCache.from_dict(json.loads(json.dumps(cache.to_dict())))
+        assert restored.get("Market Risk Analysis", [1.0, 0.0, 0.0]) == {"category_score": 6}
+
+
+class TestAnalysisRouter:
+    """Test the embedding-based analysis router."""
+    
+    def test_routes_only_close_prototypes(self):
+        """Test categories are templated only when near a not-applicable prototype."""
+        from pitchlense_mcp.core.router import AnalysisRouter
+        
+        vectors = {"idea stage, no revenue": [1.0, 0.0], "solo founder": [0.0, 1.0]}
+        router = AnalysisRouter(
+            vectors.__getitem__,
+            {"Exit Risk Analysis": ["idea stage, no revenue"], "Team Risk Analysis": ["solo founder"]},
+            threshold=0.9,
+        )
+        
+        routes = router.predict([0.98, 0.1], ["Exit Risk Analysis", "Team Risk Analysis", "Market Risk Analysis"])
+        assert routes == {"Exit Risk Analysis": "template", "Team Risk Analysis": "llm", "Market Risk Analysis": "llm"}
+        assert AnalysisRouter.template_result("Exit Risk Analysis")["routing"] == "template"
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
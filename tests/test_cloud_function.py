@@ -0,0 +1,212 @@
+"""
+Tests for the Cloud Function request pipeline (gcp_cloud_function.py).
+"""
+
+import asyncio
+import gzip
+import json
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+pytest.importorskip("functions_framework")
+
+import gcp_cloud_function as cloud_fn  # noqa: E402
+from pitchlense_mcp import MarketRiskMCPTool, ProductRiskMCPTool, TeamRiskMCPTool  # noqa: E402
+
+STARTUP_TEXT = "B2B SaaS for logistics with 40% MoM growth"
+RESPONSE = {"response": '<JSON>{"overall_risk_level": "low", "category_score": 3, "indicators": []}</JSON>'}
+
+
+def _llm(delay=0.0):
+    async def apredict(**kwargs):
+        await asyncio.sleep(delay)
+        return RESPONSE
+
+    llm = Mock()
+    llm.apredict = AsyncMock(side_effect=apredict)
+    return llm
+
+
+def _tool(tool_cls, llm):
+    tool = tool_cls()
+    tool.set_llm_client(llm)
+    return tool
+
+
+def test_exact_cache_local_hit_miss_and_expiry(tmp_path, monkeypatch):
+    monkeypatch.setenv("PITCHLENSE_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("MCP_EXACT_CACHE_L1_TTL", "1")
+    monkeypatch.setenv("MCP_EXACT_CACHE_TTL", "60")
+    monkeypatch.delenv("REDIS_URL", raising=False)
+    cache = cloud_fn._ExactAnalysisCache()
+    key = cache.text_key(STARTUP_TEXT, "mock")
+
+    cache.set_many(key, {"Market Risk": {"category_score": 3}, "Team Risk": {"error": "failed"}})
+
+    assert cache.get_many(key, ["Market Risk", "Team Risk", "Product Risk"]) == {"Market Risk": {"category_score": 3}}
+    # Memory only: nothing lands in the cache directory
+    assert not any(tmp_path.iterdir())
+    now = cloud_fn.time.monotonic()
+    monkeypatch.setattr(cloud_fn.time, "monotonic", lambda: now + 30)
+    assert cache.get_many(key, ["Market Risk"]) == {"Market Risk": {"category_score": 3}}
+    monkeypatch.setattr(cloud_fn.time, "monotonic", lambda: now + 61)
+    assert cache.get_many(key, ["Market Risk"]) == {}
+
+
+def test_concurrent_cold_calls_share_one_semantic_cache(monkeypatch):
+    monkeypatch.setattr(cloud_fn, "_semantic_cache", None)
+    monkeypatch.setenv("MCP_SEMANTIC_CACHE_GCS", "gs://bucket/semantic.json")
+    loads = []
+
+    def slow_read(uri):
+        loads.append(uri)
+        cloud_fn.time.sleep(0.05)
+        return {}
+
+    monkeypatch.setattr(cloud_fn, "_read_json_from_gcs", slow_read)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        caches = list(pool.map(lambda _: cloud_fn._get_semantic_cache(), range(4)))
+
+    assert len(loads) == 1
+    assert all(cache is caches[0] for cache in caches)
+
+
+def test_identical_concurrent_analyses_share_one_llm_call():
+    llm = _llm(delay=0.05)
+
+    async def run():
+        return await asyncio.gather(
+            cloud_fn._analyze_one(_tool(MarketRiskMCPTool, llm), "analyze_market_risks", STARTUP_TEXT),
+            cloud_fn._analyze_one(_tool(MarketRiskMCPTool, llm), "analyze_market_risks", STARTUP_TEXT),
+        )
+
+    first, second = asyncio.run(run())
+
+    assert llm.apredict.await_count == 1
+    assert first == second
+    assert first is not second
+    assert cloud_fn._inflight == {}
+
+
+def test_joiner_gets_error_when_owner_is_cancelled():
+    llm = _llm(delay=5)
+
+    async def run():
+        owner = asyncio.ensure_future(
+            cloud_fn._analyze_one(_tool(MarketRiskMCPTool, llm), "analyze_market_risks", STARTUP_TEXT)
+        )
+        await asyncio.sleep(0.01)
+        joiner = asyncio.ensure_future(
+            cloud_fn._analyze_one(_tool(MarketRiskMCPTool, llm), "analyze_market_risks", STARTUP_TEXT)
+        )
+        await asyncio.sleep(0.01)
+        owner.cancel()
+        with pytest.raises(RuntimeError, match="cancelled"):
+            await asyncio.wait_for(joiner, 1)
+
+    asyncio.run(run())
+    assert cloud_fn._inflight == {}
+
+
+def test_parallel_analyses_report_timeouts_and_keep_finished_results(monkeypatch):
+    monkeypatch.setenv("MCP_PER_ANALYSIS_TIMEOUT", "0.2")
+    monkeypatch.setenv("MCP_BATCH_ANALYSES", "0")
+    tools = {
+        "Market Risk": (_tool(MarketRiskMCPTool, _llm(delay=5)), "analyze_market_risks"),
+        "Team Risk": (_tool(TeamRiskMCPTool, _llm()), "analyze_team_risks"),
+    }
+
+    results, errors = asyncio.run(cloud_fn._arun_parallel_analyses(tools, STARTUP_TEXT, 0))
+
+    assert errors == {"Market Risk": "timeout"}
+    assert results["Team Risk"]["category_score"] == 3
+
+
+def test_batch_fallback_times_out_per_category(monkeypatch):
+    monkeypatch.setenv("MCP_PER_ANALYSIS_TIMEOUT", "0.2")
+    monkeypatch.delenv("MCP_BATCH_ANALYSES", raising=False)
+    tools = {
+        "Market Risk": (_tool(MarketRiskMCPTool, _llm(delay=5)), "analyze_market_risks"),
+        "Team Risk": (_tool(TeamRiskMCPTool, _llm()), "analyze_team_risks"),
+        "Product Risk": (_tool(ProductRiskMCPTool, _llm()), "analyze_product_risks"),
+    }
+    monkeypatch.setenv("MCP_MAX_STARTUP_CHARS", "1000")
+    # Too long for the fused call, so every category takes the per-analysis path
+    long_text = STARTUP_TEXT + " " + "x" * 7000
+
+    results, errors = asyncio.run(cloud_fn._arun_parallel_analyses(tools, long_text, 0))
+
+    assert errors == {"Market Risk": "timeout"}
+    assert results["Team Risk"]["category_score"] == 3
+    assert results["Product Risk"]["category_score"] == 3
+
+
+def test_extract_metadata_drops_non_string_values():
+    llm = Mock()
+    llm.apredict = AsyncMock(return_value={
+        "response": '<JSON>{"company_name": "Acme", "domain": 42, "area": ["x", "y"]}</JSON>'
+    })
+
+    metadata = asyncio.run(cloud_fn._extract_metadata(llm, STARTUP_TEXT))
+
+    assert metadata == {"company_name": "Acme"}
+
+
+def test_download_bytes_from_gcs_rejects_oversized_objects(monkeypatch):
+    blob = Mock(size=2048, generation=7)
+    blob.download_as_bytes.return_value = b"%PDF"
+    client = Mock()
+    client.bucket.return_value.blob.return_value = blob
+    monkeypatch.setattr(cloud_fn, "_get_gcs_client", lambda: client)
+    monkeypatch.setenv("MCP_MAX_UPLOAD_BYTES", "4096")
+
+    assert cloud_fn._download_bytes_from_gcs("gs://bucket/deck.pdf") == b"%PDF"
+    blob.download_as_bytes.assert_called_once_with(if_generation_match=7)
+
+    monkeypatch.setenv("MCP_MAX_UPLOAD_BYTES", "1024")
+    with pytest.raises(ValueError, match="limited to 1024 bytes"):
+        cloud_fn._download_bytes_from_gcs("gs://bucket/deck.pdf")
+    assert blob.download_as_bytes.call_count == 1
+
+
+def test_write_json_to_gcs_encodes_stdlib_fallback(monkeypatch):
+    monkeypatch.setenv("MCP_GCS_GZIP", "1")
+    blob = Mock()
+    client = Mock()
+    client.bucket.return_value.blob.return_value = blob
+    monkeypatch.setattr(cloud_fn, "_get_gcs_client", lambda: client)
+
+    cloud_fn._write_json_to_gcs("gs://bucket/out.json", {"n": 2 ** 70})
+
+    data = blob.upload_from_string.call_args[0][0]
+    assert json.loads(gzip.decompress(data)) == {"n": 2 ** 70}
+
+
+def test_write_json_to_gcs_gzips_without_orjson(monkeypatch):
+    blob = Mock()
+    client = Mock()
+    client.bucket.return_value.blob.return_value = blob
+    monkeypatch.setattr(cloud_fn, "_get_gcs_client", lambda: client)
+    monkeypatch.setattr(cloud_fn, "orjson", None)
+    monkeypatch.setenv("MCP_GCS_GZIP", "1")
+
+    cloud_fn._write_json_to_gcs("gs://bucket/out.json", {"name": "Acme"})
+
+    blob.open.assert_not_called()
+    data = blob.upload_from_string.call_args[0][0]
+    assert json.loads(gzip.decompress(data)) == {"name": "Acme"}
+
+
+def test_write_json_to_gcs_is_uncompressed_by_default(monkeypatch):
+    blob = Mock(content_encoding=None)
+    client = Mock()
+    client.bucket.return_value.blob.return_value = blob
+    monkeypatch.setattr(cloud_fn, "_get_gcs_client", lambda: client)
+    monkeypatch.delenv("MCP_GCS_GZIP", raising=False)
+
+    cloud_fn._write_json_to_gcs("gs://bucket/out.json", {"name": "Acme"})
+
+    assert blob.content_encoding is None
+    assert json.loads(blob.upload_from_string.call_args[0][0]) == {"name": "Acme"}
@@ -2,8 +2,10 @@
 Tests for MCP tools and analyzers using mocks (Gemini, SerpAPI, Perplexity).
 """
 
+import asyncio
 import os
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
@@ -20,6 +22,11 @@ from pitchlense_mcp import (
     PeerBenchmarkMCPTool,
     SerpNewsMCPTool,
     PerplexityMCPTool,
+    GoogleContentModerationMCPTool,
+    LinkedInAnalyzerMCPTool,
+    BatchedRiskAnalyzer,
+    LVAnalysisAnalyzer,
+    UploadExtractor,
 )
 
 
@@ -31,8 +38,7 @@ from pitchlense_mcp import (
 @patch.dict(os.environ, {"SERPAPI_API_KEY": "test_key"}, clear=True)
 @patch("pitchlense_mcp.tools.serp_news.GoogleSearch")
 def test_serp_news_success(mock_search):
-    mock_instance = Mock()
-    mock_instance.get_dict.return_value = {
+    news = {
         "news_results": [
             {
                 "title": "Headline",
@@ -44,7 +50,7 @@ def test_serp_news_success(mock_search):
             }
         ]
     }
-    mock_search.return_value = mock_instance
+    mock_search.return_value = SimpleNamespace(get_dict=lambda: news)
 
     tool = SerpNewsMCPTool()
     res = tool.fetch_google_news("openai funding", num_results=5)
@@ -98,6 +104,26 @@ def test_perplexity_success(mock_post):
     assert {"url": "https://example.com/a", "title": None} in out["sources"]
 
 
+@patch.dict(os.environ, {"PERPLEXITY_API_KEY": "ppx_key"}, clear=True)
+@patch("httpx.AsyncClient.post", new_callable=AsyncMock)
+def test_perplexity_async_success(mock_post):
+    mock_post.return_value = SimpleNamespace(
+        raise_for_status=lambda: None,
+        json=lambda: {"choices": [{"message": {"content": "Async answer"}}]},
+    )
+
+    tool = PerplexityMCPTool()
+    out = asyncio.run(tool.asearch_perplexity("What is RAG?"))
+    assert out["answer"] == "Async answer"
+    assert mock_post.await_count == 1
+
+
+@patch("httpx.AsyncClient.head", new_callable=AsyncMock, side_effect=OSError("unreachable"))
+def test_perplexity_prewarm_ignores_errors(mock_head):
+    asyncio.run(PerplexityMCPTool().aprewarm())
+    assert mock_head.await_count == 1
+
+
 @patch.dict(os.environ, {}, clear=True)
 def test_perplexity_missing_key():
     tool = PerplexityMCPTool()
@@ -106,6 +132,63 @@ def test_perplexity_missing_key():
     assert "PERPLEXITY_API_KEY" in res["error"]
 
 
+# -----------------------------
+# Content moderation tests
+# -----------------------------
+
+
+@pytest.mark.parametrize(
+    "text, expected_required, expected_categories, expected_profanity",
+    [
+        ("B2B SaaS for logistics with 40% MoM growth", False, [], False),
+        ("Explicitly toxic comments, f*** this", True, ["explicit", "toxic"], True),
+        ("This contains hate speech and violence.", True, ["hate speech", "violence"], False),
+        ("This contains f*** words.", True, [], True),
+        ("", False, [], None),
+        (None, False, [], None),
+    ],
+)
+def test_content_moderation(moderation_tool, text, expected_required, expected_categories, expected_profanity):
+    res = moderation_tool.moderate_content(text)
+
+    assert res["safe"] is not expected_required
+    assert res["moderation_required"] is expected_required
+    assert res["categories"] == expected_categories
+    assert res.get("profanity_detected") is expected_profanity
+
+
+def _raise_boom(*args, **kwargs):
+    raise RuntimeError("boom")
+
+
+@pytest.mark.parametrize(
+    "tool_cls, target, method_name, arg, expected_error",
+    [
+        (
+            GoogleContentModerationMCPTool,
+            "pitchlense_mcp.tools.content_moderation.GoogleContentModerationMCPTool._analyze_with_google_moderation",
+            "moderate_content",
+            "Test content",
+            "Content moderation error: boom",
+        ),
+        (
+            LinkedInAnalyzerMCPTool,
+            "pitchlense_mcp.tools.linkedin_analyzer.GeminiDocumentAnalyzer",
+            "analyze_linkedin_profile",
+            "profile.pdf",
+            "Failed to initialize Gemini document analyzer: boom",
+        ),
+    ],
+)
+def test_tool_error_paths(monkeypatch, tool_cls, target, method_name, arg, expected_error):
+    monkeypatch.setattr(target, _raise_boom)
+
+    res = getattr(tool_cls(), method_name)(arg)
+
+    assert res["success"] is False
+    assert res["error"] == expected_error
+
+
 # -----------------------------
 # Analyzer MCP tools tests
 # -----------------------------
@@ -128,13 +211,14 @@ def test_perplexity_missing_key():
 def test_analyzer_mcp_tools_return(tool_cls, method_name):
     tool = tool_cls()
     # Bypass LLM by stubbing analyze
-    tool.analyzer.analyze = Mock(return_value={
+    stubbed = {
         "category_name": getattr(tool.analyzer, "category_name", "Category"),
         "overall_risk_level": "medium",
         "category_score": 5,
         "indicators": [],
         "summary": "Stubbed"
-    })
+    }
+    tool.analyzer.analyze = lambda *args, **kwargs: stubbed
 
     fn = getattr(tool, method_name)
     out = fn("Some organized startup text")
@@ -142,11 +226,54 @@ def test_analyzer_mcp_tools_return(tool_cls, method_name):
     assert isinstance(out.get("category_score"), int)
 
 
+def test_mcp_tool_aanalyze_validates_and_awaits_analyzer():
+    tool = MarketRiskMCPTool()
+    tool.analyzer.aanalyze = AsyncMock(return_value={"overall_risk_level": "low", "category_score": 3})
+
+    out = asyncio.run(tool.aanalyze("Some organized startup text"))
+    assert out["category_score"] == 3
+    assert asyncio.run(tool.aanalyze("   "))["success"] is False
+    tool.analyzer.aanalyze.assert_awaited_once()
+
+
+def test_mcp_tool_build_prompt_is_deterministic():
+    market, team = MarketRiskMCPTool(), TeamRiskMCPTool()
+
+    assert market.build_prompt("Startup text") == market.build_prompt("Startup text")
+    assert market.build_prompt("Startup text") != team.build_prompt("Startup text")
+    assert "Startup text" in market.build_prompt("Startup text")
+
+
+def test_lv_analysis_aanalyze_runs_research_concurrently():
+    ppx = Mock()
+    ppx.asearch_perplexity = AsyncMock(side_effect=lambda q: {"answer": f"A:{q}", "sources": [{"url": "https://x"}]})
+    llm = Mock()
+    llm.apredict = AsyncMock(return_value={"response": "Business note"})
+
+    analyzer = LVAnalysisAnalyzer(llm_client=llm, perplexity_tool=ppx)
+    out = asyncio.run(analyzer.aanalyze("Startup text"))
+
+    assert ppx.asearch_perplexity.await_count == len(LVAnalysisAnalyzer.RESEARCH_QUERIES)
+    llm.apredict.assert_awaited_once()
+    llm.predict.assert_not_called()
+    assert out["sources"] == [{"url": "https://x"}]
+
+
+def test_upload_extractor_sends_in_memory_data_as_bytes():
+    llm = Mock()
+    llm.document_analyzer.predict_from_bytes.return_value = {"text": "Deck content"}
+
+    doc = UploadExtractor(llm).extract_document({"filename": "deck.pdf", "data": b"%PDF-1.7"})
+
+    assert doc["content"] == "Deck content"
+    assert llm.document_analyzer.predict_from_bytes.call_args[0][0] == b"%PDF-1.7"
+    llm.document_analyzer.predict.assert_not_called()
+
+
 def test_peer_benchmark_mcp_tool():
     tool = PeerBenchmarkMCPTool()
     # Mock the raw LLM response that would come from the prompt
-    tool.analyzer.llm_client = Mock()
-    tool.analyzer.llm_client.predict = Mock(return_value={
+    response = {
         "response": '''<JSON>
 {
   "category_name": "Peer Benchmarking",
@@ -158,7 +285,8 @@ def test_peer_benchmark_mcp_tool():
   "summary": "OK"
 }
 </JSON>'''
-    })
+    }
+    tool.analyzer.llm_client = SimpleNamespace(predict=lambda *args, **kwargs: response)
     res = tool.analyze_peer_benchmark("Startup info text")
     assert res["category_name"] == "Peer Benchmarking"
     assert "category_score" in res
@@ -166,3 +294,62 @@ def test_peer_benchmark_mcp_tool():
     assert "indicators" in res
 
 
+def test_batched_risk_analyzer_single_call_with_fallback():
+    market_tool = MarketRiskMCPTool()
+    team_tool = TeamRiskMCPTool()
+    llm = Mock()
+    # Batched response only covers the market category
+    llm.predict = Mock(return_value={
+        "response": '''<JSON>
+{
+  "market_risk": {
+    "overall_risk_level": "low",
+    "category_score": 3,
+    "indicators": [],
+    "summary": "Batched"
+  }
+}
+</JSON>'''
+    })
+    team_tool.analyzer.analyze = Mock(return_value={"overall_risk_level": "high", "category_score": 8})
+
+    batched = BatchedRiskAnalyzer(llm, {"Market Risk": market_tool.analyzer, "Team Risk": team_tool.analyzer})
+    res = batched.analyze("Startup info text")
+
+    assert llm.predict.call_count == 1
+    assert res["Market Risk"]["summary"] == "Batched"
+    assert res["Market Risk"]["category_name"] == "Market Risks"
+    assert res["Team Risk"]["category_score"] == 8
+    team_tool.analyzer.analyze.assert_called_once_with("Startup info text")
+
+
+def test_batched_risk_analyzer_batches_deck_sized_input():
+    market_tool = MarketRiskMCPTool()
+    team_tool = TeamRiskMCPTool()
+    market_tool.analyzer.analyze = Mock()
+    team_tool.analyzer.analyze = Mock()
+    llm = Mock()
+    category = '{"overall_risk_level": "low", "category_score": 3, "indicators": []}'
+    llm.predict = Mock(return_value={"response": f'{{"market_risk": {category}, "team_risk": {category}}}'})
+    # Synthesized text from several extracted documents
+    deck_text = "Slide text with metrics, team bios and market sizing. " * 1500
+
+    res = BatchedRiskAnalyzer(llm, {"Market Risk": market_tool.analyzer, "Team Risk": team_tool.analyzer}).analyze(deck_text)
+
+    assert len(deck_text) > 50000
+    assert llm.predict.call_count == 1
+    assert res["Team Risk"]["category_score"] == 3
+    market_tool.analyzer.analyze.assert_not_called()
+    team_tool.analyzer.analyze.assert_not_called()
+
+
+def test_batched_risk_analyzer_long_input_uses_per_tool_path():
+    tool = MarketRiskMCPTool()
+    tool.analyzer.analyze = Mock(return_value={"overall_risk_level": "medium", "category_score": 5})
+    llm = Mock()
+
+    batched = BatchedRiskAnalyzer(llm, {"Market Risk": tool.analyzer}, max_input_chars=10)
+    res = batched.analyze("x" * 11)
+
+    llm.predict.assert_not_called()
+    assert res["Market Risk"]["category_score"] == 5